@@ -6,10 +6,12 @@ Arrays are fundamental data structures with contiguous memory allocation,
 providing O(1) access time and efficient cache performance.
 """
 
+from bitset import Bitset, is_dense
+
 # ============================================================================
 # PROBLEM 1: TWO SUM
 # ============================================================================
-def two_sum(nums, target):
+def two_sum(nums, target, backend=dict):
     """
     Problem: Find two numbers in array that add up to target.
     
@@ -18,8 +20,11 @@ def two_sum(nums, target):
     Space Complexity: O(n)
     
     Example: nums=[2,7,11,15], target=9 → [0,1] (2+7=9)
+    
+    backend: mapping type for value -> index (dict, or IntHashMap from
+    map_problems.py for compact int keys).
     """
-    num_map = {}  # value -> index
+    num_map = backend()  # value -> index
     
     for i, num in enumerate(nums):
         complement = target - num
@@ -88,14 +93,28 @@ def max_profit_multiple_transactions(prices):
 # ============================================================================
 # PROBLEM 3: CONTAINS DUPLICATE
 # ============================================================================
-def contains_duplicate(nums):
+def contains_duplicate(nums, backend=set):
     """
     Problem: Check if array contains any duplicates.
     
-    Approach: Hash set for O(n) detection
+    Approach: Hash set for O(n) detection, returning at the first repeat
     Time Complexity: O(n)
     Space Complexity: O(n)
+    
+    backend: set (default), or Bitset to trade speed for memory on ints
+    that are dense in their min..max range: one bit per value in the range
+    instead of a boxed int per element. The Bitset is built in one pass and
+    compared by popcount, so it never exits early and is roughly 1.5-2x
+    slower than the set; non-dense or non-int input falls back to the set.
     """
+    if backend is Bitset:
+        dense, low, high = is_dense(nums)
+        if dense:
+            try:
+                return Bitset.from_iterable(nums, low, high).popcount() < len(nums)
+            except TypeError:
+                pass  # Non-int values such as floats: use the set
+    
     seen = set()
     for num in nums:
         if num in seen:
@@ -103,10 +122,29 @@ def contains_duplicate(nums):
         seen.add(num)
     return False
 
-def contains_nearby_duplicate(nums, k):
+def contains_nearby_duplicate(nums, k, backend=dict):
     """
     Variant: Check if duplicates are within k distance.
-    """
+    
+    backend: dict (default) maps value -> last index. Bitset instead keeps
+    the last k values as a sliding window of bits over a dense int range;
+    it uses less memory for large k but runs up to about 2x slower, so
+    only pick it when memory is the constraint.
+    """
+    if backend is Bitset:
+        dense, low, high = is_dense(nums)
+        if dense:
+            try:
+                window = Bitset(high - low + 1, low)
+                for i, num in enumerate(nums):
+                    if i > k:
+                        window.discard(nums[i - k - 1])
+                    if not window.add(num):
+                        return True
+                return False
+            except TypeError:
+                pass  # Non-int values such as floats: use the dict
+    
     num_indices = {}
     for i, num in enumerate(nums):
         if num in num_indices and i - num_indices[num] <= k:
@@ -572,6 +610,8 @@ def test_array_problems():
     target1 = 9
     print(f"Array: {nums1}, Target: {target1}")
     print(f"Indices: {two_sum(nums1, target1)}")
+    from map_problems import IntHashMap
+    print(f"Indices (IntHashMap backend): {two_sum(nums1, target1, backend=IntHashMap)}")
     
     # Test 2: Best Time to Buy and Sell Stock
     print("\n2. BEST TIME TO BUY AND SELL STOCK")
@@ -585,6 +625,8 @@ def test_array_problems():
     test_arrays = [[1, 2, 3, 1], [1, 2, 3, 4]]
     for arr in test_arrays:
         print(f"Array: {arr} → Has duplicate: {contains_duplicate(arr)}")
+    print(f"Bitset backend: {contains_duplicate([1, 2, 3, 1], backend=Bitset)}, "
+          f"nearby (k=3): {contains_nearby_duplicate([1, 2, 3, 1], 3, backend=Bitset)}")
     
     # Test 4: Maximum Subarray
     print("\n4. MAXIMUM SUBARRAY (KADANE'S ALGORITHM)")
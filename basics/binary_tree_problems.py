@@ -22,19 +22,29 @@ def inorder_traversal(root):
     """
     Problem: Traverse binary tree in inorder (left, root, right).
     
-    Approach: Recursive and iterative solutions
+    Approach: Explicit stack of (node, visited) pairs. A node is pushed
+    back as visited between its right and left subtrees, so it is emitted
+    after everything on its left (inorder_iterative below walks the left
+    spine instead)
     Time Complexity: O(n)
     Space Complexity: O(h) where h is height
     """
     result = []
+    stack = [(root, False)]
     
-    def inorder_recursive(node):
-        if node:
-            inorder_recursive(node.left)
+    while stack:
+        node, visited = stack.pop()
+        if not node:
+            continue
+        
+        if visited:
             result.append(node.val)
-            inorder_recursive(node.right)
+        else:
+            # Pushed in reverse: left subtree, node, right subtree
+            stack.append((node.right, False))
+            stack.append((node, True))
+            stack.append((node.left, False))
     
-    inorder_recursive(root)
     return result
 
 def inorder_iterative(root):
@@ -61,28 +71,40 @@ def inorder_iterative(root):
 def preorder_traversal(root):
     """Preorder traversal: root, left, right."""
     result = []
+    stack = [root]
     
-    def preorder(node):
+    while stack:
+        node = stack.pop()
         if node:
             result.append(node.val)
-            preorder(node.left)
-            preorder(node.right)
+            # Right is pushed first so the left subtree is visited first
+            stack.append(node.right)
+            stack.append(node.left)
     
-    preorder(root)
     return result
 
 def postorder_traversal(root):
     """Postorder traversal: left, right, root."""
-    result = []
+    return [node.val for node in _postorder_nodes(root)]
+
+def _postorder_nodes(root):
+    """
+    Nodes in postorder without recursion: a root, right, left preorder
+    walk visits them in exactly the reverse order.
+    """
+    order = []
+    stack = [root] if root else []
     
-    def postorder(node):
-        if node:
-            postorder(node.left)
-            postorder(node.right)
-            result.append(node.val)
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
     
-    postorder(root)
-    return result
+    order.reverse()
+    return order
 
 # ============================================================================
 # PROBLEM 2: LEVEL ORDER TRAVERSAL
@@ -161,16 +183,25 @@ def max_depth(root):
     """
     Problem: Find maximum depth of binary tree.
     
-    Approach: Recursive DFS
+    Approach: DFS with an explicit stack of (node, depth)
     Time Complexity: O(n)
     Space Complexity: O(h)
     
     Example: [3,9,20,null,null,15,7] → 3
     """
-    if not root:
-        return 0
+    deepest = 0
+    stack = [(root, 1)] if root else []
+    
+    while stack:
+        node, depth = stack.pop()
+        deepest = max(deepest, depth)
+        
+        if node.left:
+            stack.append((node.left, depth + 1))
+        if node.right:
+            stack.append((node.right, depth + 1))
     
-    return 1 + max(max_depth(root.left), max_depth(root.right))
+    return deepest
 
 def max_depth_iterative(root):
     """Iterative approach using level order traversal."""
@@ -198,32 +229,31 @@ def is_valid_bst(root):
     """
     Problem: Check if binary tree is valid BST.
     
-    Approach: Inorder traversal should be sorted
+    Approach: Every node must lie strictly inside the (min, max) bounds
+    inherited from its ancestors; bounds travel with nodes on a stack
     Time Complexity: O(n)
     Space Complexity: O(h)
     
     Example: [2,1,3] → True, [5,1,4,null,null,3,6] → False
     """
-    def validate(node, min_val, max_val):
+    stack = [(root, float('-inf'), float('inf'))]
+    
+    while stack:
+        node, min_val, max_val = stack.pop()
         if not node:
-            return True
+            continue
         
         if node.val <= min_val or node.val >= max_val:
             return False
         
-        return (validate(node.left, min_val, node.val) and
-                validate(node.right, node.val, max_val))
+        stack.append((node.left, min_val, node.val))
+        stack.append((node.right, node.val, max_val))
     
-    return validate(root, float('-inf'), float('inf'))
+    return True
 
 def is_valid_bst_inorder(root):
     """Alternative: Check if inorder traversal is sorted."""
-    def inorder(node):
-        if not node:
-            return []
-        return inorder(node.left) + [node.val] + inorder(node.right)
-    
-    values = inorder(root)
+    values = inorder_iterative(root)
     return all(values[i] < values[i + 1] for i in range(len(values) - 1))
 
 # ============================================================================
@@ -233,25 +263,32 @@ def is_same_tree(p, q):
     """
     Problem: Check if two binary trees are identical.
     
-    Approach: Recursive comparison
+    Approach: Compare corresponding node pairs taken from a stack
     Time Complexity: O(min(m, n))
     Space Complexity: O(min(m, n))
     """
-    # Both are None
-    if not p and not q:
-        return True
-    
-    # One is None, other is not
-    if not p or not q:
-        return False
+    stack = [(p, q)]
     
-    # Values are different
-    if p.val != q.val:
-        return False
+    while stack:
+        p, q = stack.pop()
+        
+        # Both are None
+        if not p and not q:
+            continue
+        
+        # One is None, other is not
+        if not p or not q:
+            return False
+        
+        # Values are different
+        if p.val != q.val:
+            return False
+        
+        # Check subtrees pairwise
+        stack.append((p.right, q.right))
+        stack.append((p.left, q.left))
     
-    # Recursively check subtrees
-    return (is_same_tree(p.left, q.left) and 
-            is_same_tree(p.right, q.right))
+    return True
 
 # ============================================================================
 # PROBLEM 6: SYMMETRIC TREE
@@ -260,24 +297,30 @@ def is_symmetric(root):
     """
     Problem: Check if binary tree is symmetric (mirror of itself).
     
-    Approach: Recursive helper function
+    Approach: Stack of node pairs that must mirror each other
     Time Complexity: O(n)
     Space Complexity: O(h)
     
     Example: [1,2,2,3,4,4,3] → True
     """
-    def is_mirror(left, right):
+    if not root:
+        return True
+    
+    stack = [(root.left, root.right)]
+    
+    while stack:
+        left, right = stack.pop()
+        
         if not left and not right:
-            return True
+            continue
         
-        if not left or not right:
+        if not left or not right or left.val != right.val:
             return False
         
-        return (left.val == right.val and
-                is_mirror(left.left, right.right) and
-                is_mirror(left.right, right.left))
+        stack.append((left.right, right.left))
+        stack.append((left.left, right.right))
     
-    return not root or is_mirror(root.left, root.right)
+    return True
 
 # ============================================================================
 # PROBLEM 7: BINARY TREE PATHS
@@ -286,7 +329,8 @@ def binary_tree_paths(root):
     """
     Problem: Find all root-to-leaf paths.
     
-    Approach: DFS with path tracking
+    Approach: DFS with path tracking; each node is pushed twice, once to
+    extend the shared path and once (after its children) to backtrack
     Time Complexity: O(n)
     Space Complexity: O(n * h)
     
@@ -296,25 +340,30 @@ def binary_tree_paths(root):
         return []
     
     paths = []
+    current_path = []
+    stack = [(root, False)]
     
-    def dfs(node, current_path):
-        if not node:
-            return
+    while stack:
+        node, leaving = stack.pop()
+        
+        # Backtrack
+        if leaving:
+            current_path.pop()
+            continue
         
         current_path.append(str(node.val))
+        stack.append((node, True))
         
         # If leaf node, add path to result
         if not node.left and not node.right:
             paths.append("->".join(current_path))
         else:
-            # Continue exploring
-            dfs(node.left, current_path)
-            dfs(node.right, current_path)
-        
-        # Backtrack
-        current_path.pop()
+            # Continue exploring (right pushed first so left paths come first)
+            if node.right:
+                stack.append((node.right, False))
+            if node.left:
+                stack.append((node.left, False))
     
-    dfs(root, [])
     return paths
 
 # ============================================================================
@@ -324,22 +373,37 @@ def lowest_common_ancestor(root, p, q):
     """
     Problem: Find lowest common ancestor of two nodes.
     
-    Approach: Recursive search
+    Approach: Record parent pointers with a DFS until both nodes are
+    found, collect p's ancestors, then climb from q to the first shared one
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
-    if not root or root == p or root == q:
-        return root
+    if not root:
+        return None
+    
+    parent = {root: None}
+    stack = [root]
     
-    left = lowest_common_ancestor(root.left, p, q)
-    right = lowest_common_ancestor(root.right, p, q)
+    while stack and (p not in parent or q not in parent):
+        node = stack.pop()
+        for child in (node.left, node.right):
+            if child:
+                parent[child] = node
+                stack.append(child)
     
-    # If both left and right are not None, root is LCA
-    if left and right:
-        return root
+    # If only one node is in the tree, it is the answer (None if neither)
+    if p not in parent or q not in parent:
+        return p if p in parent else q if q in parent else None
     
-    # Return the non-None child
-    return left or right
+    ancestors = set()
+    while p:
+        ancestors.add(p)
+        p = parent[p]
+    
+    while q not in ancestors:
+        q = parent[q]
+    
+    return q
 
 def lca_bst(root, p, q):
     """
@@ -362,29 +426,25 @@ def diameter_of_binary_tree(root):
     """
     Problem: Find diameter (longest path between any two nodes).
     
-    Approach: Calculate height while tracking max diameter
+    Approach: Calculate heights bottom-up (postorder) while tracking max
+    diameter
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     
     Example: [1,2,3,4,5] → 3 (path 4->2->1->3 or 5->2->1->3)
     """
     max_diameter = 0
+    height = {None: 0}
     
-    def height(node):
-        nonlocal max_diameter
-        
-        if not node:
-            return 0
-        
-        left_height = height(node.left)
-        right_height = height(node.right)
+    for node in _postorder_nodes(root):
+        left_height = height[node.left]
+        right_height = height[node.right]
         
         # Update diameter through current node
         max_diameter = max(max_diameter, left_height + right_height)
         
-        return 1 + max(left_height, right_height)
+        height[node] = 1 + max(left_height, right_height)
     
-    height(root)
     return max_diameter
 
 # ============================================================================
@@ -396,30 +456,25 @@ def max_path_sum(root):
     
     Approach: Post-order traversal with path sum calculation
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     
     Example: [1,2,3] → 6 (2->1->3)
     """
     max_sum = float('-inf')
+    gain = {None: 0}
     
-    def max_gain(node):
-        nonlocal max_sum
-        
-        if not node:
-            return 0
-        
+    for node in _postorder_nodes(root):
         # Max gain from left and right subtrees (ignore negative gains)
-        left_gain = max(max_gain(node.left), 0)
-        right_gain = max(max_gain(node.right), 0)
+        left_gain = max(gain[node.left], 0)
+        right_gain = max(gain[node.right], 0)
         
         # Path sum through current node
         current_max = node.val + left_gain + right_gain
         max_sum = max(max_sum, current_max)
         
-        # Return max gain including current node
-        return node.val + max(left_gain, right_gain)
+        # Max gain including current node
+        gain[node] = node.val + max(left_gain, right_gain)
     
-    max_gain(root)
     return max_sum
 
 # ============================================================================
@@ -429,7 +484,10 @@ def build_tree_preorder_inorder(preorder, inorder):
     """
     Problem: Build binary tree from preorder and inorder traversals.
     
-    Approach: Use preorder for root, inorder for left/right subtrees
+    Approach: Walk preorder keeping the current left spine on a stack.
+    Each value is the left child of the stack top, unless the top matches
+    the next inorder value: then pop every finished node and attach the
+    value as right child of the last one popped
     Time Complexity: O(n)
     Space Complexity: O(n)
     """
@@ -438,30 +496,53 @@ def build_tree_preorder_inorder(preorder, inorder):
     
     # First element in preorder is root
     root = TreeNode(preorder[0])
+    stack = [root]
+    i = 0  # Next inorder position
     
-    # Find root position in inorder
-    mid = inorder.index(preorder[0])
-    
-    # Build left and right subtrees
-    root.left = build_tree_preorder_inorder(preorder[1:mid+1], inorder[:mid])
-    root.right = build_tree_preorder_inorder(preorder[mid+1:], inorder[mid+1:])
+    for val in preorder[1:]:
+        node = TreeNode(val)
+        parent = None
+        
+        # Nodes whose inorder turn has come have complete left subtrees
+        while stack and stack[-1].val == inorder[i]:
+            parent = stack.pop()
+            i += 1
+        
+        if parent:
+            parent.right = node
+        else:
+            stack[-1].left = node
+        stack.append(node)
     
     return root
 
 def build_tree_inorder_postorder(inorder, postorder):
-    """Build tree from inorder and postorder traversals."""
+    """
+    Build tree from inorder and postorder traversals.
+    Mirror image of the preorder version: read both lists from the end,
+    building right spines first.
+    """
     if not inorder or not postorder:
         return None
     
     # Last element in postorder is root
     root = TreeNode(postorder[-1])
+    stack = [root]
+    i = len(inorder) - 1  # Next inorder position, walking backwards
     
-    # Find root position in inorder
-    mid = inorder.index(postorder[-1])
-    
-    # Build left and right subtrees
-    root.left = build_tree_inorder_postorder(inorder[:mid], postorder[:mid])
-    root.right = build_tree_inorder_postorder(inorder[mid+1:], postorder[mid:-1])
+    for val in reversed(postorder[:-1]):
+        node = TreeNode(val)
+        parent = None
+        
+        while stack and stack[-1].val == inorder[i]:
+            parent = stack.pop()
+            i -= 1
+        
+        if parent:
+            parent.left = node
+        else:
+            stack[-1].right = node
+        stack.append(node)
     
     return root
 
@@ -476,32 +557,41 @@ def serialize(root):
     Time Complexity: O(n)
     Space Complexity: O(n)
     """
-    def preorder(node):
+    vals = []
+    stack = [root]
+    
+    while stack:
+        node = stack.pop()
         if not node:
             vals.append("null")
         else:
             vals.append(str(node.val))
-            preorder(node.left)
-            preorder(node.right)
+            stack.append(node.right)
+            stack.append(node.left)
     
-    vals = []
-    preorder(root)
     return ",".join(vals)
 
 def deserialize(data):
-    """Deserialize string back to binary tree."""
-    def build():
+    """
+    Deserialize string back to binary tree.
+    The stack holds the child slots still to be filled, in preorder.
+    """
+    vals = iter(data.split(","))
+    dummy = TreeNode()
+    stack = [(dummy, "left")]
+    
+    while stack:
+        parent, side = stack.pop()
         val = next(vals)
         if val == "null":
-            return None
+            continue
         
         node = TreeNode(int(val))
-        node.left = build()
-        node.right = build()
-        return node
+        setattr(parent, side, node)
+        stack.append((node, "right"))
+        stack.append((node, "left"))
     
-    vals = iter(data.split(","))
-    return build()
+    return dummy.left
 
 # ============================================================================
 # PROBLEM 13: FLATTEN BINARY TREE TO LINKED LIST
@@ -578,29 +668,29 @@ def kth_smallest(root, k):
     """
     Problem: Find kth smallest element in BST.
     
-    Approach: Inorder traversal (gives sorted order)
+    Approach: Inorder traversal (gives sorted order), stopping at the kth node
     Time Complexity: O(h + k)
     Space Complexity: O(h)
     """
-    def inorder(node):
-        if not node:
-            return None
-        
-        # Search in left subtree
-        left_result = inorder(node.left)
-        if left_result is not None:
-            return left_result
+    stack = []
+    current = root
+    
+    while stack or current:
+        # Go to leftmost node
+        while current:
+            stack.append(current)
+            current = current.left
         
         # Process current node
-        nonlocal k
+        current = stack.pop()
         k -= 1
         if k == 0:
-            return node.val
+            return current.val
         
         # Search in right subtree
-        return inorder(node.right)
+        current = current.right
     
-    return inorder(root)
+    return None
 
 # ============================================================================
 # PROBLEM 16: CONVERT BST TO GREATER TREE
@@ -617,17 +707,21 @@ def convert_bst(root):
              → [30,36,21,36,35,26,15,null,null,null,33,null,null,null,8]
     """
     total = 0
+    stack = []
+    current = root
     
-    def reverse_inorder(node):
-        nonlocal total
+    while stack or current:
+        # Go to rightmost node
+        while current:
+            stack.append(current)
+            current = current.right
         
-        if node:
-            reverse_inorder(node.right)
-            total += node.val
-            node.val = total
-            reverse_inorder(node.left)
+        current = stack.pop()
+        total += current.val
+        current.val = total
+        
+        current = current.left
     
-    reverse_inorder(root)
     return root
 
 # ============================================================================
@@ -711,6 +805,17 @@ def test_binary_tree_problems():
     print(f"Serialized: {serialized}")
     deserialized = deserialize(serialized)
     print(f"Deserialized same as original: {is_same_tree(root, deserialized)}")
+    
+    # Test 11: Skewed tree deeper than the recursion limit
+    print("\n11. DEGENERATE (LINKED-LIST SHAPED) TREE")
+    deep = TreeNode(0)
+    node = deep
+    for val in range(1, 10**5):
+        node.right = TreeNode(val)
+        node = node.right
+    print(f"Max depth: {max_depth(deep)}, diameter: {diameter_of_binary_tree(deep)}")
+    print(f"Valid BST: {is_valid_bst(deep)}, 50000th smallest: {kth_smallest(deep, 50000)}")
+    print(f"Round-trips through serialize: {is_same_tree(deep, deserialize(serialize(deep)))}")
 
 if __name__ == "__main__":
     test_binary_tree_problems()
\ No newline at end of file
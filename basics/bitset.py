@@ -0,0 +1,366 @@
+"""
+BITSET AND ROARING BITMAP
+=========================
+Sets of integers stored as bits instead of boxed int objects.
+
+- Bitset: one bit per value in a fixed range [offset, offset + size),
+  packed into a bytearray. Ideal when the values are dense in a known
+  range: a million-value range costs 125 KB.
+- RoaringBitmap: splits values by their high bits into 2**16-wide chunks.
+  Sparse chunks hold a sorted array('H') of low bits, dense chunks a
+  Bitset, so memory follows the data instead of the full range.
+
+Bulk operations (union, intersection, popcount) convert the bytearray to
+a Python int once and let the interpreter work a machine word at a time.
+
+Time Complexities:
+- add / discard / contains: O(1) for Bitset; O(log c) for sparse
+  roaring chunks of c values, O(1) for dense ones
+- union / intersection / popcount: O(range / 64) word operations
+- iteration: O(range / 8 + n), yielding values in ascending order
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+
+class Bitset:
+    """
+    Fixed-range set of ints backed by a bytearray (bit i of byte i // 8
+    stands for offset + i).
+    """
+
+    __slots__ = ("bits", "offset", "size")
+
+    def __init__(self, size, offset=0):
+        self.bits = bytearray((size + 7) >> 3)
+        self.offset = offset
+        self.size = size
+
+    @classmethod
+    def from_iterable(cls, values, low=None, high=None):
+        """Bitset covering [low, high] (defaults: min and max of values)."""
+        values = list(values)
+        if low is None:
+            low = min(values, default=0)
+        if high is None:
+            high = max(values, default=-1)
+        bitset = cls(high - low + 1, low)
+        bits = bitset.bits
+        for value in values:
+            i = value - low
+            bits[i >> 3] |= 1 << (i & 7)
+        return bitset
+
+    def _position(self, value):
+        i = value - self.offset
+        if not 0 <= i < self.size:
+            raise ValueError(f"{value} outside bitset range "
+                             f"[{self.offset}, {self.offset + self.size})")
+        return i
+
+    def add(self, value):
+        """Set value's bit. Returns True if it was not already present."""
+        i = self._position(value)
+        byte = self.bits[i >> 3]
+        mask = 1 << (i & 7)
+        if byte & mask:
+            return False
+        self.bits[i >> 3] = byte | mask
+        return True
+
+    def discard(self, value):
+        """Clear value's bit. Returns True if it was present."""
+        i = value - self.offset
+        if not 0 <= i < self.size:
+            return False
+        byte = self.bits[i >> 3]
+        mask = 1 << (i & 7)
+        if not byte & mask:
+            return False
+        self.bits[i >> 3] = byte & ~mask
+        return True
+
+    def __contains__(self, value):
+        i = value - self.offset
+        return 0 <= i < self.size and (self.bits[i >> 3] >> (i & 7)) & 1 == 1
+
+    def popcount(self):
+        """Number of values in the set."""
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    __len__ = popcount
+
+    def __iter__(self):
+        base = self.offset
+        for byte in self.bits:
+            while byte:
+                low = byte & -byte
+                yield base + low.bit_length() - 1
+                byte ^= low
+            base += 8
+
+    def _check_compatible(self, other):
+        if self.offset != other.offset or self.size != other.size:
+            raise ValueError("bitsets must cover the same range")
+
+    def _combine(self, other, word_op):
+        self._check_compatible(other)
+        result = Bitset(self.size, self.offset)
+        combined = word_op(int.from_bytes(self.bits, "little"),
+                           int.from_bytes(other.bits, "little"))
+        result.bits[:] = combined.to_bytes(len(self.bits), "little")
+        return result
+
+    def union(self, other):
+        return self._combine(other, int.__or__)
+
+    def intersection(self, other):
+        return self._combine(other, int.__and__)
+
+    __or__ = union
+    __and__ = intersection
+
+    def __repr__(self):
+        return f"Bitset({list(self)!r})"
+
+
+# Values per roaring chunk, and the largest sparse (array) container
+_CHUNK_BITS = 16
+_CHUNK_SIZE = 1 << _CHUNK_BITS
+_ARRAY_LIMIT = 4096
+# A bitmap chunk turns back into an array only at half that size, so
+# add/discard around the limit doesn't rebuild containers every time
+_DEMOTE_LIMIT = 2048
+
+
+class RoaringBitmap:
+    """
+    Roaring-style compressed bitmap. Values are grouped by value >> 16;
+    each group is a sorted array('H') of low 16 bits while it holds at
+    most 4096 values (8 KB, the size of a full bitmap chunk) and becomes
+    a 65536-bit Bitset beyond that. Bitset chunks keep their value count
+    in self.counts and turn back into arrays once it drops to 2048.
+    """
+
+    __slots__ = ("chunks", "counts")
+
+    def __init__(self, values=()):
+        self.chunks = {}
+        self.counts = {}  # high -> number of values, for Bitset chunks
+        for value in values:
+            self.add(value)
+
+    def add(self, value):
+        """Add value. Returns True if it was not already present."""
+        high, low = value >> _CHUNK_BITS, value & (_CHUNK_SIZE - 1)
+        container = self.chunks.get(high)
+        if container is None:
+            self.chunks[high] = array("H", [low])
+            return True
+        if isinstance(container, Bitset):
+            if not container.add(low):
+                return False
+            self.counts[high] += 1
+            return True
+        i = bisect_left(container, low)
+        if i < len(container) and container[i] == low:
+            return False
+        container.insert(i, low)
+        if len(container) > _ARRAY_LIMIT:
+            self.chunks[high] = Bitset.from_iterable(container, 0, _CHUNK_SIZE - 1)
+            self.counts[high] = len(container)
+        return True
+
+    def discard(self, value):
+        high, low = value >> _CHUNK_BITS, value & (_CHUNK_SIZE - 1)
+        container = self.chunks.get(high)
+        if container is None:
+            return
+        if isinstance(container, Bitset):
+            if container.discard(low):
+                self.counts[high] -= 1
+                if self.counts[high] <= _DEMOTE_LIMIT:
+                    self._store(high, array("H", container))
+            return
+        i = bisect_left(container, low)
+        if i < len(container) and container[i] == low:
+            del container[i]
+            if not container:
+                del self.chunks[high]
+
+    def __contains__(self, value):
+        container = self.chunks.get(value >> _CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & (_CHUNK_SIZE - 1)
+        if isinstance(container, Bitset):
+            return low in container
+        i = bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def popcount(self):
+        return sum(self.counts[high] if isinstance(container, Bitset) else len(container)
+                   for high, container in self.chunks.items())
+
+    __len__ = popcount
+
+    def __iter__(self):
+        for high in sorted(self.chunks):
+            base = high << _CHUNK_BITS
+            for low in self.chunks[high]:
+                yield base + low
+
+    def _store(self, high, container):
+        """Put a container in its cheapest form (or drop it if empty)."""
+        self.counts.pop(high, None)
+        count = len(container)
+        if count == 0:
+            self.chunks.pop(high, None)
+            return
+        if isinstance(container, Bitset):
+            if count <= _ARRAY_LIMIT:
+                container = array("H", container)
+        elif count > _ARRAY_LIMIT:
+            container = Bitset.from_iterable(container, 0, _CHUNK_SIZE - 1)
+        if isinstance(container, Bitset):
+            self.counts[high] = count
+        self.chunks[high] = container
+
+    @staticmethod
+    def _as_bitset(container):
+        if isinstance(container, Bitset):
+            return container
+        return Bitset.from_iterable(container, 0, _CHUNK_SIZE - 1)
+
+    def union(self, other):
+        result = RoaringBitmap()
+        for high in self.chunks.keys() | other.chunks.keys():
+            a, b = self.chunks.get(high), other.chunks.get(high)
+            if a is None or b is None:
+                container = a if b is None else b
+                container = container.union(container) if isinstance(container, Bitset) else array("H", container)
+            elif isinstance(a, Bitset) or isinstance(b, Bitset):
+                container = self._as_bitset(a) | self._as_bitset(b)
+            else:
+                container = array("H", sorted(set(a).union(b)))
+            result._store(high, container)
+        return result
+
+    def intersection(self, other):
+        result = RoaringBitmap()
+        for high in self.chunks.keys() & other.chunks.keys():
+            a, b = self.chunks[high], other.chunks[high]
+            if isinstance(a, Bitset) and isinstance(b, Bitset):
+                container = a & b
+            elif isinstance(a, Bitset) or isinstance(b, Bitset):
+                dense, sparse = (a, b) if isinstance(a, Bitset) else (b, a)
+                container = array("H", (low for low in sparse if low in dense))
+            else:
+                container = array("H", sorted(set(a).intersection(b)))
+            result._store(high, container)
+        return result
+
+    __or__ = union
+    __and__ = intersection
+
+    def memory_bytes(self):
+        """Approximate payload bytes across containers."""
+        return sum(len(c.bits) if isinstance(c, Bitset) else 2 * len(c)
+                   for c in self.chunks.values())
+
+    def __repr__(self):
+        return f"RoaringBitmap({list(self)!r})"
+
+
+def is_dense(values, factor=32):
+    """
+    True when a Bitset over min..max would take at most a few bytes per
+    value: the range is at most `factor` times the number of values.
+    Returns (dense, low, high) so callers can size the Bitset.
+    
+    Only sized sequences qualify (min/max would consume an iterator), and
+    values whose min/max don't support integer arithmetic, such as strs,
+    report not dense. Elements are not type-checked one by one: building
+    the Bitset raises TypeError on a stray float, and callers fall back to
+    their set/dict path then.
+    """
+    if not isinstance(values, Sequence) or not values:
+        return False, 0, -1
+    try:
+        low, high = min(values), max(values)
+        span = high - low + 1
+    except TypeError:
+        return False, 0, -1
+    if type(low) is not int or type(high) is not int:
+        return False, 0, -1
+    return span <= factor * len(values), low, high
+
+
+def benchmark_bitsets(n=200000):
+    """
+    Memory and time for n ints: set vs Bitset vs RoaringBitmap, on a dense
+    range (values in [0, 2n)) and a sparse one (values spread over 2**28,
+    too wide for a flat Bitset but a few dozen values per roaring chunk).
+    """
+    import random
+    import sys
+    import time
+
+    rng = random.Random(9)
+    datasets = [("dense", [rng.randrange(2 * n) for _ in range(n)]),
+                ("sparse", [rng.randrange(2**28) for _ in range(n)])]
+
+    def size_of(structure):
+        if isinstance(structure, set):
+            # Table plus the boxed ints the set keeps alive
+            return sys.getsizeof(structure) + sum(sys.getsizeof(v) for v in structure)
+        if isinstance(structure, Bitset):
+            return sys.getsizeof(structure.bits)
+        return sys.getsizeof(structure.chunks) + sum(
+            sys.getsizeof(c.bits if isinstance(c, Bitset) else c)
+            for c in structure.chunks.values())
+
+    print(f"{'data':<8}{'structure':<15}{'bytes/value':>12}{'build ms':>10}{'lookup ms':>11}")
+    for label, values in datasets:
+        builders = [("set", set)]
+        if is_dense(values)[0]:
+            builders.append(("Bitset", Bitset.from_iterable))
+        builders.append(("RoaringBitmap", RoaringBitmap))
+        for name, build in builders:
+            start = time.perf_counter()
+            structure = build(values)
+            build_ms = (time.perf_counter() - start) * 1e3
+            start = time.perf_counter()
+            for value in values:
+                value in structure
+            lookup_ms = (time.perf_counter() - start) * 1e3
+            print(f"{label:<8}{name:<15}{size_of(structure) / n:>12.1f}{build_ms:>10.1f}{lookup_ms:>11.1f}")
+
+
+# Test the bitset implementations
+if __name__ == "__main__":
+    print("=== BITSET DEMONSTRATION ===")
+
+    print("\n1. Bitset:")
+    evens = Bitset(20)
+    for value in range(0, 20, 2):
+        evens.add(value)
+    threes = Bitset.from_iterable(range(0, 20, 3), 0, 19)
+    print(f"Evens: {list(evens)}")
+    print(f"Union with multiples of 3: {list(evens | threes)}")
+    print(f"Intersection: {list(evens & threes)}, popcount={len(evens & threes)}")
+    print(f"7 in evens: {7 in evens}, add(4) new? {evens.add(4)}")
+
+    print("\n2. RoaringBitmap:")
+    roaring = RoaringBitmap([5, 70000, 2**33, 6, 5])
+    other = RoaringBitmap(range(0, 10))
+    print(f"{roaring}, len={len(roaring)}")
+    print(f"Union: {list(roaring | other)}")
+    print(f"Intersection: {list(roaring & other)}")
+    dense_chunk = RoaringBitmap(range(0, 20000, 2))
+    print(f"10000 values in one chunk -> container: {type(dense_chunk.chunks[0]).__name__}")
+
+    print("\n3. Benchmark:")
+    benchmark_bitsets()
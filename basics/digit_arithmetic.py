@@ -0,0 +1,397 @@
+"""
+DIGIT-SEQUENCE ARITHMETIC WITH CHUNKED LIMBS
+============================================
+Big-number arithmetic for numbers given as digit lists, digit strings or
+linked lists of digits (add_two_numbers, add_binary, plus_one style).
+
+Instead of working one digit at a time, digits are packed into limbs:
+- decimal numbers use base 10**9 (9 digits per limb)
+- binary numbers use base 2**30 (30 bits per limb)
+
+Limbs are stored least significant first in array.array("q"); a limb
+product is below 2**63, so schoolbook products never overflow a limb
+pair. Zero is the empty array, and results never carry leading zero
+limbs.
+
+Time Complexities (n, m = number of limbs):
+- add / subtract / compare: O(n + m)
+- increment: O(1) amortised
+- multiply: O(n * m) schoolbook, O(n^1.585) Karatsuba above the threshold
+- string / digit list / linked list conversion: O(digits)
+"""
+
+from array import array
+
+DECIMAL_BASE = 10**9
+BINARY_BASE = 2**30
+
+# radix -> (limb base, digits per limb)
+_LIMB_FORMATS = {10: (DECIMAL_BASE, 9), 2: (BINARY_BASE, 30)}
+
+# Below this many limbs (in the shorter operand) Karatsuba's extra
+# additions cost more than they save
+KARATSUBA_THRESHOLD = 48
+
+
+def _trim(limbs):
+    """Drop leading (most significant) zero limbs in place."""
+    while limbs and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+# ============================================================================
+# CONVERTERS
+# ============================================================================
+def from_string(text, radix=10):
+    """
+    Parse a decimal (radix=10) or binary (radix=2) digit string into limbs.
+    Digits are read in limb-sized slices from the right, so the cost is
+    linear (unlike int(text) for very long strings).
+    """
+    base, width = _LIMB_FORMATS[radix]
+    text = text.strip()
+    if not text or not all(ch in "0123456789"[:radix] for ch in text):
+        raise ValueError(f"invalid base-{radix} digit string: {text[:20]!r}")
+    limbs = array("q")
+    for end in range(len(text), 0, -width):
+        limbs.append(int(text[max(0, end - width):end], radix))
+    return _trim(limbs)
+
+
+def to_string(limbs, radix=10):
+    """Format limbs as a decimal or binary digit string."""
+    if not limbs:
+        return "0"
+    _, width = _LIMB_FORMATS[radix]
+    spec = f"0{width}{'d' if radix == 10 else 'b'}"
+    parts = [format(limbs[-1], "d" if radix == 10 else "b")]
+    parts.extend(format(limbs[i], spec) for i in range(len(limbs) - 2, -1, -1))
+    return "".join(parts)
+
+
+def from_digits(digits):
+    """Digit list, most significant first (plus_one input), to limbs."""
+    return from_string("".join(map(str, digits)))
+
+
+def to_digits(limbs):
+    """Limbs to a digit list, most significant first."""
+    return [ord(ch) - 48 for ch in to_string(limbs)]
+
+
+def from_linked_list(head):
+    """
+    Linked list of decimal digits, least significant first (the
+    add_two_numbers layout), to limbs. Nine digits are folded per limb.
+    """
+    limbs = array("q")
+    limb = 0
+    scale = 1
+    while head:
+        limb += head.val * scale
+        scale *= 10
+        if scale == DECIMAL_BASE:
+            limbs.append(limb)
+            limb = 0
+            scale = 1
+        head = head.next
+    if scale != 1:
+        limbs.append(limb)
+    return _trim(limbs)
+
+
+def to_linked_list(limbs, node_cls):
+    """
+    Limbs to a linked list of digits, least significant first. node_cls is
+    the node type to build, called as node_cls(val) with a `next`
+    attribute (e.g. ListNode from linked_list_problems.py).
+    """
+    if not limbs:
+        return node_cls(0)
+    dummy = tail = node_cls(0)
+    last = len(limbs) - 1
+    for index, limb in enumerate(limbs):
+        for _ in range(9):
+            tail.next = tail = node_cls(limb % 10)
+            limb //= 10
+            # The top limb stops at its highest non-zero digit
+            if index == last and limb == 0:
+                break
+    return dummy.next
+
+
+# ============================================================================
+# ARITHMETIC
+# ============================================================================
+def compare(a, b):
+    """Return -1, 0 or 1 as a < b, a == b or a > b."""
+    if len(a) != len(b):
+        return -1 if len(a) < len(b) else 1
+    for i in range(len(a) - 1, -1, -1):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+def add(a, b, base=DECIMAL_BASE):
+    """Return a + b."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = array("q", a)
+    carry = 0
+    for i in range(len(b)):
+        total = result[i] + b[i] + carry
+        if total >= base:
+            result[i] = total - base
+            carry = 1
+        else:
+            result[i] = total
+            carry = 0
+    i = len(b)
+    while carry:
+        if i == len(result):
+            result.append(carry)
+            break
+        total = result[i] + 1
+        if total == base:
+            result[i] = 0
+        else:
+            result[i] = total
+            carry = 0
+        i += 1
+    return result
+
+
+def subtract(a, b, base=DECIMAL_BASE):
+    """Return a - b. Raises ValueError if b > a (limbs are unsigned)."""
+    if compare(a, b) < 0:
+        raise ValueError("subtract would go negative")
+    result = array("q", a)
+    borrow = 0
+    for i in range(len(b)):
+        diff = result[i] - b[i] - borrow
+        if diff < 0:
+            result[i] = diff + base
+            borrow = 1
+        else:
+            result[i] = diff
+            borrow = 0
+    i = len(b)
+    while borrow:
+        if result[i]:
+            result[i] -= 1
+            borrow = 0
+        else:
+            result[i] = base - 1
+        i += 1
+    return _trim(result)
+
+
+def increment(limbs, amount=1, base=DECIMAL_BASE):
+    """
+    Add a non-negative int to limbs in place and return them. The carry
+    usually stops at the lowest limb, so repeated increments are O(1)
+    amortised rather than touching every digit.
+    """
+    carry = amount
+    i = 0
+    while carry:
+        if i == len(limbs):
+            limbs.append(carry % base)
+            carry //= base
+        else:
+            carry, limbs[i] = divmod(limbs[i] + carry, base)
+        i += 1
+    return limbs
+
+
+def _schoolbook(a, b):
+    """
+    Product of two limb sequences as unnormalised coefficients: each
+    output position collects raw limb products, carried later in one pass.
+    """
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b, i):
+                result[j] += x * y
+    return result
+
+
+def _karatsuba(a, b, threshold):
+    """
+    Karatsuba on coefficient lists: the split halves are multiplied as
+    polynomials in the base, so no carries are needed until the end.
+    """
+    if min(len(a), len(b)) < threshold:
+        return _schoolbook(a, b) if a and b else []
+    half = max(len(a), len(b)) // 2
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+
+    low = _karatsuba(a0, b0, threshold)
+    high = _karatsuba(a1, b1, threshold)
+    a_sum = [x + y for x, y in zip(a0, a1)] + a0[len(a1):] + a1[len(a0):]
+    b_sum = [x + y for x, y in zip(b0, b1)] + b0[len(b1):] + b1[len(b0):]
+    middle = _karatsuba(a_sum, b_sum, threshold)
+
+    result = [0] * (len(a) + len(b) - 1)
+    for i, value in enumerate(low):
+        result[i] += value
+        middle[i] -= value
+    for i, value in enumerate(high):
+        result[i + 2 * half] += value
+        middle[i] -= value
+    for i, value in enumerate(middle):
+        if value:
+            result[i + half] += value
+    return result
+
+
+def multiply(a, b, base=DECIMAL_BASE, threshold=KARATSUBA_THRESHOLD):
+    """
+    Return a * b: schoolbook for short operands, Karatsuba once both have
+    at least `threshold` limbs. Carries are propagated once at the end.
+    """
+    if not a or not b:
+        return array("q")
+    coefficients = _karatsuba(list(a), list(b), threshold)
+    result = array("q")
+    carry = 0
+    for value in coefficients:
+        carry, limb = divmod(value + carry, base)
+        result.append(limb)
+    while carry:
+        carry, limb = divmod(carry, base)
+        result.append(limb)
+    return _trim(result)
+
+
+# ============================================================================
+# DROP-IN VERSIONS OF THE DIGIT-AT-A-TIME PROBLEMS
+# ============================================================================
+def add_two_numbers_chunked(l1, l2, node_cls=None):
+    """
+    add_two_numbers (linked_list_problems.py) on 9-digit limbs.
+    node_cls defaults to the type of the input nodes.
+    """
+    if node_cls is None:
+        node_cls = type(l1 if l1 is not None else l2)
+    return to_linked_list(add(from_linked_list(l1), from_linked_list(l2)), node_cls)
+
+
+def add_binary(a, b):
+    """add_binary (leetcode_problems/add_binary.py) on 30-bit limbs."""
+    return to_string(add(from_string(a, 2), from_string(b, 2), BINARY_BASE), 2)
+
+
+def plus_one(digits):
+    """plus_one (leetcode_problems/plus_one.py) on 9-digit limbs."""
+    return to_digits(increment(from_digits(digits)))
+
+
+def benchmark_digit_arithmetic(digits=100000, multiply_digits=20000):
+    """
+    Digit-at-a-time vs limb arithmetic on large numbers:
+    - add: add_two_numbers over linked lists vs add() on limbs
+    - increment: one plus_one-style pass per +1 vs in-place increment()
+    - multiply: schoolbook vs Karatsuba limbs (and Python int for reference)
+    """
+    import random
+    import time
+    from linked_list_problems import ListNode, add_two_numbers
+
+    rng = random.Random(11)
+    text_a = str(rng.randrange(1, 10)) + "".join(rng.choice("0123456789") for _ in range(digits - 1))
+    text_b = str(rng.randrange(1, 10)) + "".join(rng.choice("0123456789") for _ in range(digits - 1))
+
+    def timed(fn):
+        start = time.perf_counter()
+        result = fn()
+        return result, (time.perf_counter() - start) * 1e3
+
+    limbs_a, parse_ms = timed(lambda: from_string(text_a))
+    limbs_b = from_string(text_b)
+    list_a = to_linked_list(limbs_a, ListNode)
+    list_b = to_linked_list(limbs_b, ListNode)
+
+    print(f"{digits}-digit operands (ms); parsing one string into limbs: {parse_ms:.1f}")
+    digit_sum, digit_ms = timed(lambda: add_two_numbers(list_a, list_b))
+    limb_sum, limb_ms = timed(lambda: add(limbs_a, limbs_b))
+    assert from_linked_list(digit_sum) == limb_sum
+    print(f"{'add':<22}{'digit-at-a-time':>18}{digit_ms:>10.1f}{'limbs':>10}{limb_ms:>10.1f}")
+
+    # A checksum service bumping a counter: each plus_one call returns a
+    # fresh digit list, while increment() updates the limbs in place
+    bumps = 200
+    digit_list = [int(ch) for ch in text_a]
+
+    def digit_plus_one():
+        current = digit_list
+        for _ in range(bumps):
+            current = current[:]
+            i = len(current) - 1
+            while i >= 0 and current[i] == 9:
+                current[i] = 0
+                i -= 1
+            if i < 0:
+                current.insert(0, 1)
+            else:
+                current[i] += 1
+        return current
+
+    limbs = from_digits(digit_list)
+
+    def limb_plus_one():
+        for _ in range(bumps):
+            increment(limbs)
+
+    expected, digit_ms = timed(digit_plus_one)
+    _, limb_ms = timed(limb_plus_one)
+    assert expected == to_digits(limbs)
+    print(f"{f'{bumps} x plus_one':<22}{'digit-at-a-time':>18}{digit_ms:>10.1f}{'limbs':>10}{limb_ms:>10.1f}")
+
+    small_a = from_string(text_a[:multiply_digits])
+    small_b = from_string(text_b[:multiply_digits])
+    school, school_ms = timed(lambda: multiply(small_a, small_b, threshold=10**9))
+    karatsuba, karatsuba_ms = timed(lambda: multiply(small_a, small_b))
+    assert school == karatsuba
+    print(f"{f'multiply {multiply_digits}':<22}{'schoolbook':>18}{school_ms:>10.1f}{'karatsuba':>10}{karatsuba_ms:>10.1f}")
+
+    # Python ints for reference (values built from limbs, not parsed,
+    # since int() on long strings is quadratic and capped by default)
+    to_int = lambda limbs: sum(limb * DECIMAL_BASE**i for i, limb in enumerate(limbs))
+    int_a, int_b = to_int(small_a), to_int(small_b)
+    product, int_ms = timed(lambda: int_a * int_b)
+    assert product == to_int(karatsuba)
+    print(f"{'':<22}{'Python int':>18}{int_ms:>10.1f}")
+
+
+# Test the digit arithmetic functions
+if __name__ == "__main__":
+    print("=== DIGIT-SEQUENCE ARITHMETIC ===")
+
+    print("\n1. Converters:")
+    limbs = from_string("12345678901234567890")
+    print(f"Limbs (least significant first): {list(limbs)} -> {to_string(limbs)}")
+    print(f"Binary 1011 -> limbs {list(from_string('1011', 2))}")
+
+    print("\n2. Arithmetic:")
+    a = from_string("999999999999999999")
+    b = from_string("1")
+    print(f"999999999999999999 + 1 = {to_string(add(a, b))}")
+    print(f"10^18 - 999999999999999999 = {to_string(subtract(add(a, b), a))}")
+    print(f"123456789 * 987654321 = {to_string(multiply(from_string('123456789'), from_string('987654321')))}")
+    print(f"increment(99, 5) = {to_string(increment(from_string('99'), 5))}")
+
+    print("\n3. Drop-in problem versions:")
+    from linked_list_problems import ListNode, print_list
+    l1 = ListNode(2, ListNode(4, ListNode(3)))
+    l2 = ListNode(5, ListNode(6, ListNode(4)))
+    print(f"add_two_numbers_chunked: {print_list(add_two_numbers_chunked(l1, l2))}")
+    print(f"add_binary('11', '1') = {add_binary('11', '1')}")
+    print(f"plus_one([9, 9]) = {plus_one([9, 9])}")
+
+    print("\n4. Benchmark:")
+    benchmark_digit_arithmetic()
@@ -17,6 +17,9 @@ Time Complexities:
 - Deletion: O(1) at head, O(n) at specific position
 """
 
+import random
+import threading
+
 class ListNode:
     """
     A single node in the linked list.
@@ -329,6 +332,13 @@ class LinkedList:
         
         print("List reversed successfully")
     
+    def sort(self):
+        """
+        Sort the list in place by relinking nodes - O(n log n), O(1) extra.
+        Uses the bottom-up natural merge sort in sort_nodes.
+        """
+        self.head = sort_nodes(self.head)
+    
     def get_middle(self):
         """
         Find the middle element using slow and fast pointer technique.
@@ -372,6 +382,868 @@ class LinkedList:
         return False
 
 
+class SlottedNode:
+    """
+    Linked list node with __slots__: no per-instance __dict__, so each node
+    costs only the object header plus two references.
+    """
+    
+    __slots__ = ("data", "next")
+    
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+
+class FastLinkedList:
+    """
+    Production singly linked list: slotted nodes, head and tail pointers and
+    a cached size. Mutators are silent and return values instead of printing.
+    
+    Time Complexities:
+    - append / appendleft / popleft / len: O(1)
+    - extend: O(k) for k new items
+    - pop (last) / access by index / remove: O(n)
+    """
+    
+    __slots__ = ("head", "tail", "_size")
+    
+    def __init__(self, iterable=None):
+        self.head = None
+        self.tail = None
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
+    
+    def __len__(self):
+        return self._size
+    
+    def __bool__(self):
+        return self.head is not None
+    
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+    
+    def __repr__(self):
+        return f"FastLinkedList([{', '.join(map(repr, self))}])"
+    
+    def append(self, data):
+        """Insert at the end in O(1) using the tail pointer."""
+        node = SlottedNode(data)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self._size += 1
+    
+    def appendleft(self, data):
+        """Insert at the beginning in O(1)."""
+        self.head = SlottedNode(data, self.head)
+        if self.tail is None:
+            self.tail = self.head
+        self._size += 1
+    
+    def extend(self, iterable):
+        """
+        Append every item of iterable. The chain is built with local
+        variables and spliced onto the tail once, so the loop does no
+        attribute writes on the list itself.
+        """
+        dummy = tail = SlottedNode(None)
+        count = 0
+        for data in iterable:
+            tail.next = tail = SlottedNode(data)
+            count += 1
+        if not count:
+            return
+        if self.tail is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = tail
+        self._size += count
+    
+    def popleft(self):
+        """Remove and return the first item - O(1). Raises IndexError if empty."""
+        node = self.head
+        if node is None:
+            raise IndexError("pop from empty list")
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        self._size -= 1
+        return node.data
+    
+    def pop(self):
+        """
+        Remove and return the last item. A singly linked list still has to
+        find the second-last node, so this is O(n).
+        """
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        if self.head is self.tail:
+            return self.popleft()
+        current = self.head
+        while current.next is not self.tail:
+            current = current.next
+        data = self.tail.data
+        current.next = None
+        self.tail = current
+        self._size -= 1
+        return data
+    
+    def remove(self, value):
+        """Remove the first occurrence of value. Raises ValueError if absent."""
+        previous = None
+        current = self.head
+        while current is not None:
+            if current.data == value:
+                if previous is None:
+                    self.head = current.next
+                else:
+                    previous.next = current.next
+                if current is self.tail:
+                    self.tail = previous
+                self._size -= 1
+                return
+            previous = current
+            current = current.next
+        raise ValueError(f"{value!r} not in list")
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        if index == self._size - 1:
+            return self.tail.data
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current.data
+    
+    def reverse(self):
+        """Reverse the list in place - O(n)."""
+        previous = None
+        current = self.tail = self.head
+        while current is not None:
+            current.next, previous, current = previous, current, current.next
+        self.head = previous
+    
+    def sort(self):
+        """Stable in-place sort by relinking nodes (see sort_nodes)."""
+        self.head = sort_nodes(self.head)
+        node = self.head
+        while node is not None and node.next is not None:
+            node = node.next
+        self.tail = node
+    
+    def clear(self):
+        self.head = self.tail = None
+        self._size = 0
+
+
+def benchmark_linked_lists(n=20000):
+    """
+    Compare LinkedList against FastLinkedList:
+    - memory per node (tracemalloc, payload ints excluded via shared values)
+    - throughput of appends, prepends, len() and full iteration
+    
+    LinkedList prints inside every mutator; stdout is redirected so the
+    timings measure the data structure rather than the terminal.
+    """
+    import contextlib
+    import io
+    import time
+    import tracemalloc
+    
+    def memory_per_node(build):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        keep = build()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        del keep
+        return total / n
+    
+    def build_original():
+        ll = LinkedList()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(n):
+                ll.prepend(0)
+        return ll
+    
+    def build_fast():
+        ll = FastLinkedList()
+        for _ in range(n):
+            ll.appendleft(0)
+        return ll
+    
+    print(f"Memory per node: LinkedList {memory_per_node(build_original):.0f} B, "
+          f"FastLinkedList {memory_per_node(build_fast):.0f} B")
+    
+    def time_it(fn):
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    
+    # append on LinkedList is O(n) each, so use a smaller n for it
+    small = min(n, 2000)
+    
+    def original_append():
+        ll = LinkedList()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(small):
+                ll.append(i)
+    
+    def fast_append():
+        ll = FastLinkedList()
+        for i in range(small):
+            ll.append(i)
+    
+    def original_prepend():
+        ll = LinkedList()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(n):
+                ll.prepend(i)
+    
+    def fast_prepend():
+        ll = FastLinkedList()
+        for i in range(n):
+            ll.appendleft(i)
+    
+    original = build_original()
+    fast = FastLinkedList(range(n))
+    
+    def original_iterate():
+        current = original.head
+        total = 0
+        while current is not None:
+            total += current.data
+            current = current.next
+    
+    def fast_iterate():
+        total = 0
+        for value in fast:
+            total += value
+    
+    rows = [
+        (f"append x{small}", original_append, fast_append),
+        (f"prepend x{n}", original_prepend, fast_prepend),
+        (f"extend x{n}", None, lambda: FastLinkedList().extend(range(n))),
+        (f"iterate {n}", original_iterate, fast_iterate),
+    ]
+    print(f"{'operation':<16}{'LinkedList ms':>15}{'FastLinkedList ms':>19}")
+    for label, original_fn, fast_fn in rows:
+        original_ms = f"{time_it(original_fn) * 1e3:.2f}" if original_fn else "-"
+        print(f"{label:<16}{original_ms:>15}{time_it(fast_fn) * 1e3:>19.2f}")
+
+
+class _Chunk:
+    """Node of an unrolled linked list: a small Python list of items."""
+    
+    __slots__ = ("items", "next")
+    
+    def __init__(self, items, next=None):
+        self.items = items
+        self.next = next
+
+
+def sort_nodes(head):
+    """
+    Sort a chain of ListNode/SlottedNode objects in place by data and
+    return the new head. sort_list in linked_list_problems.py is the same
+    algorithm on that file's ListNode.val; both read the attribute
+    directly, which is about 1.5x faster than going through attrgetter.
+    
+    Bottom-up natural merge sort: each pass detaches pairs of natural runs
+    (strictly descending runs are reversed while detached, which keeps the
+    sort stable), merges them by relinking, and repeats until one run
+    remains. No recursion and no run table, so extra space is O(1).
+    
+    Time Complexity: O(n log r) for r initial runs, O(n log n) worst case;
+    O(n) for presorted or reverse-sorted input
+    """
+    if head is None or head.next is None:
+        return head
+    
+    def take_run(node):
+        """Detach the run starting at node; return (run head, run tail, rest)."""
+        start, node_value = node, node.data
+        following = node.next
+        if following is not None and following.data < node_value:
+            # Descending run: reverse it as we go
+            run = None
+            while following is not None:
+                following_value = following.data
+                if not following_value < node_value:
+                    break
+                node.next = run
+                run, node, node_value = node, following, following_value
+                following = node.next
+            node.next = run
+            return node, start, following
+        while following is not None:
+            following_value = following.data
+            if following_value < node_value:
+                break
+            node, node_value = following, following_value
+            following = node.next
+        node.next = None
+        return start, node, following
+    
+    while True:
+        dummy = tail = SlottedNode(None)
+        runs = 0
+        current = head
+        while current is not None:
+            first, first_tail, current = take_run(current)
+            runs += 1
+            if current is None:
+                tail.next = first
+                break
+            second, second_tail, current = take_run(current)
+            # Stable merge of the two runs onto the output tail; whichever
+            # run is left over already ends at its known tail
+            first_value, second_value = first.data, second.data
+            while True:
+                if first_value <= second_value:
+                    tail.next = tail = first
+                    first = first.next
+                    if first is None:
+                        tail.next = second
+                        tail = second_tail
+                        break
+                    first_value = first.data
+                else:
+                    tail.next = tail = second
+                    second = second.next
+                    if second is None:
+                        tail.next = first
+                        tail = first_tail
+                        break
+                    second_value = second.data
+        head = dummy.next
+        # Each merge left one run behind: merges + leftover <= 1 means sorted
+        if runs <= 1:
+            return head
+
+
+class UnrolledLinkedList:
+    """
+    Unrolled linked list: each node holds up to `capacity` items in a
+    contiguous chunk, so traversal skips whole chunks and iteration runs
+    over plain lists.
+    
+    Overflowing chunks split in half; chunks that drop below half capacity
+    borrow from or merge with their successor, so every chunk except the
+    last stays at least half full.
+    
+    Time Complexities (n items, chunk capacity c):
+    - access / insert / delete by index: O(n/c + c), i.e. O(sqrt(n)) when
+      c is about sqrt(n)
+    - append: O(1) amortised
+    - iteration: O(n) with per-chunk rather than per-node overhead
+    """
+    
+    __slots__ = ("head", "tail", "capacity", "_size")
+    
+    def __init__(self, iterable=None, capacity=64):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head = self.tail = _Chunk([])
+        self._size = 0
+        if iterable is not None:
+            self.extend(iterable)
+    
+    def __len__(self):
+        return self._size
+    
+    def __iter__(self):
+        chunk = self.head
+        while chunk is not None:
+            yield from chunk.items
+            chunk = chunk.next
+    
+    def __repr__(self):
+        return f"UnrolledLinkedList([{', '.join(map(repr, self))}])"
+    
+    def _normalize(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("list index out of range")
+        return index
+    
+    def _locate(self, index):
+        """
+        Return (previous chunk, chunk, offset) holding position `index`,
+        skipping whole chunks by their lengths.
+        """
+        previous = None
+        chunk = self.head
+        while index >= len(chunk.items) and chunk.next is not None:
+            index -= len(chunk.items)
+            previous = chunk
+            chunk = chunk.next
+        return previous, chunk, index
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(index)
+        index = self._normalize(index)
+        if index >= self._size - len(self.tail.items):
+            return self.tail.items[index - self._size]
+        _, chunk, offset = self._locate(index)
+        return chunk.items[offset]
+    
+    def __setitem__(self, index, value):
+        _, chunk, offset = self._locate(self._normalize(index))
+        chunk.items[offset] = value
+    
+    def __delitem__(self, index):
+        self.pop(index)
+    
+    def _slice(self, key):
+        start, stop, step = key.indices(self._size)
+        result = UnrolledLinkedList(capacity=self.capacity)
+        if step != 1:
+            result.extend(self[i] for i in range(start, stop, step))
+            return result
+        if start >= stop:
+            return result
+        _, chunk, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            part = chunk.items[offset:offset + remaining]
+            result.extend(part)
+            remaining -= len(part)
+            chunk = chunk.next
+            offset = 0
+        return result
+    
+    def append(self, value):
+        """Add to the end; a full tail chunk starts a new chunk - O(1)."""
+        tail = self.tail
+        if len(tail.items) >= self.capacity:
+            tail.next = self.tail = tail = _Chunk([])
+        tail.items.append(value)
+        self._size += 1
+    
+    def extend(self, iterable):
+        """Append items chunk by chunk, filling each chunk to capacity."""
+        items = list(iterable)
+        capacity = self.capacity
+        tail = self.tail
+        position = capacity - len(tail.items)
+        tail.items.extend(items[:position])
+        while position < len(items):
+            tail.next = tail = _Chunk(items[position:position + capacity])
+            position += capacity
+        self.tail = tail
+        self._size += len(items)
+    
+    def insert(self, index, value):
+        """
+        Insert before position `index` (list.insert semantics, so
+        out-of-range indexes clamp to the ends). Splits the chunk in half
+        when it overflows.
+        """
+        if index < 0:
+            index = max(index + self._size, 0)
+        if index >= self._size:
+            self.append(value)
+            return
+        _, chunk, offset = self._locate(index)
+        chunk.items.insert(offset, value)
+        self._size += 1
+        if len(chunk.items) > self.capacity:
+            half = len(chunk.items) // 2
+            chunk.next = _Chunk(chunk.items[half:], chunk.next)
+            del chunk.items[half:]
+            if chunk is self.tail:
+                self.tail = chunk.next
+    
+    def pop(self, index=-1):
+        """Remove and return the item at `index`, rebalancing on underflow."""
+        if not self._size:
+            raise IndexError("pop from empty list")
+        previous, chunk, offset = self._locate(self._normalize(index))
+        value = chunk.items.pop(offset)
+        self._size -= 1
+        self._rebalance(previous, chunk)
+        return value
+    
+    def remove(self, value):
+        """Remove the first occurrence of value. Raises ValueError if absent."""
+        previous = None
+        chunk = self.head
+        while chunk is not None:
+            if value in chunk.items:
+                chunk.items.remove(value)
+                self._size -= 1
+                self._rebalance(previous, chunk)
+                return
+            previous = chunk
+            chunk = chunk.next
+        raise ValueError(f"{value!r} not in list")
+    
+    def index(self, value):
+        """Return the position of the first occurrence of value."""
+        base = 0
+        chunk = self.head
+        while chunk is not None:
+            if value in chunk.items:
+                return base + chunk.items.index(value)
+            base += len(chunk.items)
+            chunk = chunk.next
+        raise ValueError(f"{value!r} not in list")
+    
+    def _rebalance(self, previous, chunk):
+        """Restore the half-full invariant after a deletion from chunk."""
+        half = self.capacity // 2
+        if len(chunk.items) >= half:
+            return
+        following = chunk.next
+        if following is None:
+            # The tail may be underfull; drop it only once it is empty
+            if not chunk.items and previous is not None:
+                previous.next = None
+                self.tail = previous
+            return
+        if len(chunk.items) + len(following.items) <= self.capacity:
+            # Merge the successor into this chunk
+            chunk.items.extend(following.items)
+            chunk.next = following.next
+            if following is self.tail:
+                self.tail = chunk
+        else:
+            # Borrow enough items from the successor to reach half capacity
+            borrow = half - len(chunk.items)
+            chunk.items.extend(following.items[:borrow])
+            del following.items[:borrow]
+    
+    def chunk_sizes(self):
+        """Lengths of all chunks, head to tail (useful for inspection)."""
+        sizes = []
+        chunk = self.head
+        while chunk is not None:
+            sizes.append(len(chunk.items))
+            chunk = chunk.next
+        return sizes
+
+
+def benchmark_unrolled_list(n=20000, operations=2000):
+    """
+    Positional inserts, deletes and index reads at random positions on
+    LinkedList vs UnrolledLinkedList (capacity ~ sqrt(n)). LinkedList's
+    prints are redirected so only the traversal cost is timed.
+    """
+    import contextlib
+    import io
+    import math
+    import time
+    
+    rng = random.Random(42)
+    positions = [rng.randrange(n) for _ in range(operations)]
+    
+    original = LinkedList()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for value in range(n):
+            original.prepend(value)
+    unrolled = UnrolledLinkedList(range(n), capacity=max(2, math.isqrt(n)))
+    
+    def run(insert, read, delete):
+        timings = []
+        for action in (insert, read, delete):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for position in positions:
+                    action(position)
+            timings.append((time.perf_counter() - start) / operations * 1e6)
+        return timings
+    
+    original_times = run(
+        lambda i: original.insert_at_position(-1, i),
+        original.get_at_index,
+        lambda i: original.delete_by_value(-1),
+    )
+    unrolled_times = run(
+        lambda i: unrolled.insert(i, -1),
+        unrolled.__getitem__,
+        lambda i: unrolled.pop(i),
+    )
+    
+    print(f"n={n}, {operations} random positions (us/op)")
+    print(f"{'operation':<12}{'LinkedList':>12}{'Unrolled':>12}")
+    for label, a, b in zip(("insert", "index", "delete"), original_times, unrolled_times):
+        print(f"{label:<12}{a:>12.1f}{b:>12.1f}")
+
+
+class SkipNode:
+    """Skip list node: key, value and one forward pointer per level."""
+    
+    __slots__ = ("key", "value", "forward")
+    
+    def __init__(self, key, value, level):
+        self.key = key
+        self.value = value
+        self.forward = [None] * level
+
+
+class SkipListMap:
+    """
+    Ordered map built from layered sorted linked lists. Each node is
+    promoted to the next level with probability p, so searches skip
+    ahead on the sparse upper levels and descend to level 0.
+    
+    Concurrent-reader mode (concurrent=True): writers serialise on a lock
+    while lookups, bounds and iteration never lock. A new node has all of
+    its forward pointers set before it is linked in, bottom level first,
+    and deletions unlink top level first while leaving the removed node's
+    own pointers intact, so a reader never follows a dangling link.
+    
+    Time Complexities (expected):
+    - get / insert / delete / lower_bound / upper_bound: O(log n)
+    - range iteration: O(log n + k) for k results
+    """
+    
+    def __init__(self, p=0.5, max_level=32, concurrent=False, seed=None):
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.p = p
+        self.max_level = max_level
+        self.level = 1
+        self.head = SkipNode(None, None, max_level)
+        self._size = 0
+        self._random = random.Random(seed).random
+        self._lock = threading.Lock() if concurrent else None
+    
+    def __len__(self):
+        return self._size
+    
+    def _random_level(self):
+        level = 1
+        while level < self.max_level and self._random() < self.p:
+            level += 1
+        return level
+    
+    def _predecessors(self, key):
+        """Rightmost node with node.key < key on every level."""
+        update = [self.head] * self.max_level
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[i]
+            update[i] = node
+        return update
+    
+    def _first_at_least(self, key):
+        """First node with node.key >= key, or None."""
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.key < key:
+                node = nxt
+                nxt = node.forward[i]
+        return node.forward[0]
+    
+    def _first_greater(self, key):
+        """First node with node.key > key, or None."""
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            nxt = node.forward[i]
+            while nxt is not None and nxt.key <= key:
+                node = nxt
+                nxt = node.forward[i]
+        return node.forward[0]
+    
+    def get(self, key, default=None):
+        node = self._first_at_least(key)
+        if node is not None and node.key == key:
+            return node.value
+        return default
+    
+    def __getitem__(self, key):
+        node = self._first_at_least(key)
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return node.value
+    
+    def __contains__(self, key):
+        node = self._first_at_least(key)
+        return node is not None and node.key == key
+    
+    def __setitem__(self, key, value):
+        if self._lock is None:
+            self._insert(key, value)
+        else:
+            with self._lock:
+                self._insert(key, value)
+    
+    def _insert(self, key, value):
+        update = self._predecessors(key)
+        existing = update[0].forward[0]
+        if existing is not None and existing.key == key:
+            existing.value = value
+            return
+        level = self._random_level()
+        node = SkipNode(key, value, level)
+        # Fill the new node's pointers before publishing it
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+        for i in range(level):
+            update[i].forward[i] = node
+        if level > self.level:
+            self.level = level
+        self._size += 1
+    
+    def __delitem__(self, key):
+        if self._lock is None:
+            removed = self._delete(key)
+        else:
+            with self._lock:
+                removed = self._delete(key)
+        if removed is None:
+            raise KeyError(key)
+    
+    def pop(self, key, *default):
+        """Remove key and return its value (or default if given)."""
+        if self._lock is None:
+            node = self._delete(key)
+        else:
+            with self._lock:
+                node = self._delete(key)
+        if node is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return node.value
+    
+    def _delete(self, key):
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return None
+        # Unlink from the top down; node.forward stays valid for readers
+        for i in range(len(node.forward) - 1, -1, -1):
+            if update[i].forward[i] is node:
+                update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self._size -= 1
+        return node
+    
+    def lower_bound(self, key):
+        """Smallest key >= key, or None."""
+        node = self._first_at_least(key)
+        return None if node is None else node.key
+    
+    def upper_bound(self, key):
+        """Smallest key > key, or None."""
+        node = self._first_greater(key)
+        return None if node is None else node.key
+    
+    def range(self, low=None, high=None, inclusive=False):
+        """
+        Yield (key, value) pairs with low <= key < high (key <= high when
+        inclusive). Either bound may be None for an open end.
+        """
+        node = self.head.forward[0] if low is None else self._first_at_least(low)
+        while node is not None:
+            if high is not None and (node.key > high or (node.key == high and not inclusive)):
+                return
+            yield node.key, node.value
+            node = node.forward[0]
+    
+    def items(self):
+        return self.range()
+    
+    def keys(self):
+        return (key for key, _ in self.range())
+    
+    def values(self):
+        return (value for _, value in self.range())
+    
+    def __iter__(self):
+        return self.keys()
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class SkipListSet(SkipListMap):
+    """Ordered set on top of SkipListMap (values are unused)."""
+    
+    def add(self, key):
+        self[key] = None
+    
+    def discard(self, key):
+        self.pop(key, None)
+    
+    def __repr__(self):
+        return f"SkipListSet({list(self)!r})"
+
+
+def benchmark_skip_list(n=20000):
+    """
+    Random inserts and lookups: SkipListMap vs FastLinkedList kept sorted
+    by linear scan, with a bisect-maintained Python list for reference.
+    """
+    import bisect
+    import time
+    
+    rng = random.Random(7)
+    keys = rng.sample(range(n * 10), n)
+    probes = [rng.choice(keys) for _ in range(n)]
+    small = min(n, 2000)
+    
+    def skip_list(data):
+        sl = SkipListMap(seed=1)
+        for key in data:
+            sl[key] = key
+        for key in probes:
+            sl.get(key)
+    
+    def sorted_linked_list(data):
+        ll = FastLinkedList()
+        for key in data:
+            previous, current = None, ll.head
+            while current is not None and current.data < key:
+                previous, current = current, current.next
+            if previous is None:
+                ll.appendleft(key)
+            else:
+                previous.next = SlottedNode(key, current)
+        for key in probes[:small]:
+            current = ll.head
+            while current is not None and current.data < key:
+                current = current.next
+    
+    def bisect_list(data):
+        arr = []
+        for key in data:
+            bisect.insort(arr, key)
+        for key in probes:
+            bisect.bisect_left(arr, key)
+    
+    print(f"{'structure':<22}{'n':>8}{'ms':>10}")
+    for label, fn, size in (("sorted FastLinkedList", sorted_linked_list, small),
+                            ("SkipListMap", skip_list, n),
+                            ("bisect list", bisect_list, n)):
+        start = time.perf_counter()
+        fn(keys[:size])
+        print(f"{label:<22}{size:>8}{(time.perf_counter() - start) * 1e3:>10.1f}")
+
+
 # Test the LinkedList implementation
 if __name__ == "__main__":
     print("=== BASIC LINKED LIST DEMONSTRATION ===")
@@ -415,10 +1287,81 @@ if __name__ == "__main__":
     print("\n5. Testing reverse:")
     ll.reverse()
     ll.display()
+    ll.sort()
+    ll.display()
     
     # Test edge cases
     print("\n6. Testing edge cases:")
     empty_list = LinkedList()
     empty_list.display()
     empty_list.delete_first()
-    empty_list.search(10)
\ No newline at end of file
+    empty_list.search(10)
+    
+    # Test production list
+    print("\n7. Testing FastLinkedList:")
+    fast = FastLinkedList([10, 20, 30])
+    fast.appendleft(5)
+    fast.append(40)
+    fast.extend([50, 60])
+    print(f"{fast}, len={len(fast)}")
+    print(f"popleft={fast.popleft()}, pop={fast.pop()}, fast[2]={fast[2]}")
+    fast.remove(30)
+    fast.reverse()
+    print(f"After remove(30) and reverse: {list(fast)}")
+    fast.extend([25, 5, 45])
+    fast.sort()
+    fast.append(99)
+    print(f"After extend, sort and append: {list(fast)}")
+    
+    print("\n8. Benchmark:")
+    benchmark_linked_lists()
+    
+    # Test unrolled list
+    print("\n9. Testing UnrolledLinkedList:")
+    playlist = UnrolledLinkedList(range(10), capacity=4)
+    playlist.insert(5, "ad")
+    playlist.insert(0, "intro")
+    del playlist[3]
+    print(f"{list(playlist)}")
+    print(f"Chunks: {playlist.chunk_sizes()}, slice [2:6]: {list(playlist[2:6])}")
+    print(f"playlist[6]={playlist[6]}, index('ad')={playlist.index('ad')}")
+    benchmark_unrolled_list()
+    
+    # Test skip list
+    print("\n10. Testing SkipListMap:")
+    index = SkipListMap(p=0.25, seed=3)
+    for timestamp, event in [(30, "c"), (10, "a"), (50, "e"), (20, "b"), (40, "d")]:
+        index[timestamp] = event
+    del index[20]
+    print(f"{index}")
+    print(f"lower_bound(25)={index.lower_bound(25)}, upper_bound(30)={index.upper_bound(30)}")
+    print(f"range(10, 40)={list(index.range(10, 40))}")
+    tags = SkipListSet()
+    for tag in ["pop", "jazz", "rock", "jazz"]:
+        tags.add(tag)
+    print(f"{tags}, 'rock' in tags: {'rock' in tags}")
+    
+    shared = SkipListMap(concurrent=True, seed=5)
+    for key in range(0, 2000, 2):
+        shared[key] = key
+    seen_errors = []
+    
+    def reader():
+        for _ in range(20):
+            keys = list(shared.keys())
+            if keys != sorted(keys):
+                seen_errors.append(keys)
+    
+    def writer(offset):
+        for key in range(offset, 2000, 4):
+            shared[key] = key
+            shared.pop(key - 1, None)
+    
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    threads += [threading.Thread(target=writer, args=(o,)) for o in (1, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"Concurrent mode: {len(shared)} keys, reader saw unordered snapshot: {bool(seen_errors)}")
+    benchmark_skip_list()
@@ -5,6 +5,9 @@ Collection of well-known linked list problems with optimal solutions.
 Each problem includes problem statement, approach, time/space complexity, and implementation.
 """
 
+import heapq
+from array import array
+
 class ListNode:
     """Standard linked list node definition."""
     def __init__(self, val=0, next=None):
@@ -54,22 +57,53 @@ def reverse_list(head):
 
 def reverse_list_recursive(head):
     """
-    Recursive solution for reversing linked list.
-    Time Complexity: O(n), Space Complexity: O(n) due to recursion stack
+    Recursive solution for reversing linked list, with the call stack
+    made explicit so long lists can't hit the recursion limit.
+    Time Complexity: O(n), Space Complexity: O(n) for the stack
+    
+    The descent pushes every node, like the recursive calls would; the
+    unwind pops them and points each one back at its predecessor.
     """
     # Base case: empty list or single node
     if not head or not head.next:
         return head
     
-    # Recursively reverse the rest of the list
-    new_head = reverse_list_recursive(head.next)
+    # "Recurse" to the end of the list
+    stack = []
+    while head.next:
+        stack.append(head)
+        head = head.next
+    new_head = head
     
-    # Reverse the current connection
-    head.next.next = head
-    head.next = None
+    # Unwind: reverse each connection, innermost call first
+    while stack:
+        node = stack.pop()
+        node.next.next = node
+        node.next = None
     
     return new_head
 
+def benchmark_reverse_list(sizes=(500, 5000, 10**6)):
+    """
+    reverse_list (iterative) vs reverse_list_recursive. The recursive
+    version used to raise RecursionError near 1000 nodes; with its
+    explicit stack it only pays for the extra O(n) list.
+    """
+    import time
+    
+    print(f"{'n':>9}{'iterative ms':>14}{'recursive ms':>14}")
+    for n in sizes:
+        timings = []
+        for reverse in (reverse_list, reverse_list_recursive):
+            head = None
+            for value in range(n):
+                head = ListNode(value, head)
+            start = time.perf_counter()
+            head = reverse(head)
+            timings.append((time.perf_counter() - start) * 1e3)
+            assert head.val == 0 and find_middle(head).val == n // 2
+        print(f"{n:>9}{timings[0]:>14.2f}{timings[1]:>14.2f}")
+
 # ============================================================================
 # PROBLEM 2: DETECT CYCLE IN LINKED LIST
 # ============================================================================
@@ -512,6 +546,577 @@ def delete_all_duplicates(head):
     
     return dummy.next
 
+# ============================================================================
+# PROBLEM 12: MERGE K SORTED LISTS / STREAMS
+# ============================================================================
+def iter_linked_list(head):
+    """Yield the values of a linked list lazily."""
+    while head:
+        yield head.val
+        head = head.next
+
+def merge_k_lists(lists):
+    """
+    Problem: Merge k sorted linked lists into one sorted list.
+    
+    Approach: Min-heap holding the current head of every list. Pop the
+    smallest node, link it onto the result and push its successor. Nodes
+    are relinked in place; the list index breaks ties, so equal values
+    keep the order of their input lists.
+    Time Complexity: O(N log k) where N = total nodes
+    Space Complexity: O(k) for the heap
+    
+    Example: [[1,4,5],[1,3,4],[2,6]] -> [1,1,2,3,4,4,5,6]
+    """
+    heap = [(head.val, index, head) for index, head in enumerate(lists) if head]
+    heapq.heapify(heap)
+    
+    dummy = ListNode(0)
+    tail = dummy
+    while len(heap) > 1:
+        _, index, node = heap[0]
+        tail.next = tail = node
+        if node.next:
+            heapq.heapreplace(heap, (node.next.val, index, node.next))
+        else:
+            heapq.heappop(heap)
+    
+    # The last list left can be linked on as-is
+    tail.next = heap[0][2] if heap else None
+    return dummy.next
+
+def merge_k_sorted(sources, key=None):
+    """
+    Problem: Merge k sorted sources (linked list heads, lists or lazy
+    iterators) into one sorted stream.
+    
+    Approach: Same heap as merge_k_lists, but each entry carries an
+    iterator so only one pending item per source is held in memory. The
+    result is a generator: values are produced as soon as they are known
+    to be the smallest remaining, and nothing is materialised.
+    Time Complexity: O(N log k)
+    Space Complexity: O(k)
+    
+    Example: merge_k_sorted([[1, 4], iter([2, 3]), ListNode(0)]) -> 0,1,2,3,4
+    """
+    heap = []
+    for index, source in enumerate(sources):
+        if source is None or isinstance(source, ListNode):
+            # An empty linked list is just a None head
+            iterator = iter_linked_list(source)
+        else:
+            iterator = iter(source)
+        for first in iterator:
+            heap.append((first if key is None else key(first), index, first, iterator))
+            break
+    heapq.heapify(heap)
+    
+    while len(heap) > 1:
+        _, index, value, iterator = heap[0]
+        yield value
+        for following in iterator:
+            sort_key = following if key is None else key(following)
+            heapq.heapreplace(heap, (sort_key, index, following, iterator))
+            break
+        else:
+            heapq.heappop(heap)
+    
+    # One source left: stream the rest of it directly
+    if heap:
+        _, _, value, iterator = heap[0]
+        yield value
+        yield from iterator
+
+def merge_k_lists_pairwise(lists):
+    """
+    Baseline: fold merge_two_lists over the inputs one by one. Each merge
+    re-walks everything merged so far, so the cost is O(N * k).
+    """
+    merged = None
+    for head in lists:
+        merged = merge_two_lists(merged, head)
+    return merged
+
+def benchmark_k_way_merge(total=100000, shard_counts=(4, 32, 256)):
+    """
+    Merge `total` values split across k sorted shards: heap-based k-way
+    merge vs repeated pairwise merges, for linked lists and for plain
+    lists (where the pairwise baseline is the two-pointer merge used in
+    practice/04_merge_sorted_arrays.py).
+    """
+    import random
+    import time
+    
+    def build_list(values):
+        dummy = ListNode(0)
+        tail = dummy
+        for value in values:
+            tail.next = tail = ListNode(value)
+        return dummy.next
+    
+    def merge_two_arrays(arr1, arr2):
+        merged = []
+        i = j = 0
+        while i < len(arr1) and j < len(arr2):
+            if arr1[i] <= arr2[j]:
+                merged.append(arr1[i])
+                i += 1
+            else:
+                merged.append(arr2[j])
+                j += 1
+        merged.extend(arr1[i:])
+        merged.extend(arr2[j:])
+        return merged
+    
+    def timed(fn):
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1e3
+    
+    rng = random.Random(0)
+    print(f"N={total} values")
+    print(f"{'k':>5}{'lists pairwise':>16}{'lists heap':>12}{'arrays pairwise':>17}{'stream heap':>13}  (ms)")
+    for k in shard_counts:
+        shards = [sorted(rng.randrange(total) for _ in range(total // k)) for _ in range(k)]
+        
+        def arrays_pairwise():
+            merged = []
+            for shard in shards:
+                merged = merge_two_arrays(merged, shard)
+        
+        row = [
+            timed(lambda: merge_k_lists_pairwise([build_list(s) for s in shards])),
+            timed(lambda: merge_k_lists([build_list(s) for s in shards])),
+            timed(arrays_pairwise),
+            timed(lambda: sum(1 for _ in merge_k_sorted(iter(s) for s in shards))),
+        ]
+        print(f"{k:>5}" + "".join(f"{t:>{w}.1f}" for t, w in zip(row, (16, 12, 17, 13))))
+
+# ============================================================================
+# PROBLEM 13: ARRAY-BACKED NODE POOL
+# ============================================================================
+NIL = -1
+
+class NodePool:
+    """
+    Node storage as parallel array.array columns instead of heap objects.
+    A node is an integer index; val/next/prev/random are columns, and
+    NIL (-1) plays the role of None. Freed slots are chained through the
+    `next` column into a free list and reused by alloc().
+    
+    Values are stored as signed 64-bit ints; links as 32-bit ints, so a
+    pool holds up to 2**31 - 1 nodes at 20 bytes per node with no
+    per-node object or GC header.
+    
+    Every pool list is doubly linked: the ported algorithms below keep
+    `prev` consistent so the same pool serves DoublyListNode-style code.
+    
+    Trade-off: building and copying lists get much cheaper, but a pure
+    Python pointer walk pays to box each index read from an array, so
+    plain traversals run somewhat slower than over objects.
+    """
+    
+    def __init__(self, capacity=0):
+        self.val = array("q", bytes(8 * capacity))
+        self.next = array("i", [NIL]) * capacity
+        self.prev = array("i", [NIL]) * capacity
+        self.random = array("i", [NIL]) * capacity
+        # Chain all preallocated slots into the free list
+        for index in range(capacity - 1):
+            self.next[index] = index + 1
+        self.free_head = 0 if capacity else NIL
+        self.size = 0
+    
+    def __len__(self):
+        """Number of live nodes."""
+        return self.size
+    
+    def _grow(self):
+        old = len(self.val)
+        extra = max(old, 16)
+        self.val.extend(array("q", bytes(8 * extra)))
+        self.next.extend(range(old + 1, old + extra))
+        self.next.append(NIL)
+        self.prev.extend(array("i", [NIL]) * extra)
+        self.random.extend(array("i", [NIL]) * extra)
+        self.free_head = old
+    
+    def alloc(self, val=0):
+        """Take a slot from the free list (growing the pool if needed)."""
+        if self.free_head == NIL:
+            self._grow()
+        index = self.free_head
+        self.free_head = self.next[index]
+        self.val[index] = val
+        self.next[index] = self.prev[index] = self.random[index] = NIL
+        self.size += 1
+        return index
+    
+    def free(self, index):
+        """Return a node's slot to the free list."""
+        self.next[index] = self.free_head
+        self.prev[index] = self.random[index] = NIL
+        self.free_head = index
+        self.size -= 1
+    
+    def from_values(self, values):
+        """
+        Build a list from an iterable and return its head index. A fresh
+        pool appends whole columns at once instead of allocating node by
+        node.
+        """
+        values = array("q", values)
+        count = len(values)
+        if not count:
+            return NIL
+        if self.free_head != NIL or self.size != len(self.val):
+            # Reuse free slots one at a time
+            head = previous = NIL
+            for value in values:
+                index = self.alloc(value)
+                if previous == NIL:
+                    head = index
+                else:
+                    self.next[previous] = index
+                    self.prev[index] = previous
+                previous = index
+            return head
+        start = len(self.val)
+        self.val.extend(values)
+        self.next.extend(range(start + 1, start + count))
+        self.next.append(NIL)
+        self.prev.append(NIL)
+        self.prev.extend(range(start, start + count - 1))
+        self.random.extend(array("i", [NIL]) * count)
+        self.size += count
+        return start
+    
+    def to_values(self, head):
+        """Values of the list starting at head, as a Python list."""
+        values = []
+        val, nxt = self.val, self.next
+        while head != NIL:
+            values.append(val[head])
+            head = nxt[head]
+        return values
+
+def pool_reverse_list(pool, head):
+    """
+    reverse_list on a NodePool: swap each node's next and prev links.
+    Time Complexity: O(n), Space Complexity: O(1)
+    """
+    nxt, prev = pool.next, pool.prev
+    previous = NIL
+    current = head
+    while current != NIL:
+        next_node = nxt[current]
+        nxt[current] = previous
+        prev[current] = next_node
+        previous = current
+        current = next_node
+    return previous
+
+def pool_has_cycle(pool, head):
+    """
+    has_cycle on a NodePool (Floyd's tortoise and hare over indices).
+    Time Complexity: O(n), Space Complexity: O(1)
+    """
+    nxt = pool.next
+    slow = fast = head
+    while fast != NIL and nxt[fast] != NIL:
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+        if slow == fast:
+            return True
+    return False
+
+def pool_find_middle(pool, head):
+    """
+    find_middle on a NodePool; returns the middle index (second middle
+    for even lengths) or NIL.
+    Time Complexity: O(n), Space Complexity: O(1)
+    """
+    nxt = pool.next
+    slow = fast = head
+    while fast != NIL and nxt[fast] != NIL:
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+    return slow
+
+def pool_remove_nth_from_end(pool, head, n):
+    """
+    remove_nth_from_end on a NodePool. The removed slot goes back to the
+    pool's free list. Returns the (possibly new) head. Raises ValueError
+    unless 1 <= n <= length, since stepping past NIL would index nxt[-1]
+    and silently relink the last slot.
+    Time Complexity: O(L), Space Complexity: O(1)
+    """
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+    nxt, prev = pool.next, pool.prev
+    first = head
+    for _ in range(n):
+        if first == NIL:
+            raise ValueError(f"n={n} is longer than the list")
+        first = nxt[first]
+    if first == NIL:
+        # Removing the head
+        new_head = nxt[head]
+        if new_head != NIL:
+            prev[new_head] = NIL
+        pool.free(head)
+        return new_head
+    second = head
+    while nxt[first] != NIL:
+        first = nxt[first]
+        second = nxt[second]
+    target = nxt[second]
+    following = nxt[target]
+    nxt[second] = following
+    if following != NIL:
+        prev[following] = second
+    pool.free(target)
+    return head
+
+def pool_copy_random_list(pool, head):
+    """
+    copy_random_list on a NodePool, using the same three passes
+    (interleave copies, wire random links, split) with indices. The copy
+    is allocated from the same pool; returns its head.
+    Time Complexity: O(n), Space Complexity: O(1) extra
+    """
+    if head == NIL:
+        return NIL
+    # Pass 1: interleave a copy after every original node
+    current = head
+    while current != NIL:
+        copy = pool.alloc(pool.val[current])
+        following = pool.next[current]
+        pool.next[copy] = following
+        pool.next[current] = copy
+        current = following
+    
+    # Pass 2: a copy's random is the copy of the original's random
+    nxt, prev, rnd = pool.next, pool.prev, pool.random
+    current = head
+    while current != NIL:
+        if rnd[current] != NIL:
+            rnd[nxt[current]] = nxt[rnd[current]]
+        current = nxt[nxt[current]]
+    
+    # Pass 3: split the two lists, wiring prev links of the copy
+    copy_head = nxt[head]
+    current = head
+    copy_previous = NIL
+    while current != NIL:
+        copy = nxt[current]
+        following = nxt[copy]
+        nxt[current] = following
+        nxt[copy] = nxt[following] if following != NIL else NIL
+        prev[copy] = copy_previous
+        copy_previous = copy
+        current = following
+    return copy_head
+
+def benchmark_node_pool(n=200000):
+    """
+    Memory and traversal time: RandomListNode objects vs NodePool columns
+    for an n-node list with random pointers.
+    """
+    import random
+    import time
+    import tracemalloc
+    
+    rng = random.Random(1)
+    values = [rng.randrange(10**6, 10**9) for _ in range(n)]
+    targets = [rng.randrange(n) for _ in range(n)]
+    
+    def build_objects():
+        nodes = [RandomListNode(value) for value in values]
+        for i in range(n - 1):
+            nodes[i].next = nodes[i + 1]
+        for node, target in zip(nodes, targets):
+            node.random = nodes[target]
+        return nodes[0]
+    
+    def build_pool():
+        pool = NodePool()
+        head = pool.from_values(values)
+        pool.random = array("i", targets)
+        return pool, head
+    
+    def measure(build):
+        # Time and memory are measured on separate builds: tracemalloc's
+        # per-allocation hook would otherwise dominate the timing
+        tracemalloc.start()
+        kept = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        start = time.perf_counter()
+        result = build()
+        return result, time.perf_counter() - start, memory
+    
+    head, object_build, object_memory = measure(build_objects)
+    (pool, pool_head), pool_build, pool_memory = measure(build_pool)
+    
+    def timed(fn):
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1e3
+    
+    rows = [
+        ("find_middle", lambda: find_middle(head), lambda: pool_find_middle(pool, pool_head)),
+        ("has_cycle", lambda: has_cycle(head), lambda: pool_has_cycle(pool, pool_head)),
+        ("copy_random", lambda: copy_random_list(head), lambda: pool_copy_random_list(pool, pool_head)),
+    ]
+    print(f"n={n} nodes with random pointers")
+    print(f"{'':<14}{'objects':>12}{'NodePool':>12}")
+    print(f"{'bytes/node':<14}{object_memory / n:>12.1f}{pool_memory / n:>12.1f}")
+    print(f"{'build ms':<14}{object_build * 1e3:>12.1f}{pool_build * 1e3:>12.1f}")
+    for label, object_fn, pool_fn in rows:
+        print(f"{label + ' ms':<14}{timed(object_fn):>12.1f}{timed(pool_fn):>12.1f}")
+
+# ============================================================================
+# PROBLEM 14: SORT LINKED LIST
+# ============================================================================
+def _take_run(node):
+    """
+    Detach the natural run starting at node and return (head, tail, rest).
+    Non-decreasing runs are taken as they are; strictly decreasing runs
+    are reversed while being detached (strictness keeps the sort stable).
+    """
+    start, node_value = node, node.val
+    following = node.next
+    if following is not None and following.val < node_value:
+        # Descending run: reverse it as we go
+        run = None
+        while following is not None:
+            following_value = following.val
+            if not following_value < node_value:
+                break
+            node.next = run
+            run, node, node_value = node, following, following_value
+            following = node.next
+        node.next = run
+        return node, start, following
+    while following is not None:
+        following_value = following.val
+        if following_value < node_value:
+            break
+        node, node_value = following, following_value
+        following = node.next
+    node.next = None
+    return start, node, following
+
+def sort_list(head):
+    """
+    Problem: Sort a linked list in place.
+    
+    Approach: Bottom-up natural merge sort. Each pass walks the list,
+    detaching pairs of natural runs (reversing descending ones) and
+    merging them back in place, until a pass leaves a single run. Nodes
+    are relinked, never copied, and no run table or recursion is kept.
+    Values are read straight from .val and cached across comparisons.
+    Time Complexity: O(n log r) for r initial runs, O(n log n) worst case;
+    O(n) for presorted or reverse-sorted input
+    Space Complexity: O(1)
+    
+    Example: 4->2->1->3 becomes 1->2->3->4
+    """
+    if not head or not head.next:
+        return head
+    
+    while True:
+        dummy = tail = ListNode(0)
+        runs = 0
+        current = head
+        while current is not None:
+            first, first_tail, current = _take_run(current)
+            runs += 1
+            if current is None:
+                tail.next = first
+                break
+            second, second_tail, current = _take_run(current)
+            # Stable merge; the leftover run already ends at its known tail
+            first_value, second_value = first.val, second.val
+            while True:
+                if first_value <= second_value:
+                    tail.next = tail = first
+                    first = first.next
+                    if first is None:
+                        tail.next = second
+                        tail = second_tail
+                        break
+                    first_value = first.val
+                else:
+                    tail.next = tail = second
+                    second = second.next
+                    if second is None:
+                        tail.next = first
+                        tail = first_tail
+                        break
+                    second_value = second.val
+        head = dummy.next
+        # Each merge left one run behind: merges + leftover <= 1 means sorted
+        if runs <= 1:
+            return head
+
+def benchmark_sort_list(n=100000):
+    """
+    sort_list vs the list round-trip (copy values out, sort, write a new
+    list back) on random, presorted and reversed input. The round-trip is
+    timed with both sorting/04_merge_sort.py's merge_sort and the built-in
+    sorted(); the in-place sort keeps node identity and O(1) extra memory.
+    On random input sort_list runs about even with the merge_sort trip
+    (both pure Python) and several times slower than the sorted() trip;
+    on presorted or reversed input its single O(n) pass beats both.
+    """
+    import importlib.util
+    import os
+    import random
+    import time
+    
+    merge_sort = None
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sorting", "04_merge_sort.py")
+    if os.path.exists(path):
+        spec = importlib.util.spec_from_file_location("merge_sort_module", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        merge_sort = module.merge_sort
+    
+    def build(values):
+        dummy = tail = ListNode(0)
+        for value in values:
+            tail.next = tail = ListNode(value)
+        return dummy.next
+    
+    def round_trip(sort):
+        def run(head):
+            return build(sort(list(iter_linked_list(head))))
+        return run
+    
+    def timed(sort, values):
+        head = build(values)
+        start = time.perf_counter()
+        head = sort(head)
+        elapsed = (time.perf_counter() - start) * 1e3
+        assert list(iter_linked_list(head)) == sorted(values)
+        return f"{elapsed:.1f}"
+    
+    rng = random.Random(3)
+    inputs = [("random", [rng.randrange(n) for _ in range(n)]),
+              ("presorted", list(range(n))),
+              ("reversed", list(range(n, 0, -1)))]
+    sorters = [("sort_list", sort_list), ("sorted() trip", round_trip(sorted))]
+    if merge_sort is not None:
+        sorters.append(("merge_sort trip", round_trip(merge_sort)))
+    
+    print(f"n={n} (ms)")
+    print(f"{'input':<11}" + "".join(f"{label:>17}" for label, _ in sorters))
+    for label, values in inputs:
+        print(f"{label:<11}" + "".join(f"{timed(sort, values):>17}" for _, sort in sorters))
+
 # ============================================================================
 # TEST FUNCTIONS
 # ============================================================================
@@ -529,6 +1134,7 @@ def test_linked_list_problems():
     print(f"Original: {print_list(head1)}")
     reversed_head = reverse_list(head1)
     print(f"Reversed: {print_list(reversed_head)}")
+    benchmark_reverse_list()
     
     # Test 2: Detect Cycle
     print("\n2. DETECT CYCLE")
@@ -597,6 +1203,46 @@ def test_linked_list_problems():
     print(f"Original: {print_list(head7)}")
     all_deduplicated = delete_all_duplicates(head7)
     print(f"After removing all duplicates: {print_list(all_deduplicated)}")
+    
+    # Test 8: Merge K Sorted Lists
+    print("\n8. MERGE K SORTED LISTS")
+    shards = [[1, 4, 5], [1, 3, 4], [2, 6]]
+    heads = []
+    for shard in shards:
+        dummy = tail = ListNode(0)
+        for value in shard:
+            tail.next = tail = ListNode(value)
+        heads.append(dummy.next)
+    print(f"Input: {shards}")
+    print(f"Merged: {print_list(merge_k_lists(heads))}")
+    mixed = [ListNode(0, ListNode(7)), [2, 9], iter(range(3, 6))]
+    print(f"Streamed from node/list/iterator: {list(merge_k_sorted(mixed))}")
+    benchmark_k_way_merge()
+    
+    # Test 9: Array-backed node pool
+    print("\n9. ARRAY-BACKED NODE POOL")
+    pool = NodePool()
+    head9 = pool.from_values([1, 2, 3, 4, 5])
+    print(f"List: {pool.to_values(head9)}, middle: {pool.val[pool_find_middle(pool, head9)]}")
+    head9 = pool_remove_nth_from_end(pool, head9, 2)
+    print(f"After removing 2nd from end: {pool.to_values(head9)} (free slot reused: {pool.alloc(9) == 3})")
+    head9 = pool_reverse_list(pool, head9)
+    print(f"Reversed: {pool.to_values(head9)}, has cycle: {pool_has_cycle(pool, head9)}")
+    pool.random[head9] = pool.next[pool.next[head9]]
+    copy9 = pool_copy_random_list(pool, head9)
+    print(f"Copy: {pool.to_values(copy9)}, copy head's random -> {pool.val[pool.random[copy9]]}")
+    try:
+        pool_remove_nth_from_end(pool, copy9, 10)
+    except ValueError as error:
+        print(f"Removing 10th from end: ValueError ({error}), list kept: {pool.to_values(copy9)}")
+    benchmark_node_pool()
+    
+    # Test 10: Sort Linked List
+    print("\n10. SORT LINKED LIST")
+    head10 = ListNode(4, ListNode(2, ListNode(1, ListNode(3, ListNode(5, ListNode(0))))))
+    print(f"Original: {print_list(head10)}")
+    print(f"Sorted: {print_list(sort_list(head10))}")
+    benchmark_sort_list()
 
 if __name__ == "__main__":
     test_linked_list_problems()
\ No newline at end of file
@@ -7,8 +7,11 @@ making them essential for many algorithmic solutions.
 """
 
 from collections import defaultdict, Counter
+from array import array
 import heapq
 
+from bitset import Bitset, is_dense
+
 # ============================================================================
 # PROBLEM 1: GROUP ANAGRAMS
 # ============================================================================
@@ -87,7 +90,7 @@ def is_anagram_counter(s, t):
 # ============================================================================
 # PROBLEM 3: TOP K FREQUENT ELEMENTS
 # ============================================================================
-def top_k_frequent(nums, k):
+def top_k_frequent(nums, k, backend=dict):
     """
     Problem: Find k most frequent elements in array.
     
@@ -96,9 +99,17 @@ def top_k_frequent(nums, k):
     Space Complexity: O(n)
     
     Example: nums=[1,1,1,2,2,3], k=2 → [1,2]
+    
+    backend: mapping type for the counts; the default uses Counter, pass
+    IntHashMap for compact int keys.
     """
     # Count frequencies
-    count = Counter(nums)
+    if backend is dict:
+        count = Counter(nums)
+    else:
+        count = backend()
+        for num in nums:
+            count[num] = count.get(num, 0) + 1
     
     # Use min heap to keep k most frequent
     heap = []
@@ -357,7 +368,7 @@ def first_uniq_char(s):
 # ============================================================================
 # PROBLEM 10: SUBARRAY SUM EQUALS K
 # ============================================================================
-def subarray_sum_equals_k(nums, k):
+def subarray_sum_equals_k(nums, k, backend=dict):
     """
     Problem: Count subarrays with sum equal to k.
     
@@ -366,10 +377,13 @@ def subarray_sum_equals_k(nums, k):
     Space Complexity: O(n)
     
     Example: nums=[1,1,1], k=2 → 2
+    
+    backend: mapping type for prefix counts (dict or IntHashMap).
     """
     count = 0
     prefix_sum = 0
-    sum_count = {0: 1}  # prefix_sum -> frequency
+    sum_count = backend()  # prefix_sum -> frequency
+    sum_count[0] = 1
     
     for num in nums:
         prefix_sum += num
@@ -511,7 +525,7 @@ class LRUCache:
 # ============================================================================
 # PROBLEM 13: LONGEST CONSECUTIVE SEQUENCE
 # ============================================================================
-def longest_consecutive(nums):
+def longest_consecutive(nums, backend=dict):
     """
     Problem: Find length of longest consecutive sequence.
     
@@ -520,11 +534,31 @@ def longest_consecutive(nums):
     Space Complexity: O(n)
     
     Example: [100,4,200,1,3,2] → 4 ([1,2,3,4])
+    
+    backend: the default uses a built-in set; a mapping type such as
+    IntHashMap is used as a set through fromkeys(). Bitset stores ints that
+    are dense in their min..max range as one bit per value and finds the
+    longest run of set bits in bulk. It saves memory; speed depends on the
+    data (faster than the set with many repeated values, about 1.5x slower
+    on distinct ones because of the extra min/max scans). Non-dense or
+    non-int input falls back to the set.
     """
     if not nums:
         return 0
     
-    num_set = set(nums)
+    if backend is Bitset:
+        dense, low, high = is_dense(nums)
+        if dense:
+            try:
+                bits = Bitset.from_iterable(nums, low, high)
+            except TypeError:
+                pass  # Non-int values such as floats: use the set
+            else:
+                # Runs of 1s in the binary form are the consecutive sequences
+                return max(map(len, format(int.from_bytes(bits.bits, "little"), "b").split("0")))
+        backend = dict
+    
+    num_set = set(nums) if backend is dict else backend.fromkeys(nums)
     longest = 0
     
     for num in num_set:
@@ -600,6 +634,224 @@ class Twitter:
         """Unfollow a user."""
         self.following[follower_id].discard(followee_id)
 
+# ============================================================================
+# PROBLEM 15: OPEN-ADDRESSING INT HASH MAP
+# ============================================================================
+_EMPTY, _FULL, _DELETED = 0, 1, 2
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15  # 2**64 / golden ratio, for Fibonacci hashing
+
+class IntHashMap:
+    """
+    Compact int -> int hash map for 64-bit keys and values.
+    
+    Keys and values live in two array('q') columns plus a one-byte state
+    per slot (empty / full / tombstone), so an entry costs about 17 bytes
+    per slot instead of a dict entry plus two boxed ints.
+    
+    Approach: linear probing in a power-of-two table. Keys are scattered
+    with Fibonacci hashing (multiply by 2**64/phi, keep the top bits) so
+    sequential keys don't form long clusters. Deletes leave tombstones
+    that inserts reuse; the table is rebuilt once live entries plus
+    tombstones pass the maximum load factor.
+    
+    Supports the dict subset used by the hash-map problems: len, in,
+    [] get/set/del, get, setdefault, pop, keys/values/items, iteration,
+    fromkeys and clear.
+    """
+    
+    MAX_LOAD = 0.7
+    
+    def __init__(self, capacity=8):
+        size = 8
+        while size * self.MAX_LOAD < capacity:
+            size *= 2
+        self._allocate(size)
+    
+    def _allocate(self, size):
+        self._keys = array("q", bytes(8 * size))
+        self._values = array("q", bytes(8 * size))
+        self._states = bytearray(size)
+        self._mask = size - 1
+        self._shift = 64 - (size.bit_length() - 1)
+        self._size = 0
+        self._used = 0  # live entries + tombstones
+        self._limit = int(size * self.MAX_LOAD)
+    
+    @classmethod
+    def fromkeys(cls, keys, value=1):
+        table = cls()
+        for key in keys:
+            table[key] = value
+        return table
+    
+    def __len__(self):
+        return self._size
+    
+    def _find(self, key):
+        """Slot holding key, or -1."""
+        keys, states, mask = self._keys, self._states, self._mask
+        i = ((key * _GOLDEN) & _MASK64) >> self._shift
+        while True:
+            state = states[i]
+            if state == _EMPTY:
+                return -1
+            if state == _FULL and keys[i] == key:
+                return i
+            i = (i + 1) & mask
+    
+    def __contains__(self, key):
+        return self._find(key) >= 0
+    
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+    
+    def get(self, key, default=None):
+        i = self._find(key)
+        return default if i < 0 else self._values[i]
+    
+    def __setitem__(self, key, value):
+        keys, states, mask = self._keys, self._states, self._mask
+        i = ((key * _GOLDEN) & _MASK64) >> self._shift
+        tombstone = -1
+        while True:
+            state = states[i]
+            if state == _EMPTY:
+                break
+            if state == _FULL:
+                if keys[i] == key:
+                    self._values[i] = value
+                    return
+            elif tombstone < 0:
+                tombstone = i
+            i = (i + 1) & mask
+        
+        if tombstone >= 0:
+            # Reuse the first tombstone on the probe path
+            i = tombstone
+        else:
+            if self._used >= self._limit:
+                self._resize()
+                self[key] = value
+                return
+            self._used += 1
+        keys[i] = key
+        self._values[i] = value
+        states[i] = _FULL
+        self._size += 1
+    
+    def setdefault(self, key, default=0):
+        i = self._find(key)
+        if i >= 0:
+            return self._values[i]
+        self[key] = default
+        return default
+    
+    def __delitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        self._states[i] = _DELETED
+        self._size -= 1
+    
+    def pop(self, key, *default):
+        i = self._find(key)
+        if i < 0:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._states[i] = _DELETED
+        self._size -= 1
+        return self._values[i]
+    
+    def _resize(self):
+        """Rebuild into a table sized for the live entries, dropping tombstones."""
+        keys, values, states = self._keys, self._values, self._states
+        size = len(states)
+        # Grow only if live entries (not tombstones) filled the table
+        if self._size * 2 >= self._limit:
+            size *= 2
+        self._allocate(size)
+        for i, state in enumerate(states):
+            if state == _FULL:
+                self[keys[i]] = values[i]
+    
+    def items(self):
+        keys, values = self._keys, self._values
+        for i, state in enumerate(self._states):
+            if state == _FULL:
+                yield keys[i], values[i]
+    
+    def keys(self):
+        keys = self._keys
+        for i, state in enumerate(self._states):
+            if state == _FULL:
+                yield keys[i]
+    
+    def values(self):
+        values = self._values
+        for i, state in enumerate(self._states):
+            if state == _FULL:
+                yield values[i]
+    
+    def __iter__(self):
+        return self.keys()
+    
+    def clear(self):
+        self._allocate(8)
+    
+    def memory_bytes(self):
+        """Bytes held by the table columns."""
+        return self._keys.buffer_info()[1] * 16 + len(self._states)
+    
+    def __repr__(self):
+        return f"IntHashMap({dict(self.items())!r})"
+
+def benchmark_int_hash_map(n=200000):
+    """
+    Memory (tracemalloc) and time for n distinct 64-bit keys: dict vs
+    IntHashMap, plus subarray_sum_equals_k with each backend.
+    """
+    import random
+    import time
+    import tracemalloc
+    
+    rng = random.Random(5)
+    keys = [rng.randrange(-2**62, 2**62) for _ in range(n)]
+    
+    def build(backend):
+        # Negating creates fresh key objects, so a dict pays for boxed
+        # keys and values while IntHashMap lets them be freed
+        table = backend()
+        for i, key in enumerate(keys):
+            table[-key] = i * 1000003
+        return table
+    
+    print(f"n={n} distinct 64-bit keys")
+    print(f"{'backend':<12}{'bytes/entry':>13}{'build ms':>10}{'lookup ms':>11}{'subarray_sum ms':>17}")
+    nums = [rng.randrange(-50, 50) for _ in range(n)]
+    for backend in (dict, IntHashMap):
+        tracemalloc.start()
+        table = build(backend)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        del table
+        start = time.perf_counter()
+        table = build(backend)
+        build_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        for key in keys:
+            table[-key]
+        lookup_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        subarray_sum_equals_k(nums, 7, backend=backend)
+        subarray_ms = (time.perf_counter() - start) * 1e3
+        print(f"{backend.__name__:<12}{memory / n:>13.1f}{build_ms:>10.1f}{lookup_ms:>11.1f}{subarray_ms:>17.1f}")
+
 # ============================================================================
 # TEST FUNCTIONS
 # ============================================================================
@@ -684,6 +936,20 @@ def test_map_problems():
         else:
             result = lru.get(op[1])
             print(f"Get {op[1]} → {result}")
+    
+    # Test 12: Open-addressing int hash map as a backend
+    print("\n12. INT HASH MAP BACKEND")
+    table = IntHashMap()
+    for key in (5, -3, 2**40, 13):
+        table[key] = key * 2
+    del table[-3]
+    table[-3] = 99  # reuses the tombstone
+    print(f"{table}, len={len(table)}, 13 in table: {13 in table}")
+    print(f"subarray_sum_equals_k([1,1,1], 2): {subarray_sum_equals_k([1, 1, 1], 2, backend=IntHashMap)}")
+    print(f"longest_consecutive({nums10}): {longest_consecutive(nums10, backend=IntHashMap)}")
+    print(f"longest_consecutive({nums10}), Bitset: {longest_consecutive(nums10, backend=Bitset)}")
+    print(f"top_k_frequent({nums3}, 2): {sorted(top_k_frequent(nums3, 2, backend=IntHashMap))}")
+    benchmark_int_hash_map()
 
 if __name__ == "__main__":
     test_map_problems()
\ No newline at end of file
@@ -299,15 +299,147 @@ class ArrayQueue:
         print(f"Front index: {self.front}, Rear index: {self.rear}, Size: {self.size}")
 
 
+import heapq
+import itertools
+
+class PriorityHandle:
+    """
+    Handle for one pushed element, returned by PriorityQueue.push() and
+    passed back to update() / cancel().
+    """
+    
+    __slots__ = ("data", "priority", "seq", "queued")
+    
+    def __init__(self, data, priority, seq):
+        self.data = data
+        self.priority = priority
+        self.seq = seq          # Sequence number of the handle's live heap entry
+        self.queued = True
+    
+    def __repr__(self):
+        state = "queued" if self.queued else "done"
+        return f"PriorityHandle({self.data!r}, priority={self.priority}, {state})"
+
+
 class PriorityQueue:
     """
-    Simple priority queue implementation.
-    Higher priority values are dequeued first.
+    Heap-backed priority queue.
+    Higher priority values are dequeued first; equal priorities come out in
+    FIFO (insertion) order.
+    
+    Each heap entry is a tuple (-priority, sequence, handle). The sequence
+    number breaks ties so equal priorities stay stable. Every push is a
+    separate element (duplicates and unhashable data are fine) and returns
+    a PriorityHandle; update() and cancel() take that handle, so no lookup
+    by value is needed. Changing or cancelling an element leaves its old
+    heap entry in place (lazy deletion): an entry is live only while its
+    handle is queued and still carries the entry's sequence number. Dead
+    entries are skipped when popped and the heap is compacted once they
+    outnumber live ones.
+    
+    Time Complexities:
+    - push / enqueue: O(log n)
+    - pop / dequeue: O(log n) amortized
+    - update / cancel: O(log n) / O(1)
+    - peek: O(1) amortized
     """
     
     def __init__(self):
         """Initialize empty priority queue."""
-        self.queue = []  # List of (priority, data) tuples
+        self.heap = []                  # Entries (-priority, seq, handle)
+        self.live = 0                   # Number of queued elements
+        self.counter = itertools.count()  # Tie-breaker for FIFO order
+    
+    def __len__(self):
+        """Number of live elements."""
+        return self.live
+    
+    def push(self, data, priority):
+        """
+        Add data with given priority.
+        
+        Args:
+            data: Element to add
+            priority: Priority value (higher = more important)
+        Returns:
+            PriorityHandle for update() / cancel()
+        """
+        handle = PriorityHandle(data, priority, next(self.counter))
+        heapq.heappush(self.heap, (-priority, handle.seq, handle))
+        self.live += 1
+        return handle
+    
+    def update(self, handle, priority):
+        """
+        Change the priority of a queued element (increase- or decrease-key).
+        A re-prioritised element goes behind others of the same priority.
+        
+        Raises:
+            KeyError: If the handle's element is no longer queued
+        """
+        if not handle.queued:
+            raise KeyError(handle.data)
+        handle.priority = priority
+        handle.seq = next(self.counter)
+        heapq.heappush(self.heap, (-priority, handle.seq, handle))
+        self._maybe_compact()
+    
+    def cancel(self, handle):
+        """
+        Remove a queued element without dequeuing it.
+        
+        Returns:
+            True if the element was queued, False otherwise
+        """
+        if not handle.queued:
+            return False
+        handle.queued = False
+        self.live -= 1
+        self._maybe_compact()
+        return True
+    
+    @staticmethod
+    def _is_live(entry):
+        handle = entry[2]
+        return handle.queued and handle.seq == entry[1]
+    
+    def pop(self):
+        """
+        Remove and return (data, priority) of the highest priority element.
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        heap = self.heap
+        while heap:
+            entry = heapq.heappop(heap)
+            if self._is_live(entry):
+                handle = entry[2]
+                handle.queued = False
+                self.live -= 1
+                return handle.data, handle.priority
+        raise IndexError("pop from an empty priority queue")
+    
+    def peek(self):
+        """
+        Return (data, priority) of the highest priority element without removing it.
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        heap = self.heap
+        # Discard dead entries sitting at the top
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        if not heap:
+            raise IndexError("peek from an empty priority queue")
+        return heap[0][2].data, heap[0][2].priority
+    
+    def _maybe_compact(self):
+        """Rebuild once dead entries dominate so memory stays O(live elements)."""
+        if len(self.heap) > 64 and len(self.heap) > 2 * self.live:
+            self.heap = [entry for entry in self.heap if self._is_live(entry)]
+            heapq.heapify(self.heap)
     
     def enqueue(self, data, priority):
         """
@@ -317,9 +449,7 @@ class PriorityQueue:
             data: Element to add
             priority: Priority value (higher = more important)
         """
-        self.queue.append((priority, data))
-        # Sort by priority (descending order)
-        self.queue.sort(key=lambda x: x[0], reverse=True)
+        self.push(data, priority)
         print(f"Enqueued {data} with priority {priority}")
     
     def dequeue(self):
@@ -333,23 +463,395 @@ class PriorityQueue:
             print("Priority queue is empty!")
             return None
         
-        priority, data = self.queue.pop(0)
+        data, priority = self.pop()
         print(f"Dequeued {data} (priority {priority})")
         return data
     
     def is_empty(self):
         """Check if priority queue is empty."""
-        return len(self.queue) == 0
+        return self.live == 0
     
     def display(self):
-        """Display all elements with their priorities."""
+        """Display all elements with their priorities, in dequeue order."""
         if self.is_empty():
             print("Priority queue is empty")
             return
         
         print("Priority Queue (priority, data):")
-        for priority, data in self.queue:
-            print(f"  ({priority}, {data})")
+        for neg_priority, _, handle in sorted(e for e in self.heap if self._is_live(e)):
+            print(f"  ({-neg_priority}, {handle.data})")
+
+
+import asyncio
+
+
+class AsyncPriorityQueue:
+    """
+    asyncio-native priority queue / work scheduler.
+    
+    Wraps the heap-backed PriorityQueue so that consumer coroutines can
+    `await get()` and sleep until work is available, while producers push,
+    update and cancel pending work without blocking the event loop.
+    Not thread-safe: use it from coroutines running on a single event loop.
+    """
+    
+    def __init__(self):
+        """Initialize empty async priority queue."""
+        self._pq = PriorityQueue()
+        self._not_empty = asyncio.Condition()
+    
+    def __len__(self):
+        """Number of pending elements."""
+        return len(self._pq)
+    
+    def empty(self):
+        """Check if no work is pending."""
+        return len(self._pq) == 0
+    
+    async def put(self, data, priority):
+        """
+        Schedule data with given priority and wake a consumer.
+        Returns a PriorityHandle for update() / cancel().
+        """
+        async with self._not_empty:
+            handle = self._pq.push(data, priority)
+            self._not_empty.notify()
+        return handle
+    
+    def update(self, handle, priority):
+        """Change the priority of pending work. Raises KeyError if not pending."""
+        self._pq.update(handle, priority)
+    
+    def cancel(self, handle):
+        """Cancel pending work. Returns True if it was pending."""
+        return self._pq.cancel(handle)
+    
+    async def get(self):
+        """
+        Wait until work is available, then remove and return (data, priority)
+        of the highest priority element.
+        """
+        async with self._not_empty:
+            # Cancellation can leave the queue empty after a wake-up, so re-check
+            await self._not_empty.wait_for(lambda: len(self._pq) > 0)
+            return self._pq.pop()
+    
+    def get_nowait(self):
+        """
+        Remove and return (data, priority) without waiting.
+        
+        Raises:
+            IndexError: If the queue is empty
+        """
+        return self._pq.pop()
+
+
+import threading
+import time
+from collections import deque
+
+from stdlib_compat import load_stdlib_queue
+
+
+class Empty(Exception):
+    """Raised by BoundedBlockingQueue.get() when no item arrives in time."""
+    pass
+
+
+class Full(Exception):
+    """Raised by BoundedBlockingQueue.put() when no slot frees up in time."""
+    pass
+
+
+class BoundedBlockingQueue:
+    """
+    Thread-safe bounded queue with blocking put/get and backpressure.
+    
+    Unlike Queue(max_size=...), which prints a message and gives up when it is
+    full, producers here can wait for space and consumers can wait for items.
+    Storage is the same circular array used by ArrayQueue, guarded by one lock
+    and two condition variables (not_empty / not_full).
+    
+    Backpressure: when the size climbs to high_watermark, on_high(size) is
+    called once; when it later drains down to low_watermark, on_low(size) is
+    called once. Producers can use these to pause/resume upstream sources.
+    
+    Time Complexities:
+    - put / get: O(1)
+    - get_many: O(k) for k items returned
+    """
+    
+    def __init__(self, max_size, high_watermark=None, low_watermark=None,
+                 on_high=None, on_low=None):
+        """
+        Initialize an empty bounded queue.
+        
+        Args:
+            max_size: Maximum number of elements (must be positive)
+            high_watermark: Size at which on_high fires (defaults to max_size)
+            low_watermark: Size at which on_low fires after a high event (defaults to 0)
+            on_high: Callback on_high(size) when the queue fills up
+            on_low: Callback on_low(size) when the queue has drained
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        
+        self.max_size = max_size
+        self.queue = [None] * max_size  # Circular buffer
+        self.front = 0                  # Index of front element
+        self.rear = 0                   # Index where next element goes
+        self.size = 0                   # Current number of elements
+        
+        self.high_watermark = max_size if high_watermark is None else high_watermark
+        self.low_watermark = 0 if low_watermark is None else low_watermark
+        if not 0 <= self.low_watermark < self.high_watermark <= max_size:
+            raise ValueError("need 0 <= low_watermark < high_watermark <= max_size")
+        self.on_high = on_high
+        self.on_low = on_low
+        self._above_high = False        # True between a high and a low event
+        
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+    
+    def __len__(self):
+        """Approximate number of elements (may change right after returning)."""
+        return self.size
+    
+    def is_empty(self):
+        """Check if queue is empty."""
+        return self.size == 0
+    
+    def is_full(self):
+        """Check if queue is full."""
+        return self.size == self.max_size
+    
+    def _wait(self, condition, predicate, block, timeout, error):
+        """
+        Wait on condition until predicate() is true.
+        Must be called with the lock held. Raises error on timeout/non-blocking.
+        """
+        if predicate():
+            return
+        if not block:
+            raise error
+        if timeout is None:
+            while not predicate():
+                condition.wait()
+        elif timeout < 0:
+            raise ValueError("timeout must be a non-negative number")
+        else:
+            deadline = time.monotonic() + timeout
+            while not predicate():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+    
+    def put(self, item, block=True, timeout=None):
+        """
+        Add an item to the rear of the queue.
+        
+        Args:
+            item: Value to add
+            block: Wait for a free slot if the queue is full
+            timeout: Maximum seconds to wait (None waits forever)
+        
+        Raises:
+            Full: If no slot became free (non-blocking or timed out)
+        """
+        fire_high = False
+        with self._not_full:
+            self._wait(self._not_full, lambda: self.size < self.max_size,
+                       block, timeout, Full())
+            
+            self.queue[self.rear] = item
+            self.rear = (self.rear + 1) % self.max_size
+            self.size += 1
+            size = self.size
+            
+            if not self._above_high and size >= self.high_watermark:
+                self._above_high = True
+                fire_high = True
+            
+            self._not_empty.notify()
+        
+        # Callbacks run outside the lock so they may safely touch the queue
+        if fire_high and self.on_high is not None:
+            self.on_high(size)
+    
+    def put_nowait(self, item):
+        """Add an item without waiting; raises Full if there is no room."""
+        self.put(item, block=False)
+    
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front of the queue.
+        
+        Args:
+            block: Wait for an item if the queue is empty
+            timeout: Maximum seconds to wait (None waits forever)
+        
+        Raises:
+            Empty: If no item arrived (non-blocking or timed out)
+        """
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: self.size > 0,
+                       block, timeout, Empty())
+            item = self._take_front()
+            self._not_full.notify()
+            size, fire_low = self.size, self._check_low()
+        
+        if fire_low and self.on_low is not None:
+            self.on_low(size)
+        return item
+    
+    def get_nowait(self):
+        """Remove and return an item without waiting; raises Empty if none."""
+        return self.get(block=False)
+    
+    def get_many(self, max_n, timeout=None):
+        """
+        Remove up to max_n items in one lock acquisition (consumer batching).
+        
+        Waits (up to timeout seconds) for at least one item, then takes
+        everything available up to max_n without waiting any further.
+        
+        Args:
+            max_n: Maximum number of items to return
+            timeout: Maximum seconds to wait for the first item
+                     (None waits forever, 0 never waits)
+        
+        Returns:
+            List of 1..max_n items in FIFO order
+        
+        Raises:
+            Empty: If no item arrived before the timeout
+        """
+        if max_n <= 0:
+            return []
+        
+        with self._not_empty:
+            self._wait(self._not_empty, lambda: self.size > 0,
+                       timeout != 0, timeout, Empty())
+            
+            count = min(max_n, self.size)
+            batch = [self._take_front() for _ in range(count)]
+            
+            # Several slots freed up at once, wake that many producers
+            self._not_full.notify(count)
+            size, fire_low = self.size, self._check_low()
+        
+        if fire_low and self.on_low is not None:
+            self.on_low(size)
+        return batch
+    
+    def _take_front(self):
+        """Pop the front element of the circular buffer (lock must be held)."""
+        item = self.queue[self.front]
+        self.queue[self.front] = None  # Drop the reference for the GC
+        self.front = (self.front + 1) % self.max_size
+        self.size -= 1
+        return item
+    
+    def _check_low(self):
+        """Return True if a low-watermark event should fire (lock must be held)."""
+        if self._above_high and self.size <= self.low_watermark:
+            self._above_high = False
+            return True
+        return False
+
+
+def benchmark_blocking_queues(producers=4, consumers=4, items_per_producer=20000,
+                              max_size=1024, batch_size=64):
+    """
+    Multi-producer / multi-consumer throughput benchmark.
+    
+    Compares BoundedBlockingQueue (single get and get_many batching) with the
+    standard library queue.Queue and a polling collections.deque.
+    Each consumer stops when it receives a None sentinel.
+    
+    Returns:
+        Dict mapping implementation name to items per second
+    """
+    stdlib_queue = load_stdlib_queue()
+    total = producers * items_per_producer
+    
+    def run(make_producer, make_consumer):
+        threads = [threading.Thread(target=make_producer()) for _ in range(producers)]
+        threads += [threading.Thread(target=make_consumer()) for _ in range(consumers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return total / (time.perf_counter() - start)
+    
+    def with_sentinels(put):
+        """Producer body; the last producer to finish also posts the sentinels."""
+        finished = [0]
+        finished_lock = threading.Lock()
+        
+        def producer():
+            for i in range(items_per_producer):
+                put(i)
+            with finished_lock:
+                finished[0] += 1
+                last = finished[0] == producers
+            if last:
+                for _ in range(consumers):
+                    put(None)
+        return lambda: producer
+    
+    results = {}
+    
+    # 1. BoundedBlockingQueue, one item per get()
+    bq = BoundedBlockingQueue(max_size)
+    
+    def bq_consumer():
+        while bq.get() is not None:
+            pass
+    results["BoundedBlockingQueue.get"] = run(with_sentinels(bq.put), lambda: bq_consumer)
+    
+    # 2. BoundedBlockingQueue, batched get_many()
+    bq = BoundedBlockingQueue(max_size)
+    
+    def bq_batch_consumer():
+        while True:
+            batch = bq.get_many(batch_size)
+            if None in batch:
+                # Put back sentinels that belong to other consumers
+                for _ in range(batch.count(None) - 1):
+                    bq.put(None)
+                return
+    results["BoundedBlockingQueue.get_many"] = run(with_sentinels(bq.put),
+                                                   lambda: bq_batch_consumer)
+    
+    # 3. Standard library queue.Queue (same bound)
+    sq = stdlib_queue.Queue(max_size)
+    
+    def sq_consumer():
+        while sq.get() is not None:
+            pass
+    results["queue.Queue"] = run(with_sentinels(sq.put), lambda: sq_consumer)
+    
+    # 4. collections.deque (unbounded, consumers poll instead of blocking)
+    dq = deque()
+    
+    def dq_consumer():
+        while True:
+            try:
+                if dq.popleft() is None:
+                    return
+            except IndexError:
+                time.sleep(0)  # Nothing yet, yield to other threads
+    results["collections.deque (polling)"] = run(with_sentinels(dq.append),
+                                                 lambda: dq_consumer)
+    
+    print(f"{producers} producers x {items_per_producer} items, {consumers} consumers")
+    for name, rate in results.items():
+        print(f"  {name:<32} {rate:>12,.0f} items/s")
+    return results
 
 
 # Test all queue implementations
@@ -401,9 +903,19 @@ if __name__ == "__main__":
     pq.enqueue("Medium priority task", 3)
     pq.enqueue("Critical task", 10)
     
+    pq.enqueue("Another low priority task", 1)
+    pq.enqueue("Low priority task", 1)  # Duplicates are separate entries
+    
     pq.display()
     
-    # Dequeue based on priority
+    # Change priorities and cancel work before it runs, via push() handles
+    retry = pq.push("Retry task", 2)
+    stale = pq.push("Stale task", 4)
+    pq.update(retry, 7)
+    pq.cancel(stale)
+    print(f"Next up: {pq.peek()}")
+    
+    # Dequeue based on priority (equal priorities keep FIFO order)
     while not pq.is_empty():
         pq.dequeue()
     
@@ -432,4 +944,66 @@ if __name__ == "__main__":
     single_q.enqueue("Single")
     single_q.display()
     single_q.dequeue()
-    single_q.display()
\ No newline at end of file
+    single_q.display()
+    
+    # Test 6: Bounded Blocking Queue
+    print("\n6. Testing Bounded Blocking Queue:")
+    events = []
+    bbq = BoundedBlockingQueue(4, high_watermark=3, low_watermark=1,
+                               on_high=lambda size: events.append(("high", size)),
+                               on_low=lambda size: events.append(("low", size)))
+    for item in "ABCD":
+        bbq.put(item)
+    try:
+        bbq.put_nowait("E")
+    except Full:
+        print("Queue is full, put_nowait raised Full")
+    try:
+        bbq.put("E", timeout=0.05)
+    except Full:
+        print("Timed out waiting for a free slot")
+    
+    # A consumer frees a slot so the blocked producer can continue
+    consumer = threading.Thread(target=lambda: (time.sleep(0.05), bbq.get()))
+    consumer.start()
+    bbq.put("E")  # Blocks until the consumer takes "A"
+    consumer.join()
+    
+    print(f"Batch get: {bbq.get_many(10)}")
+    print(f"Watermark events: {events}")
+    try:
+        bbq.get(timeout=0.05)
+    except Empty:
+        print("Timed out waiting for an item")
+    
+    # Test 7: Throughput benchmark
+    print("\n7. Blocking Queue Throughput Benchmark:")
+    benchmark_blocking_queues()
+    
+    # Test 8: Async Priority Queue
+    print("\n8. Testing Async Priority Queue:")
+    
+    async def async_scheduler_demo():
+        apq = AsyncPriorityQueue()
+        done = []
+        
+        async def worker():
+            while True:
+                task, priority = await apq.get()
+                if task.startswith("stop"):
+                    return
+                done.append(task)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(2)]
+        await apq.put("build", 5)
+        await apq.put("test", 3)
+        deploy = await apq.put("deploy", 1)
+        await apq.put("lint", 3)
+        apq.cancel(deploy)
+        # Lowest-priority stop markers shut the workers down after real work
+        for i in range(len(workers)):
+            await apq.put(f"stop-{i}", float("-inf"))
+        await asyncio.gather(*workers)
+        print(f"Completed in order: {done}")
+    
+    asyncio.run(async_scheduler_demo())
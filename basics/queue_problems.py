@@ -42,6 +42,61 @@ class MyStack:
         """Check if stack is empty."""
         return not self.queue
 
+class DequeStack:
+    """
+    Production version of MyStack: a deque already supports O(1) pushes and
+    pops at the same end, so no rotation is needed at all.
+    
+    Time Complexity: O(1) for push, pop and top
+    Space Complexity: O(n)
+    """
+    
+    def __init__(self):
+        self.queue = deque()
+    
+    def __len__(self):
+        return len(self.queue)
+    
+    def push(self, x):
+        """Add element to top of stack."""
+        self.queue.append(x)
+    
+    def pop(self):
+        """Remove top element from stack."""
+        return self.queue.pop()
+    
+    def top(self):
+        """Get top element without removing."""
+        return self.queue[-1]
+    
+    def empty(self):
+        """Check if stack is empty."""
+        return not self.queue
+
+
+def benchmark_stacks_from_queues(sizes=(1000, 4000, 16000)):
+    """
+    Per-operation cost of MyStack (rotates on every push) vs DequeStack.
+    MyStack's cost grows with n; DequeStack's stays flat.
+    """
+    import time
+    
+    print(f"{'n':>8}{'MyStack ns/op':>16}{'DequeStack ns/op':>19}")
+    for n in sizes:
+        timings = []
+        for cls in (MyStack, DequeStack):
+            stack = cls()
+            start = time.perf_counter()
+            # Adversarial for MyStack: every push rotates the whole queue
+            for i in range(n):
+                stack.push(i)
+                if i % 3 == 0:
+                    stack.pop()
+            while not stack.empty():
+                stack.pop()
+            timings.append((time.perf_counter() - start) / (2 * n) * 1e9)
+        print(f"{n:>8}{timings[0]:>16.0f}{timings[1]:>19.0f}")
+
 # ============================================================================
 # PROBLEM 2: SLIDING WINDOW MAXIMUM
 # ============================================================================
@@ -267,6 +322,115 @@ def num_squares(n):
     
     return level
 
+from array import array
+from math import isqrt
+
+# Shared answer table for num_squares_fast: _squares_table[i] = answer for i.
+# It only ever grows, so every query after the first is a single lookup.
+_squares_table = array('B', [0])
+_SQUARES_TABLE_LIMIT = 10**7  # Above this, answer from the theorems directly
+
+
+def _is_sum_of_two_squares(n):
+    """Check n = a² + b² with a, b >= 1 in O(sqrt(n))."""
+    a = 1
+    while 2 * a * a <= n:
+        b = isqrt(n - a * a)
+        if b * b == n - a * a:
+            return True
+        a += 1
+    return False
+
+
+def _squares_by_theorem(n):
+    """
+    Answer num_squares(n) without a table (n >= 1):
+    - 1 if n is a perfect square
+    - 4 iff n = 4^a * (8b + 7) (Legendre's three-square theorem), O(log n)
+    - 2 if n is a sum of two squares, O(sqrt(n))
+    - 3 otherwise (Lagrange: never more than four)
+    """
+    root = isqrt(n)
+    if root * root == n:
+        return 1
+    m = n
+    while m % 4 == 0:
+        m //= 4
+    if m % 8 == 7:
+        return 4
+    return 2 if _is_sum_of_two_squares(n) else 3
+
+
+def _grow_squares_table(n):
+    """
+    Extend _squares_table to cover 0..n (at least doubling, so growth is
+    amortized). Every new entry starts at 3, then bulk passes stamp:
+    - 4 on the Legendre numbers, as strided slices (4^a*7, step 4^a*8)
+    - 2 on every a² + b² in the new range
+    - 1 on the perfect squares
+    """
+    table = _squares_table
+    old = len(table)
+    new = max(n + 1, 2 * old)
+    table.extend(array('B', [3]) * (new - old))
+    
+    power = 1
+    while 7 * power < new:
+        step = 8 * power
+        # First index >= old of the form power * (8b + 7)
+        first = 7 * power
+        if first < old:
+            first += -(-(old - first) // step) * step
+        count = len(range(first, new, step))
+        if count:
+            table[first:new:step] = array('B', [4]) * count
+        power *= 4
+    
+    a = 1
+    while 2 * a * a < new:
+        # b ranges over a <= b with old <= a² + b² < new
+        b = max(a, isqrt(max(old - a * a - 1, 0)) + 1) if old > a * a else a
+        while a * a + b * b < new:
+            table[a * a + b * b] = 2
+            b += 1
+        a += 1
+    
+    root = isqrt(old - 1) + 1 if old > 0 else 0
+    while root * root < new:
+        table[root * root] = 1
+        root += 1
+
+
+def num_squares_fast(n):
+    """
+    Problem: Same as num_squares, but answered many times.
+    
+    Approach: Lazily grown module-level answer table (one byte per n,
+    array-backed), filled in bulk with the theorems above instead of a BFS
+    per query. Queries beyond _SQUARES_TABLE_LIMIT fall back to the
+    theorems directly (O(1) for 1 and 4, O(sqrt(n)) to tell 2 from 3).
+    
+    Time Complexity: O(1) per query once the table covers n
+    Space Complexity: O(max n seen) bytes, shared by all queries
+    """
+    if n <= 0:
+        return 0
+    if n < len(_squares_table):
+        return _squares_table[n]
+    if n > _SQUARES_TABLE_LIMIT:
+        return _squares_by_theorem(n)
+    _grow_squares_table(n)
+    return _squares_table[n]
+
+
+def num_squares_batch(ns):
+    """Answer num_squares for many n at once, growing the table only once."""
+    ns = list(ns)
+    largest = max((n for n in ns if n <= _SQUARES_TABLE_LIMIT), default=0)
+    if largest >= len(_squares_table):
+        _grow_squares_table(largest)
+    return [num_squares_fast(n) for n in ns]
+
 # ============================================================================
 # PROBLEM 7: WALLS AND GATES
 # ============================================================================
@@ -413,6 +577,200 @@ def open_lock(deadends, target):
     
     return -1
 
+
+class StateSpace:
+    """
+    Implicit graph whose states are the integers 0..num_states-1.
+    
+    The neighbours of every state are computed once into a flat array
+    (state * degree + k -> k-th neighbour, -1 = no neighbour), so searches
+    never build strings or tuples while running.
+    """
+    
+    def __init__(self, num_states, degree, neighbors):
+        """
+        Args:
+            num_states: Number of states
+            degree: Maximum number of neighbours per state
+            neighbors: Function state -> iterable of up to `degree` states
+        """
+        self.num_states = num_states
+        self.degree = degree
+        self.table = array('i', [-1]) * (num_states * degree)
+        for state in range(num_states):
+            base = state * degree
+            for k, nxt in enumerate(neighbors(state)):
+                self.table[base + k] = nxt
+    
+    def neighbors(self, state):
+        base = state * self.degree
+        return [n for n in self.table[base:base + self.degree] if n >= 0]
+
+
+def digit_wheel_space(num_wheels=4, base=10):
+    """
+    Lock with num_wheels wheels of `base` digits: the state is the lock's
+    number and each move turns one wheel one notch up or down.
+    """
+    places = [base ** p for p in range(num_wheels)]
+    
+    def neighbors(state):
+        for place in places:
+            digit = (state // place) % base
+            without = state - digit * place
+            yield without + ((digit + 1) % base) * place
+            yield without + ((digit - 1) % base) * place
+    
+    return StateSpace(base ** num_wheels, 2 * num_wheels, neighbors)
+
+
+# Largest board whose cells**cells state table is practical to build
+_MAX_SLIDING_CELLS = 6
+
+
+def sliding_puzzle_space(rows=2, cols=3):
+    """
+    Sliding puzzle: the board's tiles (0 = blank) read row by row as the
+    digits of a base rows*cols number. Each move swaps the blank with an
+    adjacent tile. Non-permutation numbers are simply never reached.
+    
+    The table covers all cells**cells numbers, so only boards of up to 6
+    cells are accepted: 2x3 needs 46656 states, while 3x3 would already
+    need 9**9 (about 3.9e8) states and several GB of neighbour table.
+    
+    Raises:
+        ValueError: If the board has more than 6 cells
+    """
+    cells = rows * cols
+    if cells > _MAX_SLIDING_CELLS:
+        raise ValueError(f"sliding_puzzle_space supports boards of at most "
+                         f"{_MAX_SLIDING_CELLS} cells, got {rows}x{cols} "
+                         f"({cells}**{cells} states)")
+    places = [cells ** (cells - 1 - i) for i in range(cells)]
+    
+    def neighbors(state):
+        digits = [(state // place) % cells for place in places]
+        if 0 not in digits:
+            return
+        blank = digits.index(0)
+        r, c = divmod(blank, cols)
+        for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols:
+                tile_pos = nr * cols + nc
+                tile = digits[tile_pos]
+                # Move tile into the blank: tile goes to `blank`, 0 to tile_pos
+                yield state + tile * places[blank] - tile * places[tile_pos]
+    
+    return StateSpace(cells ** cells, 4, neighbors)
+
+
+_STATE_SPACE_FACTORIES = {}
+_STATE_SPACES = {}
+
+
+def register_state_space(name, factory):
+    """Register a puzzle; factory() builds its StateSpace on first use."""
+    _STATE_SPACE_FACTORIES[name] = factory
+    _STATE_SPACES.pop(name, None)
+
+
+def get_state_space(name):
+    """Return the (cached) StateSpace registered under name."""
+    if name not in _STATE_SPACES:
+        _STATE_SPACES[name] = _STATE_SPACE_FACTORIES[name]()
+    return _STATE_SPACES[name]
+
+
+register_state_space("lock4", digit_wheel_space)
+register_state_space("sliding2x3", sliding_puzzle_space)
+
+
+def bidirectional_state_search(space, start, target, blocked=()):
+    """
+    Problem: Fewest moves from start to target in an implicit graph,
+    never entering a blocked state.
+    
+    Approach: Bidirectional BFS over the precomputed neighbour table. Each
+    side keeps its visited set as a bitset (one bit per state in a
+    bytearray) plus the depth it reached each state at; blocked states are
+    pre-set in both bitsets. The smaller frontier is grown a whole level at
+    a time, and the best meeting point on that level is the answer.
+    
+    Time Complexity: O(V * degree) worst case, usually far less
+    Space Complexity: O(V) bits per side + O(V) depths
+    """
+    if start == target:
+        return 0 if start not in blocked else -1
+    
+    num_bytes = (space.num_states + 7) >> 3
+    seen = [bytearray(num_bytes), bytearray(num_bytes)]
+    for state in blocked:
+        seen[0][state >> 3] |= 1 << (state & 7)
+        seen[1][state >> 3] |= 1 << (state & 7)
+    for state in (start, target):
+        if seen[0][state >> 3] & (1 << (state & 7)):
+            return -1
+    
+    seen[0][start >> 3] |= 1 << (start & 7)
+    seen[1][target >> 3] |= 1 << (target & 7)
+    depth_of = array('i', [0]) * space.num_states
+    frontiers = [[start], [target]]
+    depths = [0, 0]
+    table, degree = space.table, space.degree
+    
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, theirs = seen[side], seen[1 - side]
+        depth = depths[side] + 1
+        best = -1
+        next_frontier = []
+        
+        for state in frontiers[side]:
+            base = state * degree
+            for nxt in table[base:base + degree]:
+                if nxt < 0:
+                    continue
+                byte, bit = nxt >> 3, 1 << (nxt & 7)
+                if theirs[byte] & bit and not mine[byte] & bit:
+                    # Reached by the other side (blocked states are in both sets)
+                    total = depth + depth_of[nxt]
+                    if best < 0 or total < best:
+                        best = total
+                elif not mine[byte] & bit:
+                    mine[byte] |= bit
+                    depth_of[nxt] = depth
+                    next_frontier.append(nxt)
+        
+        if best >= 0:
+            return best
+        frontiers[side] = next_frontier
+        depths[side] = depth
+    
+    return -1
+
+
+def open_lock_fast(deadends, target):
+    """
+    Open the Lock on the registered "lock4" state space: lock combinations
+    are the integers 0..9999, so no strings are built during the search.
+    """
+    space = get_state_space("lock4")
+    return bidirectional_state_search(space, 0, int(target), {int(d) for d in deadends})
+
+
+def sliding_puzzle(board):
+    """
+    Sliding Puzzle (2x3): fewest moves to reach [[1,2,3],[4,5,0]], or -1,
+    using the registered "sliding2x3" state space.
+    
+    Example: [[1,2,3],[4,0,5]] → 1
+    """
+    space = get_state_space("sliding2x3")
+    encode = lambda tiles: int("".join(map(str, tiles)), 6)
+    start = encode([tile for row in board for tile in row])
+    return bidirectional_state_search(space, start, encode([1, 2, 3, 4, 5, 0]))
+
 # ============================================================================
 # PROBLEM 10: COURSE SCHEDULE II
 # ============================================================================
@@ -455,6 +813,262 @@ def find_order(num_courses, prerequisites):
     # Check if all courses can be taken
     return result if len(result) == num_courses else []
 
+import time
+
+from stdlib_compat import import_concurrent_futures
+
+
+def _timed_call(func, args):
+    """Run func(*args) and return (result, start, end); runs inside the worker."""
+    start = time.monotonic()
+    result = func(*args)
+    return result, start, time.monotonic()
+
+
+class CycleError(ValueError):
+    """Raised when dependencies form a cycle; .cycle lists the offending tasks."""
+    
+    def __init__(self, cycle):
+        self.cycle = cycle
+        super().__init__("dependency cycle: " + " -> ".join(map(str, cycle)))
+
+
+class DAGScheduler:
+    """
+    Problem: find_order gives one flat Kahn ordering, but build/ETL DAGs want
+    to run independent tasks in parallel and start each task the moment its
+    own dependencies are done, not when a whole level is.
+    
+    Approach:
+    - levels(): Kahn's algorithm processed one ready set at a time.
+    - run(): Kahn's algorithm driven by completions. Every task whose
+      in-degree is zero is submitted to a thread or process pool; each time
+      a future finishes its dependents' in-degrees drop and any that reach
+      zero are submitted immediately.
+    - add_dependency() checks reachability before inserting an edge, so a
+      cycle is reported (with the offending path) as soon as it would form.
+    - After a run, stats holds per-task timings and the critical path (the
+      chain of dependent tasks with the largest total duration).
+    
+    Time Complexity: O(V + E) scheduling overhead, O(V + E) per edge check
+    Space Complexity: O(V + E)
+    """
+    
+    def __init__(self):
+        self.tasks = {}         # name -> (func, args)
+        self.dependents = {}    # name -> set of tasks that wait for it
+        self.dependencies = {}  # name -> set of tasks it waits for
+        self.stats = None       # Timing stats of the last run()
+    
+    @classmethod
+    def from_prerequisites(cls, num_tasks, prerequisites, func):
+        """
+        Build a scheduler from find_order-style input: tasks 0..num_tasks-1,
+        [task, prereq] pairs, and func(task) as the work for every task.
+        """
+        scheduler = cls()
+        for task in range(num_tasks):
+            scheduler.add_task(task, func, task)
+        for task, prereq in prerequisites:
+            scheduler.add_dependency(task, prereq)
+        return scheduler
+    
+    def add_task(self, name, func, *args, depends_on=()):
+        """Register task `name` that runs func(*args) after depends_on."""
+        if name in self.tasks:
+            raise ValueError(f"task {name!r} already exists")
+        self.tasks[name] = (func, args)
+        self.dependents.setdefault(name, set())
+        self.dependencies.setdefault(name, set())
+        for dep in depends_on:
+            self.add_dependency(name, dep)
+    
+    def add_dependency(self, task, prereq):
+        """
+        Make task wait for prereq. Either may be added as a task later.
+        
+        Raises:
+            CycleError: If the edge would close a cycle (the edge is not added)
+        """
+        for name in (task, prereq):
+            self.dependents.setdefault(name, set())
+            self.dependencies.setdefault(name, set())
+        
+        # prereq -> task closes a cycle iff prereq is already reachable from task
+        path = self._find_path(task, prereq)
+        if path is not None:
+            raise CycleError(path + [task])
+        
+        self.dependents[prereq].add(task)
+        self.dependencies[task].add(prereq)
+    
+    def _find_path(self, source, target):
+        """Return a dependency path source -> ... -> target, or None (iterative DFS)."""
+        parent = {source: None}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                return path[::-1]
+            for nxt in self.dependents[node]:
+                if nxt not in parent:
+                    parent[nxt] = node
+                    stack.append(nxt)
+        return None
+    
+    def find_cycle(self):
+        """Return one dependency cycle as a list of tasks, or None."""
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color = dict.fromkeys(self.dependents, WHITE)
+        for root in self.dependents:
+            if color[root] != WHITE:
+                continue
+            # Iterative DFS keeping the current path on an explicit stack
+            path = [root]
+            iters = [iter(self.dependents[root])]
+            color[root] = GRAY
+            while iters:
+                for nxt in iters[-1]:
+                    if color[nxt] == GRAY:
+                        return path[path.index(nxt):] + [nxt]
+                    if color[nxt] == WHITE:
+                        color[nxt] = GRAY
+                        path.append(nxt)
+                        iters.append(iter(self.dependents[nxt]))
+                        break
+                else:
+                    color[path.pop()] = BLACK
+                    iters.pop()
+        return None
+    
+    def _check_runnable(self):
+        missing = [name for name in self.dependents if name not in self.tasks]
+        if missing:
+            raise KeyError(f"dependencies without a task: {missing}")
+    
+    def levels(self):
+        """
+        Group tasks into ready sets: level 0 has no dependencies, level k
+        depends only on levels < k.
+        """
+        in_degree = {name: len(deps) for name, deps in self.dependencies.items()}
+        level = [name for name, degree in in_degree.items() if degree == 0]
+        result = []
+        while level:
+            result.append(level)
+            next_level = []
+            for name in level:
+                for dependent in self.dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_level.append(dependent)
+            level = next_level
+        
+        if sum(len(lvl) for lvl in result) != len(in_degree):
+            raise CycleError(self.find_cycle())
+        return result
+    
+    def run(self, executor="thread", max_workers=None):
+        """
+        Execute every task as soon as its dependencies have finished.
+        
+        Args:
+            executor: "thread", "process", or an existing concurrent.futures
+                      Executor (process pools need picklable funcs and args)
+            max_workers: Pool size when the pool is created here
+        
+        Returns:
+            Dict mapping task name to its return value
+        
+        Raises:
+            CycleError: If the dependencies contain a cycle
+            Exception: The first exception raised by a task (no new tasks are
+                       started after a failure)
+        """
+        self._check_runnable()
+        cycle = self.find_cycle()
+        if cycle is not None:
+            raise CycleError(cycle)
+        
+        futures_module = import_concurrent_futures()
+        if executor == "thread":
+            pool, owns_pool = futures_module.ThreadPoolExecutor(max_workers), True
+        elif executor == "process":
+            pool, owns_pool = futures_module.ProcessPoolExecutor(max_workers), True
+        else:
+            pool, owns_pool = executor, False
+        
+        in_degree = {name: len(deps) for name, deps in self.dependencies.items()}
+        results, timings = {}, {}
+        running = {}  # future -> task name
+        
+        def submit(name):
+            func, args = self.tasks[name]
+            running[pool.submit(_timed_call, func, args)] = name
+        
+        run_start = time.monotonic()
+        try:
+            for name, degree in in_degree.items():
+                if degree == 0:
+                    submit(name)
+            
+            while running:
+                done, _ = futures_module.wait(running, return_when=futures_module.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result, start, end = future.result()  # Re-raises task errors
+                    results[name] = result
+                    timings[name] = (start - run_start, end - run_start)
+                    
+                    # Release dependents right away, not at the end of a level
+                    for dependent in self.dependents[name]:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            submit(dependent)
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+        finally:
+            if owns_pool:
+                pool.shutdown(wait=True)
+        
+        self.stats = self._timing_stats(timings, time.monotonic() - run_start)
+        return results
+    
+    def _timing_stats(self, timings, wall_time):
+        """Per-task durations plus the critical (longest-duration) path."""
+        durations = {name: end - start for name, (start, end) in timings.items()}
+        
+        # Longest path DP over a topological order
+        best, previous = {}, {}
+        for level in self.levels():
+            for name in level:
+                prereq = max(self.dependencies[name], key=lambda d: best[d], default=None)
+                best[name] = durations[name] + (best[prereq] if prereq is not None else 0.0)
+                previous[name] = prereq
+        
+        end = max(best, key=best.get, default=None)
+        path = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+        path.reverse()
+        
+        busy = sum(durations.values())
+        return {
+            "wall_time": wall_time,
+            "task_times": timings,          # name -> (start, end) from run start
+            "durations": durations,
+            "critical_path": path,
+            "critical_path_time": sum(durations[name] for name in path),
+            "parallelism": busy / wall_time if wall_time > 0 else 0.0,
+        }
+
 # ============================================================================
 # PROBLEM 11: DESIGN HIT COUNTER
 # ============================================================================
@@ -482,6 +1096,114 @@ class HitCounter:
         
         return len(self.hits)
 
+import itertools
+import math
+import threading
+
+
+class BucketedHitCounter:
+    """
+    Problem: Same as HitCounter, but at 100k hits/s the timestamp queue grows
+    to millions of entries and get_hits pops them one by one.
+    
+    Approach: Fixed circular array of per-slot counters plus a running total.
+    A timestamp maps to slot = timestamp // resolution; the bucket for a slot
+    is slot % num_buckets. Moving forward in time zeroes the buckets that fell
+    out of the window and subtracts them from the total, so memory depends
+    only on window / resolution, never on the number of hits.
+    Timestamps are expected to be (mostly) non-decreasing, as in HitCounter;
+    hits older than the window are ignored.
+    
+    Time Complexity: O(1) amortized for hit and get_hits
+    Space Complexity: O(window / resolution)
+    """
+    
+    def __init__(self, window=300, resolution=1):
+        self.resolution = resolution
+        self.num_buckets = max(1, math.ceil(window / resolution))
+        self.counts = [0] * self.num_buckets
+        self.total = 0
+        self.current_slot = None  # Newest slot seen so far
+    
+    def _advance(self, slot):
+        """Move the window forward to slot, expiring buckets that fell out."""
+        if self.current_slot is None:
+            self.current_slot = slot
+            return
+        if slot <= self.current_slot:
+            return
+        
+        if slot - self.current_slot >= self.num_buckets:
+            # The whole window expired at once
+            self.counts = [0] * self.num_buckets
+            self.total = 0
+        else:
+            counts, n = self.counts, self.num_buckets
+            for s in range(self.current_slot + 1, slot + 1):
+                bucket = s % n
+                self.total -= counts[bucket]
+                counts[bucket] = 0
+        self.current_slot = slot
+    
+    def hit(self, timestamp, count=1):
+        """Record count hits at given timestamp."""
+        slot = int(timestamp // self.resolution)
+        self._advance(slot)
+        if slot <= self.current_slot - self.num_buckets:
+            return  # Older than the window
+        self.counts[slot % self.num_buckets] += count
+        self.total += count
+    
+    def get_hits(self, timestamp):
+        """Get number of hits in the window ending at timestamp."""
+        self._advance(int(timestamp // self.resolution))
+        return self.total
+
+
+class ShardedHitCounter:
+    """
+    Problem: Record hits from many threads at once without every thread
+    fighting over a single lock.
+    
+    Approach: Split the counter into independent BucketedHitCounter shards,
+    each with its own lock. Each thread is handed a shard round-robin on its
+    first hit and keeps it (thread idents are aligned addresses, so taking
+    them modulo the shard count would put every thread on shard 0).
+    Writers on different shards never contend; get_hits sums all shards.
+    
+    Time Complexity: O(1) amortized hit, O(shards) get_hits
+    Space Complexity: O(shards * window / resolution)
+    """
+    
+    def __init__(self, window=300, resolution=1, num_shards=16):
+        self.shards = [BucketedHitCounter(window, resolution) for _ in range(num_shards)]
+        self.locks = [threading.Lock() for _ in range(num_shards)]
+        self._next_shard = itertools.count()
+        self._local = threading.local()
+    
+    def _shard_index(self):
+        """This thread's shard, assigned round-robin on first use."""
+        try:
+            return self._local.index
+        except AttributeError:
+            # next() on itertools.count is atomic under the GIL
+            self._local.index = next(self._next_shard) % len(self.shards)
+            return self._local.index
+    
+    def hit(self, timestamp, count=1):
+        """Record count hits at given timestamp (safe to call from any thread)."""
+        index = self._shard_index()
+        with self.locks[index]:
+            self.shards[index].hit(timestamp, count)
+    
+    def get_hits(self, timestamp):
+        """Get number of hits in the window ending at timestamp, across all shards."""
+        total = 0
+        for shard, lock in zip(self.shards, self.locks):
+            with lock:
+                total += shard.get_hits(timestamp)
+        return total
+
 # ============================================================================
 # PROBLEM 12: MOVING AVERAGE FROM DATA STREAM
 # ============================================================================
@@ -511,6 +1233,771 @@ class MovingAverage:
         
         return self.total / len(self.queue)
 
+
+class WindowStats(MovingAverage):
+    """
+    Problem: Extend MovingAverage into a streaming statistics engine for a
+    metrics pipeline: windowed min/max, mean, variance and quantiles over
+    either the last `size` values or the last `duration` seconds.
+    
+    Approach:
+    - Min/max: the monotonic deque from max_sliding_window (one increasing
+      deque for min, one decreasing for max), storing (index, value) so
+      expired entries are recognised at the front.
+    - Mean/variance: Welford's update, plus its inverse when a value leaves
+      the window, which avoids the cancellation error of sum-of-squares.
+      extend() folds a whole batch in at once with Chan's parallel merge.
+    - Quantiles: log-bucketed histogram (DDSketch style). Each value goes to
+      bucket ceil(log_gamma(|x|)), so any answer is within
+      relative_accuracy of a true value in the window; removing a value is
+      just a decrement.
+    
+    Time Complexity: O(1) amortized per value, O(buckets) per quantile query
+    Space Complexity: O(window) values + O(log(max/min) / accuracy) buckets
+    """
+    
+    def __init__(self, size=None, duration=None, relative_accuracy=0.01):
+        if (size is None) == (duration is None):
+            raise ValueError("give exactly one of size (count window) or duration (time window)")
+        if size is not None and size <= 0:
+            raise ValueError("size must be positive")
+        super().__init__(size)
+        self.duration = duration
+        self.queue = deque()      # (index, timestamp, value) in arrival order
+        self.next_index = 0       # Index of the next value to arrive
+        self.mean = 0.0           # Welford running mean
+        self.m2 = 0.0             # Welford sum of squared deviations
+        self.removals = 0         # Removals since mean/M2 were recomputed
+        self.min_dq = deque()     # (index, value), values increasing
+        self.max_dq = deque()     # (index, value), values decreasing
+        
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}         # bucket key -> count
+    
+    def __len__(self):
+        return len(self.queue)
+    
+    def _bucket_key(self, value):
+        """Sortable histogram key: negatives < zero < positives."""
+        if value > 0:
+            return (1, math.ceil(math.log(value) / self.log_gamma))
+        if value < 0:
+            return (-1, -math.ceil(math.log(-value) / self.log_gamma))
+        return (0, 0)
+    
+    def _bucket_value(self, key):
+        """Representative value of a histogram bucket."""
+        sign, k = key
+        if sign == 0:
+            return 0.0
+        k = k if sign > 0 else -k
+        return sign * 2 * self.gamma ** k / (self.gamma + 1)
+    
+    def _append(self, index, timestamp, value):
+        """Add one value to the deques and histogram (not Welford)."""
+        self.queue.append((index, timestamp, value))
+        self.total += value
+        
+        min_dq, max_dq = self.min_dq, self.max_dq
+        while min_dq and min_dq[-1][1] >= value:
+            min_dq.pop()
+        min_dq.append((index, value))
+        while max_dq and max_dq[-1][1] <= value:
+            max_dq.pop()
+        max_dq.append((index, value))
+        
+        key = self._bucket_key(value)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+    
+    def _pop_oldest(self):
+        """Remove the oldest value from every structure."""
+        index, _, value = self.queue.popleft()
+        self.total -= value
+        
+        # Inverse Welford step
+        n = len(self.queue)
+        if n == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / n
+            self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+        
+        # Removal leaks a little rounding error each time (badly so once large
+        # values have left), so recompute exactly after every window's worth of
+        # removals. The O(window) rebuild is amortized to O(1) per removal.
+        self.removals += 1
+        if self.removals >= n:
+            self._rebuild_moments()
+        
+        if self.min_dq[0][0] == index:
+            self.min_dq.popleft()
+        if self.max_dq[0][0] == index:
+            self.max_dq.popleft()
+        
+        key = self._bucket_key(value)
+        if self.buckets[key] == 1:
+            del self.buckets[key]
+        else:
+            self.buckets[key] -= 1
+    
+    def _rebuild_moments(self):
+        """Recompute mean and M2 exactly from the values in the window."""
+        self.removals = 0
+        n = len(self.queue)
+        if n == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        self.mean = math.fsum(v for _, _, v in self.queue) / n
+        self.m2 = math.fsum((v - self.mean) ** 2 for _, _, v in self.queue)
+    
+    def _evict(self, now):
+        """Drop values that are outside the window."""
+        if self.duration is None:
+            while len(self.queue) > self.size:
+                self._pop_oldest()
+        else:
+            cutoff = now - self.duration
+            while self.queue and self.queue[0][1] <= cutoff:
+                self._pop_oldest()
+    
+    def add(self, value, timestamp=None):
+        """
+        Add one value. For time windows, timestamp defaults to time.monotonic()
+        and must not go backwards.
+        """
+        if self.duration is not None and timestamp is None:
+            timestamp = time.monotonic()
+        
+        self._append(self.next_index, timestamp, value)
+        self.next_index += 1
+        
+        # Welford step
+        n = len(self.queue)
+        delta = value - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (value - self.mean)
+        
+        self._evict(timestamp)
+    
+    def next(self, val, timestamp=None):
+        """Add new value and return moving average (MovingAverage API)."""
+        self.add(val, timestamp)
+        return self.mean
+    
+    def extend(self, values, timestamps=None):
+        """
+        Add a batch of values in one call.
+        
+        Args:
+            values: Sequence of numbers
+            timestamps: Matching non-decreasing timestamps (time windows only;
+                        defaults to time.monotonic() for the whole batch)
+        """
+        values = list(values)
+        if not values:
+            return
+        if self.duration is None:
+            timestamps = [None] * len(values)
+            # Only the last `size` values can survive, skip the rest
+            if len(values) >= self.size:
+                values = values[-self.size:]
+                timestamps = timestamps[-self.size:]
+                self._reset()
+        elif timestamps is None:
+            timestamps = [time.monotonic()] * len(values)
+        else:
+            timestamps = list(timestamps)
+            if len(timestamps) != len(values):
+                raise ValueError("values and timestamps must have the same length")
+        
+        index = self.next_index
+        for value, timestamp in zip(values, timestamps):
+            self._append(index, timestamp, value)
+            index += 1
+        self.next_index = index
+        
+        # Merge the batch's (n, mean, M2) into the running stats (Chan et al.)
+        n_b = len(values)
+        mean_b = math.fsum(values) / n_b
+        m2_b = math.fsum((v - mean_b) ** 2 for v in values)
+        n_a = len(self.queue) - n_b
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        
+        self._evict(timestamps[-1])
+    
+    def advance(self, now):
+        """Expire old values of a time window without adding anything."""
+        if self.duration is not None:
+            self._evict(now)
+    
+    def _reset(self):
+        self.queue.clear()
+        self.min_dq.clear()
+        self.max_dq.clear()
+        self.buckets.clear()
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.removals = 0
+    
+    def min(self):
+        """Smallest value in the window."""
+        return self.min_dq[0][1] if self.min_dq else None
+    
+    def max(self):
+        """Largest value in the window."""
+        return self.max_dq[0][1] if self.max_dq else None
+    
+    def variance(self, sample=False):
+        """Population variance (or sample variance with sample=True)."""
+        n = len(self.queue)
+        if n - sample <= 0:
+            return 0.0
+        return self.m2 / (n - sample)
+    
+    def stddev(self, sample=False):
+        """Standard deviation of the window."""
+        return math.sqrt(self.variance(sample))
+    
+    def quantile(self, q):
+        """
+        Approximate q-quantile (0 <= q <= 1) of the window,
+        within relative_accuracy of a true value.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        n = len(self.queue)
+        if n == 0:
+            return None
+        
+        rank = q * (n - 1)
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                estimate = self._bucket_value(key)
+                # Exact extremes are known, never answer outside them
+                return min(max(estimate, self.min()), self.max())
+        return self.max()
+
+# ============================================================================
+# PROBLEM 13: INDEXED PRIORITY QUEUE (DIJKSTRA / A* ON WEIGHTED GRIDS)
+# ============================================================================
+class IndexedPriorityQueue:
+    """
+    Problem: Min-priority queue keyed by item id that supports changing or
+    removing an item's priority, as needed by Dijkstra, A* and schedulers.
+    
+    Approach: Binary min-heap of keys plus a position map (key -> heap index)
+    so any key can be found in O(1) and sifted up/down in O(log n).
+    Unlike pushing duplicates into heapq, each key appears at most once.
+    Priorities can be any comparable values, e.g. (f, h) tuples for A*.
+    
+    Time Complexity: O(log n) push/pop/update/remove, O(1) contains/peek
+    Space Complexity: O(n)
+    """
+    
+    def __init__(self):
+        self.heap = []        # Keys arranged as a binary min-heap
+        self.priority = {}    # key -> current priority
+        self.position = {}    # key -> index in heap
+    
+    def __len__(self):
+        return len(self.heap)
+    
+    def __contains__(self, key):
+        return key in self.position
+    
+    def contains(self, key):
+        """Check if key is queued."""
+        return key in self.position
+    
+    def get_priority(self, key):
+        """Return the current priority of key (KeyError if absent)."""
+        return self.priority[key]
+    
+    def push(self, key, priority):
+        """Insert a new key. Raises KeyError if the key is already queued."""
+        if key in self.position:
+            raise KeyError(f"{key!r} is already in the queue")
+        self.priority[key] = priority
+        self.position[key] = len(self.heap)
+        self.heap.append(key)
+        self._sift_up(len(self.heap) - 1)
+    
+    def update(self, key, priority):
+        """Change the priority of a queued key (either direction)."""
+        old = self.priority[key]
+        self.priority[key] = priority
+        if priority < old:
+            self._sift_up(self.position[key])
+        else:
+            self._sift_down(self.position[key])
+    
+    def push_or_decrease(self, key, priority):
+        """
+        Insert key, or lower its priority if the new one is better.
+        This is the relaxation step of Dijkstra/A*.
+        
+        Returns:
+            True if the queue changed
+        """
+        if key not in self.position:
+            self.push(key, priority)
+            return True
+        if priority < self.priority[key]:
+            self.update(key, priority)
+            return True
+        return False
+    
+    def peek(self):
+        """Return (key, priority) with the smallest priority without removing it."""
+        if not self.heap:
+            raise IndexError("peek from an empty priority queue")
+        key = self.heap[0]
+        return key, self.priority[key]
+    
+    def pop(self):
+        """Remove and return (key, priority) with the smallest priority."""
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        key = self.heap[0]
+        self._remove_at(0)
+        return key, self.priority.pop(key)
+    
+    def remove(self, key):
+        """Remove key from the queue and return its priority."""
+        self._remove_at(self.position[key])
+        return self.priority.pop(key)
+    
+    def _remove_at(self, index):
+        """Remove the key at heap index by swapping in the last key."""
+        heap = self.heap
+        key = heap[index]
+        last = heap.pop()
+        del self.position[key]
+        if index < len(heap):
+            heap[index] = last
+            self.position[last] = index
+            # The moved key may need to go either way
+            self._sift_up(index)
+            self._sift_down(self.position[last])
+    
+    def _sift_up(self, index):
+        heap, priority, position = self.heap, self.priority, self.position
+        key = heap[index]
+        key_priority = priority[key]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_key = heap[parent]
+            if not key_priority < priority[parent_key]:
+                break
+            heap[index] = parent_key
+            position[parent_key] = index
+            index = parent
+        heap[index] = key
+        position[key] = index
+    
+    def _sift_down(self, index):
+        heap, priority, position = self.heap, self.priority, self.position
+        n = len(heap)
+        key = heap[index]
+        key_priority = priority[key]
+        while True:
+            child = 2 * index + 1
+            if child >= n:
+                break
+            # Pick the smaller child
+            if child + 1 < n and priority[heap[child + 1]] < priority[heap[child]]:
+                child += 1
+            child_key = heap[child]
+            if not priority[child_key] < key_priority:
+                break
+            heap[index] = child_key
+            position[child_key] = index
+            index = child
+        heap[index] = key
+        position[key] = index
+
+
+def shortest_path_weighted(grid, start=None, end=None, diagonal=True, use_astar=True):
+    """
+    Problem: Weighted version of shortest_path_binary_matrix. Each cell holds
+    the cost of stepping onto it; -1 marks a wall. Find the cheapest path cost
+    from start to end, counting the start cell too (so an all-ones grid
+    gives the same answer as the unweighted BFS).
+    
+    Approach: Dijkstra with an IndexedPriorityQueue keyed by cell id
+    (row * cols + col), so relaxing a cell lowers its key in place instead of
+    pushing duplicate heap entries. With use_astar, the priority becomes
+    (g + h, h) where h is the Chebyshev (8 directions) or Manhattan
+    (4 directions) distance times the cheapest cell cost, which never
+    overestimates and therefore keeps the answer optimal.
+    
+    Time Complexity: O(V log V) with V = rows * cols
+    Space Complexity: O(V)
+    
+    Example: [[1,1,5],[-1,9,1],[1,1,1]] from (0,0) to (2,2) → 4
+    """
+    if not grid or not grid[0]:
+        return -1
+    
+    rows, cols = len(grid), len(grid[0])
+    start = start or (0, 0)
+    end = end or (rows - 1, cols - 1)
+    sr, sc = start
+    er, ec = end
+    if grid[sr][sc] < 0 or grid[er][ec] < 0:
+        return -1
+    
+    if diagonal:
+        directions = [(-1,-1), (-1,0), (-1,1), (0,-1), (0,1), (1,-1), (1,0), (1,1)]
+    else:
+        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    
+    # Cheapest possible step, used to scale the heuristic
+    min_cost = min((cost for row in grid for cost in row if cost >= 0), default=0)
+    
+    def heuristic(r, c):
+        if not use_astar:
+            return 0
+        dr, dc = abs(r - er), abs(c - ec)
+        steps = max(dr, dc) if diagonal else dr + dc
+        return steps * min_cost
+    
+    goal = er * cols + ec
+    dist = {sr * cols + sc: grid[sr][sc]}
+    pq = IndexedPriorityQueue()
+    h = heuristic(sr, sc)
+    pq.push(sr * cols + sc, (grid[sr][sc] + h, h))
+    
+    while pq:
+        cell, _ = pq.pop()
+        if cell == goal:
+            return dist[cell]
+        
+        row, col = divmod(cell, cols)
+        base = dist[cell]
+        for dr, dc in directions:
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] >= 0:
+                neighbor = nr * cols + nc
+                new_dist = base + grid[nr][nc]
+                if new_dist < dist.get(neighbor, float("inf")):
+                    dist[neighbor] = new_dist
+                    h = heuristic(nr, nc)
+                    pq.push_or_decrease(neighbor, (new_dist + h, h))
+    
+    return -1
+
+# ============================================================================
+# PROBLEM 14: FLAT-ARRAY GRID BFS ENGINE
+# ============================================================================
+import heapq
+
+
+_OPEN_TABLE = bytes([0]) + bytes([1]) * 255  # byte value -> 0/1 open flag
+
+
+class GridBFS:
+    """
+    Problem: oranges_rotting, walls_and_gates and shortest_path_binary_matrix
+    each hand-roll BFS over lists of lists, which costs a Python object per
+    cell and a bounds check per neighbour. On 10k x 10k floor plans the
+    memory layout dominates.
+    
+    Approach: Store the grid once as a flat bytearray (1 = open, 0 = blocked)
+    surrounded by a one-cell wall border. Cell (r, c) lives at index
+    (r + 1) * width + (c + 1), so every neighbour is index + offset with
+    precomputed offsets and the border removes all bounds checks. Distances
+    live in array('i'), visited marks in a copy of the bytearray.
+    
+    Searches:
+    - multi_source(): level-by-level BFS from many starts at once
+    - bidirectional(): BFS from both ends, always growing the smaller side
+    - astar(): best-first search with a Manhattan (4-way) or Chebyshev
+      (8-way) heuristic
+    
+    Time Complexity: O(rows * cols) per search
+    Space Complexity: 1 byte per cell for the grid, 4 bytes per cell for distances
+    """
+    
+    def __init__(self, grid, open_values=(0,), diagonal=False):
+        """
+        Args:
+            grid: List of rows; cells whose value is in open_values are passable
+            open_values: Values that count as open cells
+            diagonal: Allow 8-directional moves instead of 4
+        """
+        rows = len(grid)
+        cols = len(grid[0]) if rows else 0
+        open_values = set(open_values)
+        mask = bytearray(rows * cols)
+        for r, row in enumerate(grid):
+            mask[r * cols:(r + 1) * cols] = bytes(1 if v in open_values else 0 for v in row)
+        self._build(rows, cols, mask, diagonal)
+    
+    @classmethod
+    def from_mask(cls, rows, cols, mask, diagonal=False):
+        """
+        Build directly from a row-major bytes-like mask (non-zero = open),
+        skipping the list-of-lists stage entirely for huge grids.
+        """
+        engine = cls.__new__(cls)
+        engine._build(rows, cols, mask, diagonal)
+        return engine
+    
+    def _build(self, rows, cols, mask, diagonal):
+        self.rows, self.cols = rows, cols
+        width = cols + 2
+        self.width = width
+        self.size = (rows + 2) * width
+        
+        # Padded grid: border cells stay 0 (blocked)
+        self.open = bytearray(self.size)
+        for r in range(rows):
+            start = (r + 1) * width + 1
+            # translate() maps every non-zero byte to 1 at C speed
+            self.open[start:start + cols] = bytes(mask[r * cols:(r + 1) * cols]).translate(_OPEN_TABLE)
+        
+        self.diagonal = diagonal
+        self.offsets = [-width, width, -1, 1]
+        if diagonal:
+            self.offsets += [-width - 1, -width + 1, width - 1, width + 1]
+    
+    def index(self, row, col):
+        """Flat index of cell (row, col)."""
+        return (row + 1) * self.width + col + 1
+    
+    def cell(self, index):
+        """(row, col) of a flat index."""
+        r, c = divmod(index, self.width)
+        return r - 1, c - 1
+    
+    def is_open(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.open[self.index(row, col)] == 1
+    
+    def multi_source(self, sources, max_distance=None):
+        """
+        BFS from every source at once.
+        
+        Args:
+            sources: Iterable of (row, col) start cells (blocked ones are ignored)
+            max_distance: Stop expanding after this many steps
+        
+        Returns:
+            array('i') of distances indexed by flat index (-1 = unreachable);
+            use distance_at() or to_rows() to read it
+        """
+        dist = array('i', [-1]) * self.size
+        unseen = bytearray(self.open)  # 1 = open and not yet reached
+        offsets = self.offsets
+        
+        frontier = []
+        for row, col in sources:
+            i = self.index(row, col)
+            if unseen[i]:
+                unseen[i] = 0
+                dist[i] = 0
+                frontier.append(i)
+        
+        depth = 0
+        while frontier and (max_distance is None or depth < max_distance):
+            depth += 1
+            next_frontier = []
+            append = next_frontier.append
+            for i in frontier:
+                for off in offsets:
+                    j = i + off
+                    if unseen[j]:
+                        unseen[j] = 0
+                        dist[j] = depth
+                        append(j)
+            frontier = next_frontier
+        
+        return dist
+    
+    def distance_at(self, dist, row, col):
+        """Read a distance returned by multi_source()."""
+        return dist[self.index(row, col)]
+    
+    def to_rows(self, dist):
+        """Convert a distance array back into a list of rows (for small grids)."""
+        width = self.width
+        return [list(dist[(r + 1) * width + 1:(r + 1) * width + 1 + self.cols])
+                for r in range(self.rows)]
+    
+    def bidirectional(self, start, goal):
+        """
+        Number of steps on a shortest path from start to goal, or -1.
+        
+        Grows whichever frontier is smaller; when a level touches the other
+        side, the best meeting point on that level gives the answer.
+        """
+        if not (self.is_open(*start) and self.is_open(*goal)):
+            return -1
+        s, g = self.index(*start), self.index(*goal)
+        if s == g:
+            return 0
+        
+        side = bytearray(self.size)       # 0 = unseen, 1 = from start, 2 = from goal
+        dist = array('i', [0]) * self.size
+        side[s], side[g] = 1, 2
+        frontiers = {1: [s], 2: [g]}
+        depths = {1: 0, 2: 0}
+        open_cells, offsets = self.open, self.offsets
+        
+        while frontiers[1] and frontiers[2]:
+            mine = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+            other = 3 - mine
+            depth = depths[mine] + 1
+            best = -1
+            next_frontier = []
+            for i in frontiers[mine]:
+                for off in offsets:
+                    j = i + off
+                    if not open_cells[j]:
+                        continue
+                    owner = side[j]
+                    if owner == other:
+                        total = depth + dist[j]
+                        if best < 0 or total < best:
+                            best = total
+                    elif owner == 0:
+                        side[j] = mine
+                        dist[j] = depth
+                        next_frontier.append(j)
+            if best >= 0:
+                return best
+            frontiers[mine] = next_frontier
+            depths[mine] = depth
+        
+        return -1
+    
+    def astar(self, start, goal):
+        """
+        Number of steps on a shortest path from start to goal, or -1.
+        Uses Chebyshev distance for 8-way grids and Manhattan for 4-way,
+        both exact lower bounds on the remaining steps.
+        """
+        if not (self.is_open(*start) and self.is_open(*goal)):
+            return -1
+        s, g = self.index(*start), self.index(*goal)
+        goal_row, goal_col = divmod(g, self.width)
+        width, diagonal = self.width, self.diagonal
+        
+        def heuristic(i):
+            r, c = divmod(i, width)
+            dr, dc = abs(r - goal_row), abs(c - goal_col)
+            return max(dr, dc) if diagonal else dr + dc
+        
+        best = array('i', [-1]) * self.size  # Best known steps to each cell
+        best[s] = 0
+        heap = [(heuristic(s), 0, s)]
+        open_cells, offsets = self.open, self.offsets
+        
+        while heap:
+            _, steps, i = heapq.heappop(heap)
+            if i == g:
+                return steps
+            if steps > best[i]:
+                continue  # Stale entry
+            steps += 1
+            for off in offsets:
+                j = i + off
+                if open_cells[j] and (best[j] < 0 or steps < best[j]):
+                    best[j] = steps
+                    heapq.heappush(heap, (steps + heuristic(j), steps, j))
+        
+        return -1
+
+
+def oranges_rotting_flat(grid):
+    """
+    Rotting Oranges on GridBFS: multi-source BFS from every rotten orange
+    over the cells that hold an orange. Same answer as oranges_rotting,
+    without modifying grid.
+    """
+    if not grid or not grid[0]:
+        return 0
+    engine = GridBFS(grid, open_values=(1, 2))
+    rotten = [(r, c) for r, row in enumerate(grid) for c, v in enumerate(row) if v == 2]
+    fresh = sum(row.count(1) for row in grid)
+    if fresh == 0:
+        return 0
+    
+    dist = engine.multi_source(rotten)
+    reached = [d for d in dist if d > 0]
+    if len(reached) != fresh:
+        return -1
+    return max(reached)
+
+
+def walls_and_gates_flat(rooms):
+    """Walls and Gates on GridBFS: multi-source BFS from every gate, in place."""
+    if not rooms or not rooms[0]:
+        return
+    INF = 2**31 - 1
+    engine = GridBFS(rooms, open_values=(0, INF))
+    gates = [(r, c) for r, row in enumerate(rooms) for c, v in enumerate(row) if v == 0]
+    dist_rows = engine.to_rows(engine.multi_source(gates))
+    for r, row in enumerate(rooms):
+        for c, v in enumerate(row):
+            if v == INF and dist_rows[r][c] > 0:
+                row[c] = dist_rows[r][c]
+
+
+def shortest_path_binary_matrix_flat(grid):
+    """
+    Shortest Path in Binary Matrix on GridBFS: 8-way bidirectional BFS.
+    Returns the number of cells on the path, like shortest_path_binary_matrix.
+    """
+    n = len(grid)
+    steps = GridBFS(grid, open_values=(0,), diagonal=True).bidirectional((0, 0), (n - 1, n - 1))
+    return steps + 1 if steps >= 0 else -1
+
+
+def benchmark_grid_bfs(size=1000, wall_ratio=0.2, seed=42):
+    """
+    Compare shortest_path_binary_matrix (lists of lists + set of tuples)
+    with GridBFS bidirectional search and A* on a random size x size grid.
+    """
+    import random
+    
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < wall_ratio else 0 for _ in range(size)] for _ in range(size)]
+    grid[0][0] = grid[-1][-1] = 0
+    
+    start = time.perf_counter()
+    expected = shortest_path_binary_matrix(grid)
+    list_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    engine = GridBFS(grid, diagonal=True)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    bidir = engine.bidirectional((0, 0), (size - 1, size - 1))
+    bidir_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    astar = engine.astar((0, 0), (size - 1, size - 1))
+    astar_time = time.perf_counter() - start
+    
+    print(f"{size}x{size} grid, {wall_ratio:.0%} walls, path length {expected}")
+    print(f"  lists + BFS:          {list_time:.3f}s")
+    print(f"  GridBFS build:        {build_time:.3f}s "
+          f"({engine.size:,} bytes for the grid)")
+    print(f"  GridBFS bidirectional {bidir_time:.3f}s → {bidir + 1 if bidir >= 0 else -1}")
+    print(f"  GridBFS A*:           {astar_time:.3f}s → {astar + 1 if astar >= 0 else -1}")
+
 # ============================================================================
 # TEST FUNCTIONS
 # ============================================================================
@@ -527,6 +2014,11 @@ def test_queue_problems():
     stack.push(2)
     print(f"Operations: {operations}")
     print(f"Top: {stack.top()}, Pop: {stack.pop()}, Empty: {stack.empty()}")
+    deque_stack = DequeStack()
+    deque_stack.push(1)
+    deque_stack.push(2)
+    print(f"DequeStack → Top: {deque_stack.top()}, Pop: {deque_stack.pop()}, Empty: {deque_stack.empty()}")
+    benchmark_stacks_from_queues()
     
     # Test 2: Sliding Window Maximum
     print("\n2. SLIDING WINDOW MAXIMUM")
@@ -550,18 +2042,40 @@ def test_queue_problems():
     print("\n4. ROTTING ORANGES")
     grid = [[2,1,1],[1,1,0],[0,1,1]]
     print("Grid:", grid)
+    print(f"Minutes to rot all (flat grid engine): {oranges_rotting_flat(grid)}")
     print(f"Minutes to rot all: {oranges_rotting(grid)}")
     
     # Test 5: Perfect Squares
     print("\n5. PERFECT SQUARES")
     for n in [12, 13, 1]:
         print(f"n={n} → {num_squares(n)} perfect squares")
+    queries = [12, 13, 1, 7, 28, 9999991, 10**12 + 7]
+    print(f"Batch (table + theorems): {dict(zip(queries, num_squares_batch(queries)))}")
     
     # Test 6: Shortest Path in Binary Matrix
     print("\n6. SHORTEST PATH IN BINARY MATRIX")
     matrix = [[0,0,0],[1,1,0],[1,1,0]]
     print("Matrix:", matrix)
     print(f"Shortest path: {shortest_path_binary_matrix(matrix)}")
+    # Same grid as costs: open cell = 1, blocked cell = wall (-1)
+    weighted = [[1 if cell == 0 else -1 for cell in row] for row in matrix]
+    print(f"Weighted (all ones) Dijkstra: {shortest_path_weighted(weighted, use_astar=False)}")
+    costs = [[1, 1, 5], [-1, 9, 1], [1, 1, 1]]
+    print(f"Costs: {costs}")
+    print(f"Cheapest path cost (A*): {shortest_path_weighted(costs)}")
+    print(f"Flat grid engine (bidirectional): {shortest_path_binary_matrix_flat(matrix)}")
+    engine = GridBFS(matrix, diagonal=True)
+    print(f"Flat grid engine (A*): {engine.astar((0, 0), (2, 2)) + 1}")
+    benchmark_grid_bfs(size=500)
+    
+    # Open the Lock / sliding puzzle on the integer state-space engine
+    print("\n6b. OPEN THE LOCK")
+    deadends = ["0201", "0101", "0102", "1212", "2002"]
+    print(f"Deadends: {deadends}, target: 0202")
+    print(f"Steps (string BFS): {open_lock(deadends, '0202')}")
+    print(f"Steps (integer state space): {open_lock_fast(deadends, '0202')}")
+    board = [[4, 1, 2], [5, 0, 3]]
+    print(f"Sliding puzzle {board} → {sliding_puzzle(board)} moves")
     
     # Test 7: Course Schedule
     print("\n7. COURSE SCHEDULE II")
@@ -569,15 +2083,88 @@ def test_queue_problems():
     prerequisites = [[1,0],[2,0],[3,1],[3,2]]
     print(f"Courses: {num_courses}, Prerequisites: {prerequisites}")
     print(f"Order: {find_order(num_courses, prerequisites)}")
-    
-    # Test 8: Moving Average
-    print("\n8. MOVING AVERAGE")
+    print(f"Parallel levels: {DAGScheduler.from_prerequisites(num_courses, prerequisites, str).levels()}")
+    
+    # Build DAG: each task sleeps for its cost; "link" only waits for "compile_b"
+    costs = {"fetch": 0.02, "compile_a": 0.08, "compile_b": 0.02,
+             "link": 0.02, "test": 0.02}
+    dag = DAGScheduler()
+    dag.add_task("fetch", time.sleep, costs["fetch"])
+    dag.add_task("compile_a", time.sleep, costs["compile_a"], depends_on=["fetch"])
+    dag.add_task("compile_b", time.sleep, costs["compile_b"], depends_on=["fetch"])
+    dag.add_task("link", time.sleep, costs["link"], depends_on=["compile_b"])
+    dag.add_task("test", time.sleep, costs["test"], depends_on=["compile_a", "link"])
+    dag.run(executor="thread", max_workers=4)
+    stats = dag.stats
+    print(f"DAG levels: {dag.levels()}")
+    print(f"Wall time: {stats['wall_time']:.2f}s, critical path: "
+          f"{' -> '.join(stats['critical_path'])} ({stats['critical_path_time']:.2f}s)")
+    
+    # The same scheduler on a process pool (builtins pickle fine)
+    cpu_dag = DAGScheduler()
+    for i in range(4):
+        cpu_dag.add_task(f"fact{i}", math.factorial, 2000 + i)
+    cpu_dag.add_task("sum", sum, [1, 2, 3], depends_on=[f"fact{i}" for i in range(4)])
+    print(f"Process pool result: sum → {cpu_dag.run(executor='process', max_workers=2)['sum']}")
+    
+    try:
+        dag.add_dependency("fetch", "test")
+    except CycleError as error:
+        print(f"Rejected edge: {error}")
+    
+    # Test 8: Hit Counters
+    print("\n8. HIT COUNTER")
+    basic, bucketed = HitCounter(), BucketedHitCounter(window=300, resolution=1)
+    events = [("hit", 1), ("hit", 2), ("hit", 3), ("get", 4), ("hit", 300),
+              ("get", 300), ("get", 301), ("get", 900)]
+    for op, t in events:
+        if op == "hit":
+            basic.hit(t)
+            bucketed.hit(t)
+        else:
+            print(f"  get_hits({t}) → {basic.get_hits(t)} (bucketed: {bucketed.get_hits(t)})")
+    
+    # 100k hits per second for 10 seconds, counted by several threads
+    sharded = ShardedHitCounter(window=60, resolution=1, num_shards=8)
+    
+    def record():
+        for second in range(10):
+            sharded.hit(second, count=25000)
+    
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"Sharded counter, 1,000,000 hits in 60s window: {sharded.get_hits(9):,} "
+          f"using {len(sharded.shards)} x {sharded.shards[0].num_buckets} buckets")
+    used = sum(1 for shard in sharded.shards if shard.get_hits(9))
+    print(f"Shards written by {len(threads)} threads: {used}")
+    
+    # Test 9: Moving Average
+    print("\n9. MOVING AVERAGE")
     ma = MovingAverage(3)
     values = [1, 10, 3, 5]
     print("Values and averages:")
     for val in values:
         avg = ma.next(val)
         print(f"  Add {val} → Average: {avg:.2f}")
+    
+    # Test 10: Window Statistics
+    print("\n10. WINDOW STATISTICS")
+    stats = WindowStats(size=3)
+    for val in values:
+        stats.next(val)
+    print(f"Last 3 of {values}: min={stats.min()}, max={stats.max()}, "
+          f"mean={stats.mean:.2f}, variance={stats.variance():.2f}, "
+          f"median≈{stats.quantile(0.5):.2f}")
+    
+    latencies = WindowStats(duration=60, relative_accuracy=0.01)
+    timestamps = list(range(120))
+    latencies.extend([10 + (t % 50) for t in timestamps], timestamps)
+    print(f"Latencies over last 60s: min={latencies.min()}, max={latencies.max()}, "
+          f"p50≈{latencies.quantile(0.5):.1f}, p99≈{latencies.quantile(0.99):.1f}, "
+          f"stddev={latencies.stddev():.2f}")
 
 if __name__ == "__main__":
     test_queue_problems()
\ No newline at end of file
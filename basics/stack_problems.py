@@ -407,6 +407,1196 @@ def remove_k_digits(num, k):
     result = ''.join(stack).lstrip('0')
     return result if result else '0'
 
+# ============================================================================
+# PROBLEM 13: COMPILED EXPRESSION EVALUATOR (PARSE ONCE, EVALUATE MANY)
+# ============================================================================
+from functools import lru_cache
+import operator
+import re
+
+try:
+    import numpy as np  # Optional: only needed for evaluate_vectorized()
+except ImportError:
+    np = None
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+\.\d*|\.\d+|\d+)|([A-Za-z_]\w*)|(.))")
+# Unary minus in RPN output. It contains '-', so it can never be a name token
+_UNARY_MINUS = 'u-'
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, _UNARY_MINUS: 3}
+
+
+def _divide(a, b):
+    """Division matching eval_rpn: integers truncate toward zero, floats don't."""
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        result = np.true_divide(a, b)
+        if np.issubdtype(np.result_type(a, b), np.integer):
+            return np.trunc(result).astype(np.result_type(a, b))
+        return result
+    if isinstance(a, int) and isinstance(b, int):
+        # Exact even for huge integers, where int(a / b) would lose precision
+        q = abs(a) // abs(b)
+        return q if (a >= 0) == (b >= 0) else -q
+    return a / b
+
+
+_BINARY_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': _divide}
+_PUSH_CONST, _PUSH_VAR, _NEGATE, _BINARY = range(4)
+
+
+class CompiledExpression:
+    """
+    An infix expression parsed once into Reverse Polish Notation.
+    
+    Supports numbers, variables, + - * / with the usual precedence,
+    unary minus/plus and parentheses. The RPN is stored twice: as tokens
+    (self.rpn) and as a small opcode program that evaluate() runs on a
+    stack without re-tokenising the source.
+    
+    self.rpn is not eval_rpn input in general: unary minus appears as the
+    extra token 'u-', variable names appear as tokens, and numbers are kept
+    as source text (possibly floats). Only an expression with integer
+    literals, no variables and no unary minus gives tokens eval_rpn accepts.
+    """
+    
+    def __init__(self, source):
+        self.source = source
+        self.rpn = self._to_rpn(source)
+        self.variables = frozenset(t for t in self.rpn if t[0].isalpha() or t[0] == '_') - {_UNARY_MINUS}
+        self.program = []
+        for token in self.rpn:
+            if token == _UNARY_MINUS:
+                self.program.append((_NEGATE, None))
+            elif token in _BINARY_OPS:
+                self.program.append((_BINARY, _BINARY_OPS[token]))
+            elif token in self.variables:
+                self.program.append((_PUSH_VAR, token))
+            else:
+                number = float(token) if '.' in token else int(token)
+                self.program.append((_PUSH_CONST, number))
+    
+    @staticmethod
+    def _to_rpn(source):
+        """
+        Shunting-yard: convert infix tokens to RPN tokens.
+        A '-' or '+' is unary when it starts the expression or follows an
+        operator or '('.
+        """
+        output, operators = [], []
+        expect_operand = True  # True where a number/variable/'(' must come next
+        position = 0
+        
+        for match in _TOKEN_RE.finditer(source):
+            number, name, symbol = match.groups()
+            position = match.start()
+            if number is not None or name is not None:
+                if not expect_operand:
+                    raise ValueError(f"unexpected operand at position {position} in {source!r}")
+                output.append(number if number is not None else name)
+                expect_operand = False
+            elif symbol == '(':
+                if not expect_operand:
+                    raise ValueError(f"unexpected '(' at position {position} in {source!r}")
+                operators.append('(')
+            elif symbol == ')':
+                if expect_operand:
+                    raise ValueError(f"unexpected ')' at position {position} in {source!r}")
+                while operators and operators[-1] != '(':
+                    output.append(operators.pop())
+                if not operators:
+                    raise ValueError(f"unmatched ')' at position {position} in {source!r}")
+                operators.pop()
+            elif symbol in _BINARY_OPS:
+                if expect_operand:
+                    if symbol == '-':
+                        operators.append(_UNARY_MINUS)
+                    elif symbol != '+':  # Unary plus is a no-op
+                        raise ValueError(f"unexpected {symbol!r} at position {position} in {source!r}")
+                    continue
+                # Left-associative: pop operators of equal or higher precedence
+                while (operators and operators[-1] != '(' and
+                       _PRECEDENCE[operators[-1]] >= _PRECEDENCE[symbol]):
+                    output.append(operators.pop())
+                operators.append(symbol)
+                expect_operand = True
+            elif symbol is not None and not symbol.isspace():
+                raise ValueError(f"unexpected character {symbol!r} at position {position} in {source!r}")
+        
+        if expect_operand:
+            raise ValueError(f"incomplete expression {source!r}")
+        while operators:
+            op = operators.pop()
+            if op == '(':
+                raise ValueError(f"unmatched '(' in {source!r}")
+            output.append(op)
+        return output
+    
+    def evaluate(self, variables=None, **kwargs):
+        """
+        Evaluate with the given variable bindings.
+        
+        Example: compile_expression("x * (y + 2)").evaluate(x=3, y=4) → 18
+        """
+        if kwargs:
+            variables = {**(variables or {}), **kwargs}
+        stack = []
+        push, pop = stack.append, stack.pop
+        for op, arg in self.program:
+            if op == _PUSH_CONST:
+                push(arg)
+            elif op == _PUSH_VAR:
+                push(variables[arg])
+            elif op == _NEGATE:
+                push(-pop())
+            else:
+                b = pop()
+                push(arg(pop(), b))
+        return stack[0]
+    
+    def evaluate_many(self, bindings):
+        """
+        Evaluate once per mapping in bindings. This is a plain loop over
+        evaluate(): the program is compiled once, but each binding still
+        runs it separately. See evaluate_vectorized for a single pass over
+        whole columns.
+        """
+        evaluate = self.evaluate
+        return [evaluate(variables) for variables in bindings]
+    
+    def evaluate_vectorized(self, columns):
+        """
+        Evaluate over whole NumPy arrays at once, one array per variable,
+        so the stack program runs once instead of once per row.
+        
+        Args:
+            columns: Mapping variable name -> sequence/array of values
+        
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("evaluate_vectorized requires NumPy")
+        arrays = {name: np.asarray(columns[name]) for name in self.variables}
+        return self.evaluate(arrays)
+    
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source):
+    """
+    Problem: Rule engines evaluate the same expressions millions of times;
+    calculate() and eval_rpn() re-tokenise the string on every call.
+    
+    Approach: Parse once (shunting-yard to RPN) and keep the compiled form in
+    an LRU cache keyed by the source string.
+    Time Complexity: O(n) on a cache miss, O(1) on a hit; O(n) per evaluation
+    Space Complexity: O(n) per cached expression, at most 1024 kept
+    """
+    return CompiledExpression(source)
+
+
+def evaluate_expression(source, variables=None, **kwargs):
+    """Compile (cached) and evaluate source in one call."""
+    return compile_expression(source).evaluate(variables, **kwargs)
+
+
+# decode_string's output only depends on its input, so repeated inputs
+# can be served straight from an LRU cache.
+decode_string_cached = lru_cache(maxsize=1024)(decode_string)
+
+
+def benchmark_compiled_expressions(rows=20000):
+    """Compare calculate() per call with one compiled expression over many rows."""
+    import time
+    
+    source = "(1+(4+5+2)-3)+(6+8)"
+    start = time.perf_counter()
+    for _ in range(rows):
+        calculate(source)
+    calc_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _ in range(rows):
+        evaluate_expression(source)
+    compiled_time = time.perf_counter() - start
+    
+    rule = compile_expression("price * qty - discount / 2")
+    bindings = [{"price": i % 100, "qty": i % 7, "discount": i % 13} for i in range(rows)]
+    start = time.perf_counter()
+    rule.evaluate_many(bindings)
+    many_time = time.perf_counter() - start
+    
+    print(f"{rows} evaluations:")
+    print(f"  calculate() each time:    {calc_time:.3f}s")
+    print(f"  cached compiled form:     {compiled_time:.3f}s")
+    print(f"  evaluate_many (3 vars):   {many_time:.3f}s")
+    if np is not None:
+        columns = {name: np.array([b[name] for b in bindings]) for name in rule.variables}
+        start = time.perf_counter()
+        rule.evaluate_vectorized(columns)
+        print(f"  evaluate_vectorized:      {time.perf_counter() - start:.3f}s")
+
+# ============================================================================
+# PROBLEM 14: STREAMING BRACKET VALIDATION (CHUNK-FED)
+# ============================================================================
+class StreamingBracketValidator:
+    """
+    Problem: is_valid_parentheses needs the whole string in memory, but
+    payloads can be many gigabytes. Validate them chunk by chunk instead.
+    
+    Approach: Same stack algorithm, fed incrementally. Only the stack of
+    still-open brackets survives between chunks (one byte each in a
+    bytearray). Each chunk is first stripped down to its bracket bytes with
+    bytes.translate (done in C), so non-bracket bytes cost almost nothing;
+    the remaining brackets are matched through a 256-entry lookup table
+    instead of dict checks. Characters other than brackets are ignored.
+    
+    By default every bracket byte counts, including ones inside string
+    literals, so '{"msg": ":)"}' is reported as unbalanced. Pass quotes
+    (e.g. '"' for JSON) to skip quoted strings with backslash escapes. One
+    regex substitution (also in C) cuts complete strings out of each chunk
+    before the bracket scan. Two bits of state (the open quote and a
+    pending escape) carry over between chunks.
+    
+    Time Complexity: O(n) over all chunks
+    Space Complexity: O(depth) - the nesting depth, not the input size
+    
+    Example: feed(b'{"a": [1, 2'); feed(b']}'); finish() → True
+    """
+    
+    def __init__(self, pairs="()[]{}", quotes=""):
+        """
+        Args:
+            pairs: Opening/closing bracket characters, two per pair
+            quotes: Characters that open and close string literals whose
+                    contents (with backslash escapes) are not checked
+        """
+        pairs = pairs.encode("ascii")
+        self.openers = bytes(pairs[0::2])
+        self.closers = bytes(pairs[1::2])
+        # match[closer] = its opener; 0 for every other byte
+        self.match = [0] * 256
+        for opener, closer in zip(self.openers, self.closers):
+            self.match[closer] = opener
+        brackets = set(self.openers + self.closers)
+        self.is_bracket = bytes(1 if b in brackets else 0 for b in range(256))
+        self.non_brackets = bytes(b for b in range(256) if b not in brackets)
+        
+        self.quotes = quotes.encode("ascii")
+        if self.quotes:
+            # string_rest[q]: rest of a q-quoted string, up to and including
+            # its closing quote, or to the end of the chunk (noting a
+            # trailing backslash). strings: complete string literals.
+            self.string_rest = {}
+            literals = []
+            for quote in self.quotes:
+                q = re.escape(bytes([quote]))
+                body = b"(?:[^" + q + b"\\\\]|\\\\.)*"
+                self.string_rest[quote] = re.compile(body + b"(?:(" + q + b")|(\\\\)?\\Z)", re.S)
+                literals.append(q + body + q)
+            self.strings = re.compile(b"|".join(literals), re.S)
+            self.quote_finder = re.compile(b"[" + re.escape(self.quotes) + b"]")
+        self.open_quote = 0           # Quote byte of the string we are in, 0 outside strings
+        self.escape_pending = False   # Previous chunk ended in a backslash inside a string
+        
+        self.stack = bytearray()  # Unclosed opening brackets
+        self.offset = 0           # Bytes consumed so far
+        self.error_offset = None  # Byte offset of the first error
+        self.error = None         # Description of the first error
+    
+    def feed(self, chunk):
+        """
+        Validate the next chunk (bytes, or str which is UTF-8 encoded so
+        offsets stay byte offsets).
+        
+        Returns:
+            False once an error has been found, True otherwise
+        """
+        if self.error is not None:
+            return False
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if self.quotes:
+            return self._feed_with_strings(chunk)
+        
+        brackets = chunk.translate(None, self.non_brackets)
+        stack, match = self.stack, self.match
+        for i, byte in enumerate(brackets):
+            opener = match[byte]
+            if not opener:
+                stack.append(byte)
+            elif stack and stack[-1] == opener:
+                stack.pop()
+            else:
+                expected = "end of input" if not stack else repr(chr(self._closer_for(stack[-1])))
+                self._fail(self._position_of_bracket(chunk, i),
+                           f"unexpected {chr(byte)!r}, expected {expected}")
+                return False
+        
+        self.offset += len(chunk)
+        return True
+    
+    def _feed_with_strings(self, chunk):
+        """
+        feed() when quotes are set. Complete string literals are cut out with
+        one regex substitution, so only the bytes between strings are
+        scanned for brackets.
+        """
+        if not chunk:
+            return True
+        start = 0
+        if self.open_quote:
+            # Finish the string left open by the previous chunk
+            rest = self.string_rest[self.open_quote].match(chunk, 1 if self.escape_pending else 0)
+            closed, backslash = rest.groups()
+            if closed is None:
+                self.escape_pending = backslash is not None
+                self.offset += len(chunk)
+                return True
+            start = rest.end()
+            self.open_quote = 0
+            self.escape_pending = False
+        
+        outside = self.strings.sub(b"", chunk[start:])
+        # Any quote left over opens a string that runs past the chunk's end
+        unclosed = self.quote_finder.search(outside)
+        if unclosed is not None:
+            outside = outside[:unclosed.start()]
+        
+        stack, match = self.stack, self.match
+        for i, byte in enumerate(outside.translate(None, self.non_brackets)):
+            opener = match[byte]
+            if not opener:
+                stack.append(byte)
+            elif stack and stack[-1] == opener:
+                stack.pop()
+            else:
+                expected = "end of input" if not stack else repr(chr(self._closer_for(stack[-1])))
+                self._fail(self._position_outside_strings(chunk, start, i),
+                           f"unexpected {chr(byte)!r}, expected {expected}")
+                return False
+        
+        if unclosed is not None:
+            self.open_quote = unclosed.group()[0]
+            # Inside a string, an odd run of trailing backslashes escapes the next byte
+            trailing = len(chunk) - len(chunk.rstrip(b"\\"))
+            self.escape_pending = trailing % 2 == 1
+        self.offset += len(chunk)
+        return True
+    
+    def _position_outside_strings(self, chunk, start, index):
+        """Byte offset of the index-th bracket outside strings (only used on errors)."""
+        is_bracket = self.is_bracket
+        position = start
+        while position < len(chunk):
+            byte = chunk[position]
+            if byte in self.quotes:
+                position = self.string_rest[byte].match(chunk, position + 1).end()
+                continue
+            if is_bracket[byte]:
+                if index == 0:
+                    return position
+                index -= 1
+            position += 1
+        return len(chunk)
+    
+    def finish(self):
+        """
+        Signal end of input.
+        
+        Returns:
+            True if everything fed so far was balanced
+        """
+        if self.error is None and self.open_quote:
+            self._fail(0, f"unterminated {chr(self.open_quote)} string")
+        if self.error is None and self.stack:
+            self._fail(0, f"{len(self.stack)} unclosed bracket(s), "
+                          f"innermost {chr(self.stack[-1])!r}")
+        return self.error is None
+    
+    def _closer_for(self, opener):
+        return self.closers[self.openers.index(opener)]
+    
+    def _position_of_bracket(self, chunk, index):
+        """Byte offset in chunk of its index-th bracket (only used on errors)."""
+        is_bracket = self.is_bracket
+        for position, byte in enumerate(chunk):
+            if is_bracket[byte]:
+                if index == 0:
+                    return position
+                index -= 1
+        return len(chunk)
+    
+    def _fail(self, position, message):
+        self.error_offset = self.offset + position
+        self.error = f"{message} at byte {self.error_offset}"
+
+
+class StreamingStarValidator:
+    """
+    Problem: checkValidString ('(', ')' and '*' as wildcard) over a stream.
+    
+    Approach: The range-tracking solution needs no stack at all, only the
+    minimum and maximum possible number of open '(' so far. Chunks are
+    stripped to '(', ')' and '*' with bytes.translate, like above.
+    
+    Time Complexity: O(n) over all chunks
+    Space Complexity: O(1)
+    """
+    
+    _NON_STAR_BRACKETS = bytes(b for b in range(256) if b not in b"()*")
+    _OPEN, _CLOSE = ord('('), ord(')')
+    
+    def __init__(self):
+        self.min_open = 0
+        self.max_open = 0
+        self.offset = 0
+        self.error_offset = None
+        self.error = None
+    
+    def feed(self, chunk):
+        """Validate the next chunk; returns False once an error has been found."""
+        if self.error is not None:
+            return False
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        
+        min_open, max_open = self.min_open, self.max_open
+        OPEN, CLOSE = self._OPEN, self._CLOSE
+        for i, byte in enumerate(chunk.translate(None, self._NON_STAR_BRACKETS)):
+            if byte == OPEN:
+                min_open += 1
+                max_open += 1
+            elif byte == CLOSE:
+                min_open -= 1
+                max_open -= 1
+                if max_open < 0:
+                    # Find the offending ')' in the original chunk
+                    position = [p for p, b in enumerate(chunk) if b in b"()*"][i]
+                    self.error_offset = self.offset + position
+                    self.error = f"unmatched ')' at byte {self.error_offset}"
+                    return False
+            else:  # '*' may be '(', ')' or nothing
+                min_open -= 1
+                max_open += 1
+            if min_open < 0:
+                min_open = 0
+        
+        self.min_open, self.max_open = min_open, max_open
+        self.offset += len(chunk)
+        return True
+    
+    def finish(self):
+        """Signal end of input; returns True if the stream can be balanced."""
+        if self.error is None and self.min_open > 0:
+            self.error_offset = self.offset
+            self.error = f"{self.min_open} unclosed '(' at byte {self.offset}"
+        return self.error is None
+
+
+def validate_stream(chunks, validator=None):
+    """
+    Run a validator over an iterable of chunks (e.g. a file read in blocks).
+    
+    Returns:
+        The validator, whose error/error_offset describe the first problem
+    
+    Example:
+        with open(path, "rb") as f:
+            v = validate_stream(iter(lambda: f.read(1 << 20), b""))
+    """
+    validator = validator or StreamingBracketValidator()
+    for chunk in chunks:
+        if not validator.feed(chunk):
+            break
+    validator.finish()
+    return validator
+
+# ============================================================================
+# PROBLEM 15: PARALLEL BRACKET MATCHING (PREFIX-SUM STYLE REDUCTION)
+# ============================================================================
+import os
+
+from stdlib_compat import import_concurrent_futures
+
+
+def reduce_bracket_chunk(chunk, pairs="()[]{}"):
+    """
+    Reduce one chunk to its unmatched brackets: (closers, openers) where
+    closers are the ')' with no '(' in the chunk (in order) and openers the
+    '(' still open at its end (bottom to top). For a single bracket type this
+    is exactly the (unmatched-close, unmatched-open) count pair.
+    Returns None if the chunk contains a mismatch such as '(]'.
+    """
+    pairs_b = pairs.encode("ascii")
+    openers, closers_set = pairs_b[0::2], pairs_b[1::2]
+    match = [0] * 256
+    for o, c in zip(openers, closers_set):
+        match[c] = o
+    non_brackets = bytes(b for b in range(256) if b not in pairs_b)
+    
+    unmatched_closers = bytearray()
+    stack = bytearray()
+    for byte in chunk.translate(None, non_brackets):
+        opener = match[byte]
+        if not opener:
+            stack.append(byte)
+        elif stack:
+            if stack.pop() != opener:
+                return None
+        else:
+            unmatched_closers.append(byte)
+    return bytes(unmatched_closers), bytes(stack)
+
+
+def combine_bracket_summaries(left, right, pairs="()[]{}"):
+    """
+    Associatively combine two adjacent chunk summaries: the left chunk's open
+    brackets are matched against the right chunk's unmatched closers.
+    """
+    if left is None or right is None:
+        return None
+    closers_l, openers_l = left
+    closers_r, openers_r = right
+    pairs_b = pairs.encode("ascii")
+    opener_of = {c: o for o, c in zip(pairs_b[0::2], pairs_b[1::2])}
+    
+    k = min(len(openers_l), len(closers_r))
+    for i in range(k):
+        if openers_l[len(openers_l) - 1 - i] != opener_of[closers_r[i]]:
+            return None
+    return (closers_l + closers_r[k:], openers_l[:len(openers_l) - k] + openers_r)
+
+
+def reduce_star_chunk(chunk):
+    """
+    Reduce a chunk of the '(' / ')' / '*' language to the four numbers that
+    describe its effect on checkValidString's (min_open, max_open) range:
+    - max_open:  out = in + hi_delta, valid only if in >= hi_need
+    - min_open:  out = max(in + lo_shift, lo_floor)   (the clamp at 0)
+    Composing "x -> max(x + a, b)" maps stays in that form, which is what
+    makes the reduction associative.
+    """
+    lo_shift, lo_floor = 0, 0
+    hi_delta, hi_need = 0, 0
+    for byte in chunk.translate(None, StreamingStarValidator._NON_STAR_BRACKETS):
+        if byte == 40:    # '('
+            lo_shift += 1
+            lo_floor += 1
+            hi_delta += 1
+        else:
+            if byte == 41:  # ')'
+                hi_delta -= 1
+                if -hi_delta > hi_need:
+                    hi_need = -hi_delta
+            else:           # '*'
+                hi_delta += 1
+            # min_open = max(min_open - 1, 0)
+            lo_shift -= 1
+            lo_floor = max(lo_floor - 1, 0)
+    return lo_shift, lo_floor, hi_delta, hi_need
+
+
+def combine_star_summaries(left, right):
+    """Associatively combine two adjacent reduce_star_chunk summaries."""
+    shift1, floor1, delta1, need1 = left
+    shift2, floor2, delta2, need2 = right
+    return (shift1 + shift2,
+            max(floor1 + shift2, floor2),
+            delta1 + delta2,
+            max(need1, need2 - delta1))
+
+
+def _reduce_file_range(path, start, end, star, pairs):
+    """Worker: read bytes [start, end) of path and reduce them."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    return reduce_star_chunk(chunk) if star else reduce_bracket_chunk(chunk, pairs)
+
+
+def _reduce_bytes(chunk, star, pairs):
+    """Worker: reduce an in-memory chunk."""
+    return reduce_star_chunk(chunk) if star else reduce_bracket_chunk(chunk, pairs)
+
+
+def _is_valid_summary(summary, star):
+    if star:
+        lo_shift, lo_floor, _, hi_need = summary
+        # Start from (0, 0): max_open never dips below 0, min_open ends at 0
+        return hi_need <= 0 and max(lo_shift, lo_floor) == 0
+    return summary is not None and summary == (b"", b"")
+
+
+def parallel_validate(data=None, path=None, workers=None, chunk_size=None,
+                      star=False, pairs="()[]{}"):
+    """
+    Problem: Validate huge bracket inputs (bytes in memory, or a file) using
+    every CPU core.
+    
+    Approach: Split the input into one chunk per worker, reduce each chunk in
+    a process pool to a small summary (unmatched brackets, or the min/max
+    range transform for the '*' language), then fold the summaries left to
+    right. Because combining is associative the chunks are independent, so
+    the expensive part scales with the number of cores. File inputs are
+    read by the workers themselves, so only offsets cross process borders.
+    
+    Time Complexity: O(n / workers + workers * summary size)
+    Space Complexity: O(chunk size) per worker
+    
+    Args:
+        data: bytes to validate (or give path)
+        path: File to validate
+        workers: Number of processes (default: CPU count)
+        chunk_size: Bytes per task (default: input size / workers)
+        star: Validate the '(' / ')' / '*' language instead of bracket pairs
+        pairs: Bracket pairs for the plain language
+    """
+    if (data is None) == (path is None):
+        raise ValueError("give exactly one of data or path")
+    workers = workers or os.cpu_count() or 1
+    size = len(data) if data is not None else os.path.getsize(path)
+    chunk_size = chunk_size or max(1, -(-size // workers))
+    bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    
+    if workers == 1 or len(bounds) <= 1:
+        if data is not None:
+            summaries = [_reduce_bytes(data[a:b], star, pairs) for a, b in bounds]
+        else:
+            summaries = [_reduce_file_range(path, a, b, star, pairs) for a, b in bounds]
+    else:
+        futures_module = import_concurrent_futures()
+        with futures_module.ProcessPoolExecutor(workers) as pool:
+            if data is not None:
+                jobs = [pool.submit(_reduce_bytes, data[a:b], star, pairs) for a, b in bounds]
+            else:
+                jobs = [pool.submit(_reduce_file_range, path, a, b, star, pairs) for a, b in bounds]
+            summaries = [job.result() for job in jobs]
+    
+    identity = (0, 0, 0, 0) if star else (b"", b"")
+    total = identity
+    for summary in summaries:
+        total = (combine_star_summaries(total, summary) if star
+                 else combine_bracket_summaries(total, summary, pairs))
+        if total is None:
+            return False
+    return _is_valid_summary(total, star)
+
+
+def benchmark_parallel_validation(size=4_000_000, workers=4):
+    """Compare one streaming pass with the process-pool reduction."""
+    import random
+    import time
+    
+    rng = random.Random(7)
+    unit = b'{"k": [1, (2, 3), {"x": [4]}]} '
+    data = unit * (size // len(unit))
+    
+    start = time.perf_counter()
+    sequential = validate_stream([data]).error is None
+    seq_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    parallel = parallel_validate(data, workers=workers)
+    par_time = time.perf_counter() - start
+    
+    stars = bytes(rng.choice(b"(*)") for _ in range(size // 8))
+    start = time.perf_counter()
+    star_result = parallel_validate(stars, workers=workers, star=True)
+    star_time = time.perf_counter() - start
+    
+    print(f"{len(data):,} bytes, {workers} workers on {os.cpu_count()} CPU(s):")
+    print(f"  streaming validator: {seq_time:.3f}s → {sequential}")
+    print(f"  parallel reduction:  {par_time:.3f}s → {parallel}")
+    print(f"  parallel '*' check of {len(stars):,} bytes: {star_time:.3f}s → {star_result}")
+
+# ============================================================================
+# PROBLEM 16: STREAMING MONOTONIC STACK (NEXT GREATER / SPAN OVER STREAMS)
+# ============================================================================
+from array import array
+
+
+class StreamingMonotonicStack:
+    """
+    Problem: daily_temperatures, next_greater_element and the stock span
+    problem each run a monotonic stack over a complete list. Compute the
+    same signals online, tick by tick, without buffering the whole day.
+    
+    Approach: One reusable monotonic stack whose indices and values live in
+    two array.array columns. push(value) pops every stacked element the new
+    value "beats" and returns the answers that just became known:
+    - "next_greater" / "next_smaller": each popped element learns that its
+      answer is the new index → [(index, next_index), ...]
+    - "previous_greater" / "previous_smaller": the new element's answer is
+      whatever is left on top → [(index, previous_index or -1)]
+    - "stock_span": consecutive earlier values <= today, plus today → [(index, span)]
+    
+    With window=k only the last k elements are kept: a next_* element that
+    waits more than k ticks is emitted as (index, -1), and previous_* and
+    span answers only look k elements back (span is capped at k + 1).
+    Memory is then O(k) no matter how long the stream runs.
+    
+    Time Complexity: O(1) amortized per push
+    Space Complexity: O(n), or O(window) when bounded
+    """
+    
+    # mode -> (pop while compare(top, value), answers the popped elements?)
+    MODES = {
+        "next_greater": (operator.lt, True),
+        "next_smaller": (operator.gt, True),
+        "previous_greater": (operator.le, False),
+        "previous_smaller": (operator.ge, False),
+        "stock_span": (operator.le, False),
+    }
+    
+    def __init__(self, mode="next_greater", window=None, typecode='d'):
+        """
+        Args:
+            mode: One of MODES
+            window: Look-ahead / look-back limit in elements (None = unbounded)
+            typecode: array typecode for values ('d' floats, 'q' integers)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {sorted(self.MODES)}")
+        self.mode = mode
+        self.compare, self.resolves_popped = self.MODES[mode]
+        self.window = window
+        self.indices = array('q')
+        self.values = array(typecode)
+        self.base = 0        # Stack bottom; entries before it have expired
+        self.next_index = 0  # Index the next pushed value will get
+    
+    def __len__(self):
+        """Number of elements currently on the stack."""
+        return len(self.indices) - self.base
+    
+    def push(self, value):
+        """
+        Add the next value of the stream.
+        
+        Returns:
+            List of (index, answer) pairs resolved by this value
+        """
+        i = self.next_index
+        self.next_index += 1
+        indices, values, compare = self.indices, self.values, self.compare
+        resolved = []
+        
+        # Expire elements that fell out of the window (always at the bottom)
+        if self.window is not None:
+            oldest_allowed = i - self.window
+            while self.base < len(indices) and indices[self.base] < oldest_allowed:
+                if self.resolves_popped:
+                    resolved.append((indices[self.base], -1))
+                self.base += 1
+            if self.base > 1024 and self.base * 2 > len(indices):
+                # Compact the arrays so memory stays O(window)
+                del indices[:self.base]
+                del values[:self.base]
+                self.base = 0
+        
+        base = self.base
+        while len(indices) > base and compare(values[-1], value):
+            values.pop()
+            popped = indices.pop()
+            if self.resolves_popped:
+                resolved.append((popped, i))
+        
+        if not self.resolves_popped:
+            previous = indices[-1] if len(indices) > base else -1
+            if self.mode == "stock_span":
+                if previous >= 0:
+                    resolved.append((i, i - previous))
+                elif self.window is None:
+                    resolved.append((i, i + 1))
+                else:
+                    resolved.append((i, min(i, self.window) + 1))
+            else:
+                resolved.append((i, previous))
+        
+        indices.append(i)
+        values.append(value)
+        return resolved
+    
+    def push_many(self, values):
+        """Push several values; returns all answers resolved along the way."""
+        resolved = []
+        for value in values:
+            resolved.extend(self.push(value))
+        return resolved
+    
+    def flush(self):
+        """
+        End of stream: next_* elements still waiting get -1.
+        
+        Returns:
+            List of (index, -1) pairs (empty for previous_*/span modes)
+        """
+        remaining = []
+        if self.resolves_popped:
+            remaining = [(index, -1) for index in self.indices[self.base:]]
+        del self.indices[:]
+        del self.values[:]
+        self.base = 0
+        return remaining
+
+
+def daily_temperatures_stream(temperatures):
+    """
+    daily_temperatures on StreamingMonotonicStack: each answer is emitted as
+    soon as the warmer day arrives. Integer readings are stored as 'q',
+    anything else (e.g. float readings) as 'd'.
+    """
+    result = [0] * len(temperatures)
+    typecode = 'q' if all(isinstance(t, int) for t in temperatures) else 'd'
+    stack = StreamingMonotonicStack("next_greater", typecode=typecode)
+    for index, warmer in stack.push_many(temperatures) + stack.flush():
+        if warmer >= 0:
+            result[index] = warmer - index
+    return result
+
+
+def stock_spans(prices, window=None):
+    """
+    Problem: Stock span - for each day, how many consecutive days up to and
+    including today had a price <= today's price.
+    
+    Example: [100,80,60,70,60,75,85] → [1,1,1,2,1,4,6]
+    """
+    stack = StreamingMonotonicStack("stock_span", window=window)
+    return [span for _, span in stack.push_many(prices)]
+
+# ============================================================================
+# PROBLEM 17: COMPACT MIN/MAX STACK (RUN-LENGTH MINIMA, ARRAY STORAGE)
+# ============================================================================
+class MinMaxStack:
+    """
+    Problem: MinStack keeps a second Python list of minimums, and every
+    value is a full Python object. Support O(1) push, pop, top, get_min and
+    get_max with compact storage and batch operations.
+    
+    Approach:
+    - Values live in an array.array (8 bytes each for 'q' or 'd'), or a
+      plain list when typecode is None (for non-numeric values).
+    - Minimums are run-length encoded: min_values[k] is a minimum that has
+      been current for min_counts[k] consecutive stack entries. A new run
+      only starts when a push lowers the minimum, so a stack of n values
+      whose minimum changes r times stores r runs instead of n copies.
+      Maximums are tracked the same way.
+    
+    Time Complexity: O(1) push/pop/top/get_min/get_max,
+                     O(k + runs touched) for push_many/pop_many of k values
+    Space Complexity: O(n) values + O(runs) for minima/maxima
+    """
+    
+    def __init__(self, typecode='q', track_max=True):
+        """
+        Args:
+            typecode: array typecode ('q' integers, 'd' floats) or None for a list
+            track_max: Also support get_max()
+        """
+        make = (lambda: array(typecode)) if typecode else list
+        self.values = make()
+        self.min_values, self.min_counts = make(), array('q')
+        self.track_max = track_max
+        self.max_values, self.max_counts = make(), array('q')
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def empty(self):
+        return not self.values
+    
+    @staticmethod
+    def _pop_runs(run_values, run_counts, k):
+        """Remove k entries from the top of a run-length encoded column."""
+        while k:
+            top = run_counts[-1]
+            if top > k:
+                run_counts[-1] = top - k
+                return
+            k -= top
+            run_counts.pop()
+            run_values.pop()
+    
+    def push(self, val):
+        """Push element onto stack. O(1)"""
+        # Compare first, so a value that can't be compared or stored
+        # raises before any column changes
+        mins, maxs = self.min_values, self.max_values
+        new_min = not mins or val < mins[-1]
+        new_max = self.track_max and (not maxs or val > maxs[-1])
+        self.values.append(val)
+        if new_min:
+            mins.append(val)         # New, lower minimum starts a run
+            self.min_counts.append(1)
+        else:
+            self.min_counts[-1] += 1  # Minimum unchanged, extend its run
+        if self.track_max:
+            if new_max:
+                maxs.append(val)
+                self.max_counts.append(1)
+            else:
+                self.max_counts[-1] += 1
+    
+    def push_many(self, values):
+        """
+        Push several values; the value column is extended in one call.
+        The values are converted and the new min/max runs worked out
+        before anything is stored, so a value that can't be stored or
+        compared (TypeError, OverflowError) leaves the stack unchanged.
+        """
+        if isinstance(self.values, array):
+            values = array(self.values.typecode, values)
+        else:
+            values = list(values)
+        if not values:
+            return
+        
+        # Plan: top-run extension, then the runs this batch starts
+        mins = self.min_values
+        current_min = mins[-1] if mins else None
+        min_extra, new_mins, new_min_counts = 0, [], []
+        for val in values:
+            if current_min is None or val < current_min:
+                current_min = val
+                new_mins.append(val)
+                new_min_counts.append(1)
+            elif new_min_counts:
+                new_min_counts[-1] += 1
+            else:
+                min_extra += 1
+        if self.track_max:
+            maxs = self.max_values
+            current_max = maxs[-1] if maxs else None
+            max_extra, new_maxs, new_max_counts = 0, [], []
+            for val in values:
+                if current_max is None or val > current_max:
+                    current_max = val
+                    new_maxs.append(val)
+                    new_max_counts.append(1)
+                elif new_max_counts:
+                    new_max_counts[-1] += 1
+                else:
+                    max_extra += 1
+        
+        # Commit: nothing below can fail for values that got this far
+        self.values.extend(values)
+        if min_extra:
+            self.min_counts[-1] += min_extra
+        mins.extend(new_mins)
+        self.min_counts.extend(new_min_counts)
+        if self.track_max:
+            if max_extra:
+                self.max_counts[-1] += max_extra
+            maxs.extend(new_maxs)
+            self.max_counts.extend(new_max_counts)
+    
+    def pop(self):
+        """Remove and return top element. O(1)"""
+        if not self.values:
+            raise IndexError("pop from empty stack")
+        counts = self.min_counts
+        if counts[-1] == 1:
+            counts.pop()
+            self.min_values.pop()
+        else:
+            counts[-1] -= 1
+        if self.track_max:
+            counts = self.max_counts
+            if counts[-1] == 1:
+                counts.pop()
+                self.max_values.pop()
+            else:
+                counts[-1] -= 1
+        return self.values.pop()
+    
+    def pop_many(self, k):
+        """Remove and return the top k elements, topmost first."""
+        k = min(k, len(self.values))
+        if k <= 0:
+            return []
+        popped = list(self.values[-k:])
+        popped.reverse()
+        del self.values[-k:]
+        self._pop_runs(self.min_values, self.min_counts, k)
+        if self.track_max:
+            self._pop_runs(self.max_values, self.max_counts, k)
+        return popped
+    
+    def top(self):
+        """Get top element. O(1)"""
+        return self.values[-1] if self.values else None
+    
+    def get_min(self):
+        """Get minimum element. O(1)"""
+        return self.min_values[-1] if self.min_values else None
+    
+    def get_max(self):
+        """Get maximum element. O(1)"""
+        if not self.track_max:
+            raise ValueError("stack was created with track_max=False")
+        return self.max_values[-1] if self.max_values else None
+
+
+def benchmark_min_stacks(n=200000):
+    """
+    Memory and throughput of MinStack vs MinMaxStack on n random ints.
+    Memory is measured with values created on the fly (as from a parser or
+    socket), so a list pays for an int object per value and an array doesn't.
+    """
+    import random
+    import time
+    import tracemalloc
+    
+    rng = random.Random(1)
+    data = [rng.randrange(10**9) for _ in range(n)]
+    
+    def fresh_values():
+        return (val + 10**9 for val in data)  # New int objects each time
+    
+    def push_each(stack, values):
+        for val in values:
+            stack.push(val)
+    
+    def pop_each(stack):
+        for _ in range(n):
+            stack.pop()
+    
+    def measure(label, make, fill, drain):
+        tracemalloc.start()
+        stack = make()
+        fill(stack, fresh_values())
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del stack
+        
+        stack = make()
+        values = list(fresh_values())
+        start = time.perf_counter()
+        fill(stack, values)
+        fill_time = time.perf_counter() - start
+        start = time.perf_counter()
+        drain(stack)
+        drain_time = time.perf_counter() - start
+        print(f"  {label:<28} {memory / n:6.1f} bytes/value  "
+              f"push {n / fill_time / 1e6:5.2f} M/s  pop {n / drain_time / 1e6:5.2f} M/s")
+    
+    print(f"{n:,} random values:")
+    measure("MinStack (lists)", MinStack, push_each, pop_each)
+    measure("MinMaxStack push/pop", MinMaxStack, push_each, pop_each)
+    measure("MinMaxStack min only", lambda: MinMaxStack(track_max=False), push_each, pop_each)
+    measure("MinMaxStack push/pop_many", MinMaxStack,
+            lambda stack, values: stack.push_many(values),
+            lambda stack: [stack.pop_many(1000) for _ in range(n // 1000)])
+
+# ============================================================================
+# PROBLEM 18: TWO-STACK QUEUE WITH BULK TRANSFER
+# ============================================================================
+class TwoStackQueue:
+    """
+    Problem: Production version of MyQueue. MyQueue moves elements from the
+    input stack to the output stack one pop()/append() at a time.
+    
+    Approach: Same two stacks, but the transfer happens in bulk at C speed:
+    when the output stack runs dry, reverse the input list in place and
+    swap it in as the output stack.
+    Every element is still moved exactly once, so each operation is
+    amortized O(1) whatever the interleaving of pushes and pops.
+    
+    Time Complexity: O(1) amortized per operation
+    Space Complexity: O(n)
+    """
+    
+    def __init__(self, items=()):
+        self.input_stack = list(items)  # Newest element at the end
+        self.output_stack = []          # Oldest element at the end
+    
+    def __len__(self):
+        return len(self.input_stack) + len(self.output_stack)
+    
+    def push(self, x):
+        """Add element to back of queue."""
+        self.input_stack.append(x)
+    
+    def extend(self, items):
+        """Add several elements to the back of the queue."""
+        self.input_stack.extend(items)
+    
+    def _transfer(self):
+        """
+        Move all pending input to the (empty) output stack in one bulk step:
+        reversing in place and swapping the lists replaces n pop/append pairs.
+        """
+        incoming = self.input_stack
+        incoming.reverse()
+        self.output_stack = incoming
+        self.input_stack = []
+    
+    def pop(self):
+        """Remove element from front of queue."""
+        if not self.output_stack:
+            if not self.input_stack:
+                raise IndexError("pop from empty queue")
+            self._transfer()
+        return self.output_stack.pop()
+    
+    def peek(self):
+        """Get front element without removing."""
+        if not self.output_stack:
+            if not self.input_stack:
+                raise IndexError("peek from empty queue")
+            self._transfer()
+        return self.output_stack[-1]
+    
+    def empty(self):
+        """Check if queue is empty."""
+        return not self.input_stack and not self.output_stack
+
+
+def benchmark_queues_from_stacks(sizes=(10**4, 10**5, 10**6)):
+    """
+    Per-operation cost of MyQueue and TwoStackQueue under interleavings that
+    force frequent transfers. Flat numbers across sizes show amortized O(1).
+    """
+    import time
+    
+    def fill_then_drain(q, n):
+        for i in range(n):
+            q.push(i)
+        for _ in range(n):
+            q.pop()
+    
+    def sawtooth(q, n):
+        # Push a burst, pop half, repeat: the output stack keeps running dry
+        burst = 64
+        for start in range(0, n, burst):
+            for i in range(burst):
+                q.push(i)
+            for _ in range(burst // 2):
+                q.pop()
+        while not q.empty():
+            q.pop()
+    
+    def alternate(q, n):
+        # push, pop, push, pop...: a transfer before every single pop
+        for i in range(n):
+            q.push(i)
+            q.pop()
+    
+    print(f"{'pattern':<16}{'n':>10}{'MyQueue ns/op':>16}{'TwoStackQueue ns/op':>22}")
+    for name, pattern in [("fill/drain", fill_then_drain), ("sawtooth", sawtooth),
+                          ("alternate", alternate)]:
+        for n in sizes:
+            timings = []
+            for cls in (MyQueue, TwoStackQueue):
+                q = cls()
+                start = time.perf_counter()
+                pattern(q, n)
+                timings.append((time.perf_counter() - start) / (2 * n) * 1e9)
+            print(f"{name:<16}{n:>10}{timings[0]:>16.0f}{timings[1]:>22.0f}")
+
 # ============================================================================
 # TEST FUNCTIONS
 # ============================================================================
@@ -421,6 +1611,25 @@ def test_stack_problems():
     for case in test_cases:
         print(f"'{case}' → {is_valid_parentheses(case)}")
     
+    
+    # Streaming validation: the same checks fed in small chunks
+    payload = b'{"a": [1, {"b": (2, 3)}], "c": [4]}'
+    chunks = [payload[i:i + 5] for i in range(0, len(payload), 5)]
+    print(f"Streaming {len(chunks)} chunks → {validate_stream(chunks).finish()}")
+    broken = validate_stream([b'{"a": [1, 2', b')]}'])
+    print(f"Broken payload → {broken.error}")
+    unclosed = validate_stream([b"([", b"{}"])
+    assert unclosed.error_offset == 4  # Reported at end of input, byte 4
+    print(f"Unclosed payload → {unclosed.error}")
+    smiley = [b'{"msg": ":)", "esc', b'aped": "\\\\\\', b'"]"}']
+    print(f"Brackets in strings counted → {validate_stream(smiley).error}")
+    json_validator = validate_stream(smiley, StreamingBracketValidator(quotes='"'))
+    print(f"JSON strings skipped → {json_validator.finish()}")
+    star = validate_stream(["(*", "*)", ")"], StreamingStarValidator())
+    print(f"Star stream '(**))' → {star.error is None}")
+    print(f"Parallel reduction → {parallel_validate(payload, workers=1, chunk_size=4)}")
+    benchmark_parallel_validation()
+    
     # Test 2: Evaluate RPN
     print("\n2. EVALUATE RPN")
     rpn_tokens = ["2", "1", "+", "3", "*"]
@@ -431,6 +1640,13 @@ def test_stack_problems():
     temps = [73, 74, 75, 71, 69, 72, 76, 73]
     print(f"Temperatures: {temps}")
     print(f"Days to wait: {daily_temperatures(temps)}")
+    print(f"Days to wait (streaming): {daily_temperatures_stream(temps)}")
+    ticks = StreamingMonotonicStack("next_greater", window=3)
+    for t in temps:
+        for index, answer in ticks.push(t):
+            print(f"  tick {index} ({temps[index]}) → next higher at {answer}")
+    prices = [100, 80, 60, 70, 60, 75, 85]
+    print(f"Stock spans of {prices}: {stock_spans(prices)}")
     
     # Test 4: Largest Rectangle
     print("\n4. LARGEST RECTANGLE IN HISTOGRAM")
@@ -457,6 +1673,25 @@ def test_stack_problems():
         elif op == "getMin":
             print(f"Min: {min_stack.get_min()}")
     
+    compact = MinMaxStack()
+    compact.push_many([5, 2, 8, 1, 9])
+    print(f"MinMaxStack {list(compact.values)}: min={compact.get_min()}, max={compact.get_max()}, "
+          f"min runs={list(compact.min_values)}")
+    print(f"pop_many(2) → {compact.pop_many(2)}, min={compact.get_min()}, max={compact.get_max()}")
+    try:
+        compact.push_many([0, 2**70])
+    except OverflowError:
+        print(f"push_many([0, 2**70]) → OverflowError, stack kept: {list(compact.values)}, "
+              f"min={compact.get_min()}")
+    benchmark_min_stacks()
+    
+    # Queue from stacks
+    print("\nQUEUE USING STACKS")
+    two_stack = TwoStackQueue([1, 2])
+    two_stack.push(3)
+    print(f"Pop: {two_stack.pop()}, Peek: {two_stack.peek()}, Size: {len(two_stack)}")
+    benchmark_queues_from_stacks(sizes=(10**4, 10**5))
+    
     # Test 6: Next Greater Element
     print("\n6. NEXT GREATER ELEMENT")
     nums1 = [4, 1, 2]
@@ -475,6 +1710,17 @@ def test_stack_problems():
     encoded = ["3[a]2[bc]", "3[a2[c]]", "2[abc]3[cd]ef"]
     for s in encoded:
         print(f"'{s}' → '{decode_string(s)}'")
+    
+    # Test 9: Basic Calculator / Compiled Expressions
+    print("\n9. BASIC CALCULATOR & COMPILED EXPRESSIONS")
+    expression = "(1+(4+5+2)-3)+(6+8)"
+    print(f"calculate('{expression}') → {calculate(expression)}")
+    print(f"compiled → {evaluate_expression(expression)}")
+    rule = compile_expression("x * (y + 2) - -z / 2")
+    print(f"RPN of '{rule.source}': {rule.rpn}")
+    print(f"With x=3, y=4, z=7 → {rule.evaluate(x=3, y=4, z=7)}")
+    print(f"evaluate_many, one run per binding: {rule.evaluate_many([{'x': 1, 'y': 1, 'z': 1}, {'x': 2, 'y': 0, 'z': -4}])}")
+    benchmark_compiled_expressions()
 
 if __name__ == "__main__":
     test_stack_problems()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+STANDARD LIBRARY QUEUE ACCESS
+=============================
+basics/queue.py has the same name as the standard library's queue module.
+Scripts run from this folder have it first on sys.path, so `import queue`
+(ours, or the one inside concurrent.futures and multiprocessing) finds
+basics/queue.py instead of the stdlib version.
+
+- load_stdlib_queue(): the stdlib module, loaded straight from its file.
+- import_concurrent_futures(): concurrent.futures with its executors bound
+  to the stdlib queue.
+
+Neither touches sys.path, and whatever `queue` module the caller has
+imported stays in sys.modules.
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+
+_stdlib_queue = None
+
+
+def load_stdlib_queue():
+    """Return the standard library queue module (loaded once, then cached)."""
+    global _stdlib_queue
+    if _stdlib_queue is None:
+        # queue.py sits next to threading.py in the stdlib directory
+        path = os.path.join(os.path.dirname(threading.__file__), "queue.py")
+        spec = importlib.util.spec_from_file_location("queue", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _stdlib_queue = module
+    return _stdlib_queue
+
+
+def import_concurrent_futures():
+    """
+    Import concurrent.futures (thread and process executors included) so
+    that their `import queue` binds the stdlib module.
+
+    The stdlib queue is visible under sys.modules["queue"] only while those
+    modules are imported; the caller's entry (or its absence) is restored
+    afterwards. Executor modules imported earlier are left as they are.
+    """
+    previous = sys.modules.get("queue")
+    sys.modules["queue"] = load_stdlib_queue()
+    try:
+        import concurrent.futures
+        import concurrent.futures.process
+        import concurrent.futures.thread  # noqa: F401
+    finally:
+        if previous is None:
+            del sys.modules["queue"]
+        else:
+            sys.modules["queue"] = previous
+    return concurrent.futures
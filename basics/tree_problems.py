@@ -31,7 +31,8 @@ def preorder_nary(root):
     """
     Problem: Preorder traversal of N-ary tree.
     
-    Approach: Recursive DFS
+    Approach: DFS keeping one child iterator per open node on a stack
+    (the iterative version below pushes the children themselves)
     Time Complexity: O(n)
     Space Complexity: O(h)
     
@@ -41,8 +42,17 @@ def preorder_nary(root):
         return []
     
     result = [root.val]
-    for child in root.children:
-        result.extend(preorder_nary(child))
+    stack = [iter(root.children)]
+    
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            # All children of this node are done
+            stack.pop()
+            continue
+        
+        result.append(child.val)
+        stack.append(iter(child.children))
     
     return result
 
@@ -69,15 +79,23 @@ def postorder_nary(root):
     Problem: Postorder traversal of N-ary tree.
     Visit children first, then root.
     """
-    if not root:
-        return []
+    return [node.val for node in _postorder_nodes_nary(root)]
+
+def _postorder_nodes_nary(root):
+    """
+    Nodes in postorder without recursion: visiting each node before its
+    children, last child first, gives exactly the reverse order.
+    """
+    order = []
+    stack = [root] if root else []
     
-    result = []
-    for child in root.children:
-        result.extend(postorder_nary(child))
-    result.append(root.val)
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(node.children)
     
-    return result
+    order.reverse()
+    return order
 
 def level_order_nary(root):
     """
@@ -115,17 +133,21 @@ def max_depth_nary(root):
     """
     Problem: Find maximum depth of N-ary tree.
     
-    Approach: Recursive DFS
+    Approach: DFS with an explicit stack of (node, depth)
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
-    if not root:
-        return 0
+    max_depth = 0
+    stack = [(root, 1)] if root else []
     
-    if not root.children:
-        return 1
+    while stack:
+        node, depth = stack.pop()
+        max_depth = max(max_depth, depth)
+        
+        for child in node.children:
+            stack.append((child, depth + 1))
     
-    return 1 + max(max_depth_nary(child) for child in root.children)
+    return max_depth
 
 def max_depth_nary_iterative(root):
     """Iterative approach using level order traversal."""
@@ -194,13 +216,6 @@ class Trie:
     
     def get_all_words_with_prefix(self, prefix):
         """Get all words that start with given prefix."""
-        def dfs(node, current_word):
-            if node.is_end_of_word:
-                words.append(current_word)
-            
-            for char, child_node in node.children.items():
-                dfs(child_node, current_word + char)
-        
         # Find prefix node
         node = self.root
         for char in prefix:
@@ -208,9 +223,17 @@ class Trie:
                 return []
             node = node.children[char]
         
-        # Collect all words from prefix node
+        # Collect all words from prefix node (DFS, children in insertion order)
         words = []
-        dfs(node, prefix)
+        stack = [(node, prefix)]
+        while stack:
+            node, current_word = stack.pop()
+            if node.is_end_of_word:
+                words.append(current_word)
+            
+            for char, child_node in reversed(node.children.items()):
+                stack.append((child_node, current_word + char))
+        
         return words
 
 # ============================================================================
@@ -275,33 +298,25 @@ def lowest_common_ancestor_nary(root, nodes):
     """
     Problem: Find LCA of multiple nodes in N-ary tree.
     
-    Approach: DFS with node tracking
+    Approach: Count target nodes per subtree bottom-up (postorder); the
+    first node whose subtree holds all of them is the deepest such node
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
-    def dfs(node):
-        if not node:
-            return 0, None
-        
+    found_count = {}
+    
+    for node in _postorder_nodes_nary(root):
         # Count how many target nodes found in current subtree
-        found_count = 1 if node in nodes else 0
-        
-        for child in node.children:
-            child_count, child_lca = dfs(child)
-            found_count += child_count
-            
-            # If child subtree contains all nodes, return its LCA
-            if child_lca:
-                return found_count, child_lca
+        count = 1 if node in nodes else 0
+        count += sum(found_count[child] for child in node.children)
         
         # If current node's subtree contains all target nodes
-        if found_count == len(nodes):
-            return found_count, node
+        if count == len(nodes):
+            return node
         
-        return found_count, None
+        found_count[node] = count
     
-    _, lca = dfs(root)
-    return lca
+    return None
 
 # ============================================================================
 # PROBLEM 6: DIAMETER OF N-ARY TREE
@@ -310,40 +325,25 @@ def diameter_nary(root):
     """
     Problem: Find diameter of N-ary tree (longest path between any two nodes).
     
-    Approach: For each node, find two longest paths and combine
+    Approach: For each node, find two longest paths and combine; depths
+    are computed bottom-up over a postorder node list
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
     max_diameter = 0
+    depth = {}
     
-    def dfs(node):
-        nonlocal max_diameter
-        
-        if not node:
-            return 0
-        
-        # Get depths of all children
-        depths = []
-        for child in node.children:
-            depths.append(dfs(child))
-        
-        # Sort to get two largest depths
-        depths.sort(reverse=True)
+    for node in _postorder_nodes_nary(root):
+        # Get depths of all children, two largest first
+        depths = sorted((depth[child] for child in node.children), reverse=True)
         
         # Diameter through current node
-        if len(depths) >= 2:
-            current_diameter = depths[0] + depths[1]
-        elif len(depths) == 1:
-            current_diameter = depths[0]
-        else:
-            current_diameter = 0
-        
+        current_diameter = sum(depths[:2])
         max_diameter = max(max_diameter, current_diameter)
         
-        # Return depth of current subtree
-        return 1 + (depths[0] if depths else 0)
+        # Depth of current subtree
+        depth[node] = 1 + (depths[0] if depths else 0)
     
-    dfs(root)
     return max_diameter
 
 # ============================================================================
@@ -359,45 +359,56 @@ def serialize_nary(root):
     if not root:
         return ""
     
-    def preorder(node):
-        if not node:
-            return
+    vals = []
+    stack = [root]
+    
+    while stack:
+        node = stack.pop()
         
         # Add node value and children count
         vals.append(str(node.val))
         vals.append(str(len(node.children)))
         
-        # Add all children
-        for child in node.children:
-            preorder(child)
+        # Add all children, leftmost popped first
+        stack.extend(reversed(node.children))
     
-    vals = []
-    preorder(root)
     return ",".join(vals)
 
 def deserialize_nary(data):
-    """Deserialize string back to N-ary tree."""
+    """
+    Deserialize string back to N-ary tree.
+    The stack holds [node, children still to read] for the open nodes;
+    truncated input yields the part of the tree read so far.
+    """
     if not data:
         return None
     
     vals = iter(data.split(","))
     
-    def build():
+    try:
+        root = TreeNode(int(next(vals)))
+        stack = [[root, int(next(vals))]]
+    except StopIteration:
+        return None
+    
+    while stack:
+        entry = stack[-1]
+        if entry[1] == 0:
+            stack.pop()
+            continue
+        entry[1] -= 1
+        
         try:
             val = int(next(vals))
             children_count = int(next(vals))
-            
-            node = TreeNode(val)
-            for _ in range(children_count):
-                child = build()
-                if child:
-                    node.children.append(child)
-            
-            return node
         except StopIteration:
-            return None
+            break
+        
+        child = TreeNode(val)
+        entry[0].children.append(child)
+        stack.append([child, children_count])
     
-    return build()
+    return root
 
 # ============================================================================
 # PROBLEM 8: CLONE N-ARY TREE
@@ -406,22 +417,27 @@ def clone_tree(root):
     """
     Problem: Deep clone N-ary tree.
     
-    Approach: DFS with node creation
+    Approach: DFS over (original, clone) pairs, creating child clones as
+    each original node is popped
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
     if not root:
         return None
     
-    # Create new node
-    cloned = TreeNode(root.val)
+    # Create new root
+    cloned_root = TreeNode(root.val)
+    stack = [(root, cloned_root)]
     
     # Clone all children
-    for child in root.children:
-        cloned_child = clone_tree(child)
-        cloned.children.append(cloned_child)
+    while stack:
+        original, cloned = stack.pop()
+        for child in original.children:
+            cloned_child = TreeNode(child.val)
+            cloned.children.append(cloned_child)
+            stack.append((child, cloned_child))
     
-    return cloned
+    return cloned_root
 
 # ============================================================================
 # PROBLEM 9: FIND DUPLICATE SUBTREES
@@ -430,27 +446,25 @@ def find_duplicate_subtrees_nary(root):
     """
     Problem: Find all duplicate subtrees in N-ary tree.
     
-    Approach: Serialize each subtree and count occurrences
+    Approach: Serialize each subtree (children before parents, so a
+    parent's string is built from its children's) and count occurrences
     Time Complexity: O(n²)
     Space Complexity: O(n²)
     """
-    def serialize(node):
-        if not node:
-            return "null"
-        
+    count = defaultdict(int)
+    duplicates = []
+    serial = {}
+    
+    for node in _postorder_nodes_nary(root):
         # Serialize current subtree
-        subtree = str(node.val) + "(" + ",".join(serialize(child) for child in node.children) + ")"
+        subtree = str(node.val) + "(" + ",".join(serial[child] for child in node.children) + ")"
+        serial[node] = subtree
         
         # Count occurrences
         count[subtree] += 1
         if count[subtree] == 2:  # First time seeing duplicate
             duplicates.append(node)
-        
-        return subtree
     
-    count = defaultdict(int)
-    duplicates = []
-    serialize(root)
     return duplicates
 
 # ============================================================================
@@ -460,26 +474,29 @@ def are_isomorphic(root1, root2):
     """
     Problem: Check if two trees are isomorphic (same structure).
     
-    Approach: Compare structures recursively
+    Approach: Compare structures pairwise using a stack of node pairs
     Time Complexity: O(min(n1, n2))
-    Space Complexity: O(h)
+    Space Complexity: O(min(n1, n2))
     """
-    # Both empty
-    if not root1 and not root2:
-        return True
+    stack = [(root1, root2)]
     
-    # One empty, other not
-    if not root1 or not root2:
-        return False
-    
-    # Different number of children
-    if len(root1.children) != len(root2.children):
-        return False
-    
-    # Check all children (order matters for isomorphism)
-    for child1, child2 in zip(root1.children, root2.children):
-        if not are_isomorphic(child1, child2):
+    while stack:
+        root1, root2 = stack.pop()
+        
+        # Both empty
+        if not root1 and not root2:
+            continue
+        
+        # One empty, other not
+        if not root1 or not root2:
+            return False
+        
+        # Different number of children
+        if len(root1.children) != len(root2.children):
             return False
+        
+        # Check all children (order matters for isomorphism)
+        stack.extend(zip(root1.children, root2.children))
     
     return True
 
@@ -524,47 +541,59 @@ def has_path_sum_nary(root, target_sum):
     """
     Problem: Check if there's a root-to-leaf path with given sum.
     
-    Approach: DFS with sum tracking
+    Approach: DFS with sum tracking; each stack entry carries the sum
+    still needed below its node
     Time Complexity: O(n)
-    Space Complexity: O(h)
+    Space Complexity: O(n)
     """
-    if not root:
-        return False
-    
-    # If leaf node, check if sum matches
-    if not root.children:
-        return root.val == target_sum
+    stack = [(root, target_sum)] if root else []
     
-    # Check all children with reduced sum
-    remaining_sum = target_sum - root.val
-    for child in root.children:
-        if has_path_sum_nary(child, remaining_sum):
-            return True
+    while stack:
+        node, remaining_sum = stack.pop()
+        
+        # If leaf node, check if sum matches
+        if not node.children:
+            if node.val == remaining_sum:
+                return True
+            continue
+        
+        # Check all children with reduced sum
+        for child in node.children:
+            stack.append((child, remaining_sum - node.val))
     
     return False
 
 def path_sum_all_paths(root, target_sum):
-    """Find all root-to-leaf paths with given sum."""
-    def dfs(node, current_sum, current_path):
-        if not node:
-            return
+    """
+    Find all root-to-leaf paths with given sum.
+    Each node is pushed twice: once to extend the shared path, once
+    (below its children) to backtrack.
+    """
+    paths = []
+    current_path = []
+    current_sum = 0
+    stack = [(root, False)] if root else []
+    
+    while stack:
+        node, leaving = stack.pop()
+        
+        # Backtrack
+        if leaving:
+            current_path.pop()
+            current_sum -= node.val
+            continue
         
         current_path.append(node.val)
         current_sum += node.val
+        stack.append((node, True))
         
         # If leaf node and sum matches
         if not node.children and current_sum == target_sum:
             paths.append(current_path[:])
         
-        # Continue with children
-        for child in node.children:
-            dfs(child, current_sum, current_path)
-        
-        # Backtrack
-        current_path.pop()
+        # Continue with children, leftmost first
+        stack.extend((child, False) for child in reversed(node.children))
     
-    paths = []
-    dfs(root, 0, [])
     return paths
 
 # ============================================================================
@@ -637,6 +666,18 @@ def test_tree_problems():
     target = 20
     print(f"Has path sum {target}: {has_path_sum_nary(simple_root, target)}")
     print(f"All paths with sum {target}: {path_sum_all_paths(simple_root, target)}")
+    
+    # Test 8: Chain deeper than the recursion limit
+    print("\n8. DEGENERATE (CHAIN) N-ARY TREE")
+    deep = TreeNode(1)
+    node = deep
+    for _ in range(10**5 - 1):
+        node.children.append(TreeNode(1))
+        node = node.children[0]
+    print(f"Max depth: {max_depth_nary(deep)}, diameter: {diameter_nary(deep)}")
+    print(f"Has path sum {10**5}: {has_path_sum_nary(deep, 10**5)}")
+    print(f"Clone round-trips through serialize: "
+          f"{serialize_nary(deserialize_nary(serialize_nary(clone_tree(deep)))) == serialize_nary(deep)}")
 
 if __name__ == "__main__":
     test_tree_problems()
\ No newline at end of file
@@ -13,6 +13,7 @@ How it works:
 - Repeat for all remaining elements
 """
 
+
 def insertion_sort(arr):
     """
     Sorts an array using insertion sort algorithm.
@@ -80,37 +81,55 @@ def insertion_sort_with_steps(arr):
 
 def insertion_sort_recursive(arr, n=None):
     """
-    Recursive implementation of insertion sort.
+    Recursive implementation of insertion sort, unrolled into a loop.
+    
+    sort(n) = sort(n - 1), then insert arr[n - 1]. The recursion bottoms
+    out at n <= 1, so the calls complete in order k = 2, 3, ..., n; the
+    loop runs those insertion steps directly and needs no call stack.
     
     Args:
         arr: List to sort
-        n: Number of elements to sort (used for recursion)
+        n: Number of elements to sort (defaults to the whole list)
     """
-    # Base case: if array has 1 or 0 elements, it's already sorted
     if n is None:
         n = len(arr)
     
-    if n <= 1:
-        return arr
-    
-    # Recursively sort first n-1 elements
-    insertion_sort_recursive(arr, n - 1)
-    
-    # Insert the nth element at its correct position
-    last = arr[n - 1]
-    j = n - 2
-    
-    # Move elements that are greater than last one position ahead
-    while j >= 0 and arr[j] > last:
-        arr[j + 1] = arr[j]
-        j -= 1
-    
-    # Place last element at its correct position
-    arr[j + 1] = last
+    # Each step k inserts the kth element into the sorted first k-1
+    for k in range(2, n + 1):
+        last = arr[k - 1]
+        j = k - 2
+        
+        # Move elements that are greater than last one position ahead
+        while j >= 0 and arr[j] > last:
+            arr[j + 1] = arr[j]
+            j -= 1
+        
+        # Place last element at its correct position
+        arr[j + 1] = last
     
     return arr
 
 
+def benchmark_recursive_vs_iterative(sizes=(400, 2000, 10**6)):
+    """
+    Time insertion_sort against insertion_sort_recursive on already-sorted
+    input (the O(n) best case, so 10**6 elements stays fast). The recursive
+    version used to raise RecursionError near 1000 elements.
+    """
+    import time
+    
+    print(f"{'n':>9}{'iterative ms':>14}{'recursive ms':>14}")
+    for n in sizes:
+        timings = []
+        for sort in (insertion_sort, insertion_sort_recursive):
+            data = list(range(n))
+            start = time.perf_counter()
+            result = sort(data)
+            timings.append((time.perf_counter() - start) * 1e3)
+            assert result == sorted(result)
+        print(f"{n:>9}{timings[0]:>14.2f}{timings[1]:>14.2f}")
+
+
 # Test the insertion sort functions
 if __name__ == "__main__":
     # Test 1: Basic insertion sort
@@ -140,4 +159,11 @@ if __name__ == "__main__":
     test_arr5 = [64, 34, 25, 12, 22, 11, 90]
     print("\n=== RECURSIVE INSERTION SORT ===")
     print("Original array:", test_arr5)
-    print("Sorted array:", insertion_sort_recursive(test_arr5.copy()))
\ No newline at end of file
+    print("Sorted array:", insertion_sort_recursive(test_arr5.copy()))
+    
+    # Test 6: Large inputs no longer overflow the call stack
+    print("\n=== RECURSIVE VS ITERATIVE (SORTED INPUT) ===")
+    reversed_arr = list(range(3000, 0, -1))
+    print("3000 reversed elements sorted recursively:",
+          insertion_sort_recursive(reversed_arr) == sorted(reversed_arr))
+    benchmark_recursive_vs_iterative()
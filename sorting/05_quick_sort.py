@@ -9,8 +9,12 @@ How it works:
 - Choose a 'pivot' element from the array
 - Partition: rearrange array so elements smaller than pivot come before it,
   and elements greater come after it
-- Recursively apply quick sort to sub-arrays on both sides of pivot
+- Repeat on the sub-arrays on both sides of pivot
 - Uses "divide and conquer" strategy
+
+The sub-arrays still waiting to be sorted are kept on an explicit stack
+rather than in recursive calls, so deep partitions (e.g. many equal keys
+or unlucky pivots) cannot hit Python's recursion limit.
 """
 
 def quick_sort(arr):
@@ -22,25 +26,39 @@ def quick_sort(arr):
     Returns:
         Sorted list in ascending order
     """
-    # Base case: arrays with 0 or 1 element are already sorted
-    if len(arr) <= 1:
-        return arr
-    
     # Choose pivot (we'll use the middle element)
-    pivot = arr[len(arr) // 2]
-    
-    # Partition the array into three parts:
-    # 1. Elements less than pivot
-    left = [x for x in arr if x < pivot]
+    return _three_way_quick_sort(arr, lambda part: part[len(part) // 2])
+
+
+def _three_way_quick_sort(arr, choose_pivot):
+    """
+    Out-of-place quick sort driven by an explicit stack.
     
-    # 2. Elements equal to pivot
-    middle = [x for x in arr if x == pivot]
+    Each stack item is (done, part). A part that still needs sorting is
+    split into less / equal / greater lists, pushed in reverse order so
+    the smaller values are popped first; finished parts (the elements
+    equal to a pivot, or parts of 0 or 1 element) go straight to the
+    output. Parts therefore reach the output left to right.
+    """
+    result = []
+    stack = [(False, arr)]
     
-    # 3. Elements greater than pivot
-    right = [x for x in arr if x > pivot]
+    while stack:
+        done, part = stack.pop()
+        
+        # Base case: equal runs and arrays with 0 or 1 element are sorted
+        if done or len(part) <= 1:
+            result.extend(part)
+            continue
+        
+        pivot = choose_pivot(part)
+        
+        # Partition into three parts: less than, equal to, greater than pivot
+        stack.append((False, [x for x in part if x > pivot]))
+        stack.append((True, [x for x in part if x == pivot]))
+        stack.append((False, [x for x in part if x < pivot]))
     
-    # Recursively sort left and right parts, then combine
-    return quick_sort(left) + middle + quick_sort(right)
+    return result
 
 
 def quick_sort_in_place(arr, low=0, high=None):
@@ -56,16 +74,60 @@ def quick_sort_in_place(arr, low=0, high=None):
     if high is None:
         high = len(arr) - 1
     
-    # Only proceed if there are at least 2 elements to sort
-    if low < high:
+    # Ranges still to be sorted (replaces the recursive calls)
+    stack = [(low, high)]
+    
+    while stack:
+        low, high = stack.pop()
+        
+        # Only proceed if there are at least 2 elements to sort
+        if low >= high:
+            continue
+        
+        # Middle element as pivot, so sorted and reversed input split evenly
+        pivot = arr[(low + high) // 2]
         
-        # Partition the array and get the pivot index
-        # After partitioning, pivot is in its correct final position
-        pivot_index = partition(arr, low, high)
+        # Three-way partition: every element equal to the pivot lands in
+        # arr[lt..gt], already in its final position. Many equal keys
+        # therefore shrink the ranges instead of making them lopsided
+        lt, gt = three_way_partition(arr, low, high, pivot)
         
-        # Recursively sort elements before and after partition
-        quick_sort_in_place(arr, low, pivot_index - 1)    # Sort left side
-        quick_sort_in_place(arr, pivot_index + 1, high)   # Sort right side
+        # Sort elements before and after partition, smaller side first
+        # so at most O(log n) ranges wait on the stack
+        left, right = (low, lt - 1), (gt + 1, high)
+        if left[1] - left[0] > right[1] - right[0]:
+            left, right = right, left
+        stack.append(right)
+        stack.append(left)
+
+
+def three_way_partition(arr, low, high, pivot):
+    """
+    Dutch national flag partition of arr[low..high] around pivot.
+    Afterwards arr[low..lt-1] < pivot, arr[lt..gt] == pivot and
+    arr[gt+1..high] > pivot. One pass, O(1) extra space.
+    
+    Args:
+        arr: Array to partition
+        low: Starting index
+        high: Ending index
+        pivot: Value to partition around (must occur in the range)
+    Returns:
+        (lt, gt), the bounds of the block equal to pivot
+    """
+    lt, i, gt = low, low, high
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            arr[gt], arr[i] = value, arr[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
 
 
 def partition(arr, low, high):
@@ -73,6 +135,11 @@ def partition(arr, low, high):
     Partitions the array around a pivot element.
     Uses Lomuto partition scheme.
     
+    Equal keys all go to the left side, so on input with many duplicates
+    the split is lopsided and quick sort built on it degrades to O(n²)
+    (all-equal input is the worst case). quick_sort_in_place uses
+    three_way_partition instead.
+    
     Args:
         arr: Array to partition
         low: Starting index
@@ -114,13 +181,7 @@ def quick_sort_hoare_partition(arr, low=0, high=None):
     if high is None:
         high = len(arr) - 1
     
-    if low < high:
-        # Partition the array using Hoare scheme
-        pivot_index = hoare_partition(arr, low, high)
-        
-        # Recursively sort both parts
-        quick_sort_hoare_partition(arr, low, pivot_index)
-        quick_sort_hoare_partition(arr, pivot_index + 1, high)
+    _hoare_sort_range(arr, low, high)
 
 
 def hoare_partition(arr, low, high):
@@ -154,6 +215,82 @@ def hoare_partition(arr, low, high):
         arr[i], arr[j] = arr[j], arr[i]
 
 
+def quick_sort_iterative(arr):
+    """
+    In-place Hoare quick sort of the whole array, returning it.
+    
+    Args:
+        arr: Array to sort (modified in place)
+    Returns:
+        The sorted array
+    """
+    _hoare_sort_range(arr, 0, len(arr) - 1)
+    return arr
+
+
+def _hoare_sort_range(arr, low, high):
+    """
+    Sort arr[low..high] in place using an explicit stack of (low, high)
+    ranges instead of recursion.
+    
+    The middle element is swapped to the front and used as the Hoare
+    pivot, so sorted and reversed inputs split evenly and runs of equal
+    values don't degrade. The larger part is pushed first and the smaller
+    part is processed next, keeping the stack at O(log n) ranges.
+    """
+    stack = [(low, high)]
+    
+    while stack:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        
+        mid = (low + high) // 2
+        arr[low], arr[mid] = arr[mid], arr[low]
+        split = hoare_partition(arr, low, high)
+        
+        # Push the larger range first so the smaller one is popped next
+        if split - low > high - split - 1:
+            stack.append((low, split))
+            stack.append((split + 1, high))
+        else:
+            stack.append((split + 1, high))
+            stack.append((low, split))
+
+
+def benchmark_quick_sorts(n=10**6):
+    """
+    Time the quick sort variants on random and on already sorted data of
+    size n, and on n copies of one key. None of them recurses, so
+    presorted input of any size neither hits the recursion limit nor
+    degrades to O(n²); duplicates are handled by three-way partitioning
+    (quick_sort, in_place) or by Hoare's scheme stopping on equal keys.
+    """
+    import random
+    import sys
+    import time
+    
+    def run(sort, data):
+        start = time.perf_counter()
+        result = sort(data)
+        if result is None:
+            result = data
+        assert all(result[i] <= result[i + 1] for i in range(len(result) - 1))
+        return f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+    
+    sorts = [("quick_sort", quick_sort),
+             ("in_place", quick_sort_in_place),
+             ("iterative", quick_sort_iterative)]
+    rng = random.Random(0)
+    random_data = [rng.randrange(n) for _ in range(n)]
+    print(f"Recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'input':<16}" + "".join(f"{name:>14}" for name, _ in sorts))
+    for label, data in ((f"random {n}", random_data),
+                        (f"sorted {n}", list(range(n))),
+                        (f"all equal {n}", [7] * n)):
+        print(f"{label:<16}" + "".join(f"{run(sort, data.copy()):>14}" for _, sort in sorts))
+
+
 def quick_sort_with_steps(arr, depth=0):
     """
     Quick sort with step-by-step visualization.
@@ -191,18 +328,8 @@ def quick_sort_random_pivot(arr):
     """
     import random
     
-    if len(arr) <= 1:
-        return arr
-    
     # Choose random pivot
-    pivot_index = random.randint(0, len(arr) - 1)
-    pivot = arr[pivot_index]
-    
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    
-    return quick_sort_random_pivot(left) + middle + quick_sort_random_pivot(right)
+    return _three_way_quick_sort(arr, random.choice)
 
 
 # Test the quick sort functions
@@ -242,4 +369,14 @@ if __name__ == "__main__":
     # Test 6: Step-by-step demonstration
     test_arr6 = [6, 3, 8, 5, 2, 7, 1, 4]
     print("\n=== STEP-BY-STEP DEMONSTRATION ===")
-    quick_sort_with_steps(test_arr6)
\ No newline at end of file
+    quick_sort_with_steps(test_arr6)
+    
+    # Test 7: Iterative (stack-safe) quick sort
+    test_arr7 = [9, 1, 8, 2, 7, 3, 7, 3]
+    print("\n=== ITERATIVE QUICK SORT ===")
+    print("Original array:", test_arr7)
+    print("Sorted array:", quick_sort_iterative(test_arr7))
+    
+    # Test 8: Timing on random and presorted input
+    print("\n=== BENCHMARK ===")
+    benchmark_quick_sorts()